@@ -0,0 +1,148 @@
+"""벤치마크 공통 유틸리티
+
+BPF 벤치마크는 root 권한과 BCC가 필요합니다.
+이벤트는 `jcode-` 접두어 호스트네임을 가진 UTS 네임스페이스 안에서 생성해야
+커널 프로그램의 호스트네임 검사를 통과합니다.
+
+실행 예시:
+    sudo python3 -m benchmarks.bench_transport
+"""
+
+import asyncio
+import contextlib
+import resource
+import shlex
+import struct
+import subprocess
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+from src.config.settings import settings
+
+BENCH_HOSTNAME = "jcode-bench-1-000000000-bench"
+
+# 모든 exec를 하나의 호스트네임에서 실행하므로 빈도 제한이 켜져 있으면
+# 파이프라인 대신 제한(버스트 + 초당 허용 수)을 측정하게 됨
+settings.exec_rate_limit = 0
+
+
+@dataclass
+class Sample:
+    """벤치마크 측정 결과"""
+    name: str
+    events: int
+    elapsed: float      # 초
+    cpu: float          # 수집 프로세스 CPU 시간 (user + sys, 초)
+
+    @property
+    def events_per_sec(self) -> float:
+        return self.events / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def cpu_us_per_event(self) -> float:
+        return self.cpu * 1e6 / self.events if self.events else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name:<24} events={self.events:<8} "
+            f"events/s={self.events_per_sec:>10.1f} "
+            f"cpu/event={self.cpu_us_per_event:>8.2f}us"
+        )
+
+
+def cpu_seconds() -> float:
+    """현재 프로세스의 누적 CPU 시간 (user + sys)"""
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def exec_storm(count: int, argv: Sequence[str] = ("/bin/true",),
+               hostname: str = BENCH_HOSTNAME) -> None:
+    """지정한 호스트네임의 UTS 네임스페이스에서 count번 exec 실행"""
+    command = " ".join(shlex.quote(arg) for arg in argv)
+    script = (
+        f"hostname {shlex.quote(hostname)}; i=0; "
+        f"while [ $i -lt {count} ]; do {command}; i=$((i+1)); done"
+    )
+    subprocess.run(["unshare", "--uts", "sh", "-c", script], check=True)
+
+
+async def drain(queue: asyncio.Queue, expected: int, timeout: float = 10.0) -> int:
+    """큐에서 expected개 이벤트를 꺼내거나 timeout까지 대기 후 받은 개수 반환"""
+    received = 0
+    deadline = time.monotonic() + timeout
+    while received < expected:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            await asyncio.wait_for(queue.get(), remaining)
+        except asyncio.TimeoutError:
+            break
+        received += 1
+    return received
+
+
+BPF_STATS_SYSCTL = "/proc/sys/kernel/bpf_stats_enabled"
+
+
+@contextlib.contextmanager
+def bpf_stats_enabled():
+    """BPF 프로그램 실행 시간 집계(kernel.bpf_stats_enabled)를 잠시 켬"""
+    with open(BPF_STATS_SYSCTL) as f:
+        previous = f.read().strip()
+    with open(BPF_STATS_SYSCTL, "w") as f:
+        f.write("1")
+    try:
+        yield
+    finally:
+        with open(BPF_STATS_SYSCTL, "w") as f:
+            f.write(previous)
+
+
+def prog_stats(fd: int) -> Tuple[int, int]:
+    """BPF 프로그램 fd의 (run_time_ns, run_cnt)"""
+    values = {}
+    with open(f"/proc/self/fdinfo/{fd}") as f:
+        for line in f:
+            key, _, value = line.partition(":")
+            values[key.strip()] = value.strip()
+    return int(values.get("run_time_ns", 0)), int(values.get("run_cnt", 0))
+
+
+def total_prog_stats(bpf) -> Dict[str, Tuple[int, int]]:
+    """로드된 모든 BPF 프로그램의 (run_time_ns, run_cnt)"""
+    return {name: prog_stats(func.fd) for name, func in bpf.funcs.items()}
+
+
+def print_samples(title: str, samples: Sequence[Sample]) -> None:
+    print(f"== {title} ==")
+    for sample in samples:
+        print(sample)
+
+
+# 기록 파일 형식: (u32 길이 + 레코드 바이트) 반복
+_RECORD_LEN = struct.Struct("<I")
+
+
+def save_records(path: str, records: Sequence[bytes]) -> None:
+    """수집한 원시 레코드를 파일로 저장"""
+    with open(path, "wb") as f:
+        for record in records:
+            f.write(_RECORD_LEN.pack(len(record)))
+            f.write(record)
+
+
+def load_records(path: str) -> List[bytes]:
+    """save_records로 저장한 원시 레코드 읽기"""
+    records = []
+    with open(path, "rb") as f:
+        data = f.read()
+    offset = 0
+    while offset < len(data):
+        (length,) = _RECORD_LEN.unpack_from(data, offset)
+        offset += _RECORD_LEN.size
+        records.append(data[offset:offset + length])
+        offset += length
+    return records
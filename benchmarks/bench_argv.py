@@ -0,0 +1,71 @@
+"""명령줄 인수 크기별 exec당 커널 비용 측정
+
+kernel.bpf_stats_enabled를 켜고 각 BPF 프로그램 fdinfo의 run_time_ns / run_cnt를
+읽어, 명령줄 인수 길이와 ARGV_MAX_CHUNKS 설정에 따른 exec당 커널 실행 시간을 비교합니다.
+ARGV_MAX_CHUNKS 상한을 정할 때 사용합니다.
+
+실행:
+    sudo python3 -m benchmarks.bench_argv [--events 2000] [--sizes 64,256,1024,4096]
+        [--chunks 0,4,8,16,28]
+"""
+
+import argparse
+import asyncio
+
+from src.bpf.collector import BPFCollector
+from src.config.settings import settings
+from ._common import bpf_stats_enabled, drain, exec_storm, total_prog_stats
+
+
+def make_argv(size: int) -> list:
+    """대략 size 바이트의 gcc 스타일 명령줄 (/bin/true가 실행)"""
+    argv = ["/bin/true"]
+    i = 0
+    while sum(len(arg) + 1 for arg in argv) < size:
+        argv.append(f"-Iinclude/dir{i:04d}")
+        i += 1
+    return argv
+
+
+async def run(chunks: int, size: int, events: int) -> None:
+    settings.argv_max_chunks = chunks
+    queue = asyncio.Queue()
+    collector = BPFCollector(queue)
+    collector.load_program()
+    collector.start_polling()
+    try:
+        before = total_prog_stats(collector.bpf)
+        await asyncio.to_thread(exec_storm, events, make_argv(size))
+        received = await drain(queue, events)
+        after = total_prog_stats(collector.bpf)
+    finally:
+        collector.stop_polling()
+        collector.bpf.cleanup()
+
+    run_ns = sum(after[name][0] - before[name][0] for name in after)
+    per_prog = ", ".join(
+        f"{name}={(after[name][0] - before[name][0]) / max(events, 1):.0f}"
+        for name in sorted(after) if after[name][1] > before[name][1]
+    )
+    print(
+        f"chunks={chunks:<3} argv={size:<6} events={received:<6} "
+        f"ns/exec={run_ns / max(events, 1):>8.0f}  ({per_prog})"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--sizes", default="64,256,1024,4096,8192")
+    parser.add_argument("--chunks", default="0,4,8,16,28")
+    args = parser.parse_args()
+
+    with bpf_stats_enabled():
+        print("== kernel cost per exec by argv size ==")
+        for chunks in (int(c) for c in args.chunks.split(",")):
+            for size in (int(s) for s in args.sizes.split(",")):
+                await run(chunks, size, args.events)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,51 @@
+"""이벤트 디코딩 마이크로벤치마크 (ctypes 구조체 vs memoryview)
+
+콜백과 같은 (주소, 크기) 형태의 버퍼에서 RawBpfEvent를 만드는 비용을 비교합니다.
+입력은 bench_record_size --live --save로 기록한 레코드 또는 대표 샘플 이벤트입니다.
+
+실행:
+    python3 -m benchmarks.bench_decode [--input records.bin] [--repeat 5]
+"""
+
+import argparse
+import ctypes
+import timeit
+from typing import List, Tuple
+
+from src.bpf.event import RawBpfStruct, decode_event, encode_event
+from ._common import load_records
+from .bench_record_size import SAMPLE_EVENTS
+
+
+def decode_ctypes(data: int, size: int):
+    """기존 방식: ctypes 캐스팅 후 to_event()"""
+    return ctypes.cast(data, ctypes.POINTER(RawBpfStruct)).contents.to_event()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--input", help="bench_record_size --save로 기록한 파일")
+    parser.add_argument("--events", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.input:
+        records = load_records(args.input)
+    else:
+        records = [encode_event(event) for event in SAMPLE_EVENTS]
+    records = (records * (args.events // len(records) + 1))[:args.events]
+
+    # 콜백 버퍼를 흉내 내기 위해 미리 C 버퍼로 복사
+    buffers = [ctypes.create_string_buffer(record, len(record)) for record in records]
+    callbacks: List[Tuple[int, int]] = [(ctypes.addressof(b), len(b)) for b in buffers]
+
+    for name, decoder in (("ctypes", decode_ctypes), ("memoryview", decode_event)):
+        def run():
+            for data, size in callbacks:
+                decoder(data, size)
+        best = min(timeit.repeat(run, number=1, repeat=args.repeat))
+        print(f"{name:<12} {best * 1e9 / len(callbacks):8.0f} ns/event")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""dentry 경로 캐시 유무에 따른 exec 지연 비교
+
+같은 디렉토리에서 같은 실행 파일을 반복 실행(fork + exec)하며, 캐시를 켠 경우와
+끈 경우(DENTRY_CACHE_SIZE=0)의 exec당 소요 시간, 경로 수집 핸들러의 커널 실행 시간,
+캐시 적중률을 비교합니다. 깊은 디렉토리일수록 순회 비용 차이가 커집니다.
+
+실행:
+    sudo python3 -m benchmarks.bench_dentry_cache [--events 5000] [--depth 8]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from src.bpf.collector import BPFCollector
+from src.bpf.stats import read_stats
+from src.config.settings import settings
+from ._common import bpf_stats_enabled, drain, exec_storm, total_prog_stats
+
+# 경로를 조립하는 핸들러
+PATH_HANDLERS = ("binary_handler", "cwd_handler")
+
+
+async def run(cache_size: int, events: int) -> None:
+    settings.dentry_cache_size = cache_size
+    queue = asyncio.Queue()
+    collector = BPFCollector(queue)
+    collector.load_program()
+    collector.start_polling()
+    try:
+        before = total_prog_stats(collector.bpf)
+        start = time.monotonic()
+        await asyncio.to_thread(exec_storm, events)
+        elapsed = time.monotonic() - start
+        await drain(queue, events)
+        after = total_prog_stats(collector.bpf)
+        stats = read_stats(collector.bpf["stats"])
+    finally:
+        collector.stop_polling()
+        collector.bpf.cleanup()
+
+    path_ns = sum(after[name][0] - before[name][0] for name in PATH_HANDLERS)
+    lookups = stats["dentry_cache_hit"] + stats["dentry_cache_miss"]
+    hit_rate = stats["dentry_cache_hit"] / lookups if lookups else 0.0
+    print(
+        f"cache={cache_size:<6} exec={elapsed * 1e6 / events:>8.1f}us "
+        f"path handlers={path_ns / events:>8.0f}ns/exec hit rate={hit_rate:.1%}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--depth", type=int, default=8, help="작업 디렉토리 깊이")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root, bpf_stats_enabled():
+        workdir = os.path.join(root, *(f"d{i}" for i in range(args.depth)))
+        os.makedirs(workdir)
+        os.chdir(workdir)
+        print(f"== dentry cache ({args.events} execs, cwd depth {args.depth}) ==")
+        for cache_size in (0, settings.dentry_cache_size or 4096):
+            await run(cache_size, args.events)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
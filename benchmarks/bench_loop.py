@@ -0,0 +1,150 @@
+"""이벤트 루프별 전체 핸들러 체인 처리량 비교 (asyncio vs uvloop)
+
+별도 프로세스로 띄운 가짜 API 서버(aiohttp, 모든 POST에 200 응답)를 상대로
+컴파일/실행 이벤트를 큐에 넣고, 앱과 같은 레인 워커 풀과 핸들러 체인
+(프로세스 타입 -> 메타데이터 -> 과제 -> API 전송)으로 모두 처리할 때까지의
+처리량과 이벤트당 CPU 시간을 측정합니다. 서버의 CPU 시간은 포함하지 않습니다.
+BPF가 필요 없습니다.
+
+실행:
+    python3 -m benchmarks.bench_loop [--events 5000] [--lanes 64] [--students 200]
+"""
+
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import socket
+import time
+
+from ._common import Sample, cpu_seconds
+
+
+def serve(port: int) -> None:
+    """가짜 API 서버 (자식 프로세스)"""
+    from aiohttp import web
+
+    async def accept(request):
+        await request.read()
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_route("POST", "/{tail:.*}", accept)
+    web.run_app(app, host="127.0.0.1", port=port, print=None, access_log=None)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_server(port: int, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError("가짜 API 서버 시작 실패")
+
+
+def make_events(count: int, students: int):
+    from src.bpf.event import RawBpfEvent
+
+    events = []
+    for i in range(count):
+        hostname = f"jcode-os-1-{202000000 + i % students}-bench"
+        if i % 2:
+            binary_path, args = "/home/coder/project/hw1/main", "./main"
+        else:
+            binary_path = "/usr/bin/x86_64-linux-gnu-gcc-13"
+            args = f"{binary_path} -o main main.c"
+        events.append(RawBpfEvent(
+            pid=10000 + i,
+            binary_path=binary_path,
+            cwd="/home/coder/project/hw1",
+            args=args,
+            error_flags="0b0",
+            exit_code=0,
+            hostname=hostname,
+            exec_ns=time.monotonic_ns(),
+            exit_ns=time.monotonic_ns(),
+        ))
+    return events
+
+
+async def process_all(events, lanes: int) -> int:
+    """앱과 같은 구성으로 모든 이벤트를 처리하고 처리한 이벤트 수 반환"""
+    from src.events.lanes import LanePool, LaneQueue
+    from src.events.models import EventBuilder
+    from src.handlers.chain import build_handler_chain
+    from src.homework.checker import HomeworkChecker
+    from src.process.filter import ProcessFilter
+
+    homework_checker = HomeworkChecker()
+    chain = build_handler_chain(
+        process_filter=ProcessFilter(homework_checker),
+        homework_checker=homework_checker,
+    )
+
+    async def handle(event):
+        await chain.handle(EventBuilder(event))
+
+    queue = LaneQueue(lanes, 0)
+    for event in events:
+        queue.put_nowait(event)
+    pool = LanePool(queue, handle)
+    task = asyncio.create_task(pool.run())
+    await queue.join()
+    pool.stop()
+    await asyncio.gather(task, return_exceptions=True)
+    return pool.handled
+
+
+def measure(name: str, args) -> None:
+    from src.utils.loop import loop_factory
+
+    factory = loop_factory(name)
+    if name != "asyncio" and factory is None:
+        print(f"{name:<24} (설치되어 있지 않음, 건너뜀)")
+        return
+    events = make_events(args.events, args.students)
+    with asyncio.Runner(loop_factory=factory) as runner:
+        cpu_before = cpu_seconds()
+        start = time.perf_counter()
+        handled = runner.run(process_all(events, args.lanes))
+        elapsed = time.perf_counter() - start
+        cpu = cpu_seconds() - cpu_before
+    print(Sample(name, handled, elapsed, cpu))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--lanes", type=int, default=64)
+    parser.add_argument("--students", type=int, default=200, help="호스트네임 수")
+    args = parser.parse_args()
+
+    port = free_port()
+    server = multiprocessing.Process(target=serve, args=(port,), daemon=True)
+    server.start()
+    try:
+        wait_for_server(port)
+        # settings는 가져올 때 환경 변수를 읽으므로 src 모듈보다 먼저 설정
+        os.environ["API_ENDPOINT"] = f"http://127.0.0.1:{port}"
+        from src.utils.logging import setup_logging
+        setup_logging(level=logging.WARNING)
+
+        print(f"== handler chain ({args.events} events, {args.lanes} lanes) ==")
+        for name in ("asyncio", "uvloop"):
+            measure(name, args)
+    finally:
+        server.terminate()
+        server.join()
+
+
+if __name__ == "__main__":
+    main()
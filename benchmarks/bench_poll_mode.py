@@ -0,0 +1,85 @@
+"""폴링 쓰레드 vs 이벤트 루프 리더 소비 방식 비교
+
+각 방식으로 exec를 하나씩 실행하며 프로세스 종료부터 큐에서 이벤트를
+꺼낼 때까지의 지연 시간을 측정하고, 이어서 exec 폭주를 수집하여
+이벤트당 CPU 사용량을 비교합니다.
+
+실행:
+    sudo python3 -m benchmarks.bench_poll_mode [--samples 200] [--events 20000]
+"""
+
+import argparse
+import asyncio
+import statistics
+import subprocess
+import time
+from typing import List
+
+from src.bpf.collector import BPFCollector, POLL_MODE_LOOP, POLL_MODE_THREAD
+from src.config.settings import settings
+from ._common import (
+    BENCH_HOSTNAME, Sample, cpu_seconds, drain, exec_storm, print_samples
+)
+
+
+def run_one() -> float:
+    """exec 한 번 실행 후 프로세스 종료 시각 반환"""
+    subprocess.run(
+        ["unshare", "--uts", "sh", "-c", f"hostname {BENCH_HOSTNAME}; exec /bin/true"],
+        check=True,
+    )
+    return time.monotonic()
+
+
+async def measure_latency(queue: asyncio.Queue, samples: int) -> List[float]:
+    """종료 → 큐 수신 지연 시간 목록 (밀리초)"""
+    latencies = []
+    for _ in range(samples):
+        exited = await asyncio.to_thread(run_one)
+        # hostname 실행 등 부수 이벤트가 섞일 수 있으므로 마지막 이벤트까지 비움
+        await asyncio.wait_for(queue.get(), 5.0)
+        received = time.monotonic()
+        while not queue.empty():
+            queue.get_nowait()
+        latencies.append(max(received - exited, 0.0) * 1000)
+    return latencies
+
+
+async def run(mode: str, samples: int, events: int) -> Sample:
+    settings.bpf_poll_mode = mode
+    queue = asyncio.Queue()
+    collector = BPFCollector(queue)
+    collector.load_program()
+    collector.start_polling()
+    try:
+        latencies = await measure_latency(queue, samples)
+        latencies.sort()
+        print(
+            f"{mode:<8} latency p50={statistics.median(latencies):.2f}ms "
+            f"p99={latencies[int(len(latencies) * 0.99) - 1]:.2f}ms "
+            f"max={latencies[-1]:.2f}ms"
+        )
+
+        cpu_start = cpu_seconds()
+        start = time.monotonic()
+        await asyncio.to_thread(exec_storm, events)
+        received = await drain(queue, events)
+        elapsed = time.monotonic() - start
+        return Sample(f"{mode}/{collector.transport}", received, elapsed, cpu_seconds() - cpu_start)
+    finally:
+        collector.stop_polling()
+        collector.bpf.cleanup()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--events", type=int, default=20000)
+    args = parser.parse_args()
+
+    results = [await run(m, args.samples, args.events) for m in (POLL_MODE_THREAD, POLL_MODE_LOOP)]
+    print_samples(f"poll mode ({args.events} execs)", results)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,92 @@
+"""이벤트 레코드 크기 비교 (고정 857 bytes vs 가변 길이)
+
+--live: 실제 exec 부하를 수집하며 콜백에 전달된 레코드 크기를 기록 (root, BCC 필요)
+        --save를 함께 주면 원시 레코드를 파일로 저장 (bench_decode 입력용)
+기본: 대표적인 학생 실행 이벤트로 레코드 크기 계산
+
+실행:
+    python3 -m benchmarks.bench_record_size
+    sudo python3 -m benchmarks.bench_record_size --live --save records.bin
+"""
+
+import argparse
+import asyncio
+import ctypes
+import statistics
+from typing import List, Optional
+
+from src.bpf.event import ARGSIZE, MAX_PATH_LEN, UTS_LEN, RawBpfEvent, encode_event
+from ._common import BENCH_HOSTNAME, drain, exec_storm, save_records
+
+# 이전 고정 크기 struct data_t: pid, error_flags, hostname, 경로 버퍼 3개, 오프셋/길이/종료 코드
+FIXED_RECORD_SIZE = 4 + 4 + UTS_LEN + MAX_PATH_LEN * 2 + ARGSIZE + 4 * 4
+
+SAMPLE_EVENTS = [
+    RawBpfEvent(pid=1, binary_path="/usr/bin/x86_64-linux-gnu-gcc-13",
+                cwd="/home/coder/project/hw1", args="gcc -Wall -o main main.c util.c",
+                error_flags="0b0", exit_code=0, hostname=BENCH_HOSTNAME),
+    RawBpfEvent(pid=2, binary_path="/home/coder/project/hw1/main",
+                cwd="/home/coder/project/hw1", args="./main",
+                error_flags="0b0", exit_code=0, hostname=BENCH_HOSTNAME),
+    RawBpfEvent(pid=3, binary_path="/usr/bin/python3.12",
+                cwd="/home/coder/project/hw3", args="python3 solution.py input.txt",
+                error_flags="0b0", exit_code=1, hostname=BENCH_HOSTNAME),
+    RawBpfEvent(pid=4, binary_path="/usr/bin/ls",
+                cwd="/home/coder/project", args="ls --color=auto",
+                error_flags="0b0", exit_code=0, hostname=BENCH_HOSTNAME),
+]
+
+
+def report(sizes: List[int]) -> None:
+    mean = statistics.mean(sizes)
+    print(f"records:            {len(sizes)}")
+    print(f"fixed bytes/event:  {FIXED_RECORD_SIZE}")
+    print(f"packed bytes/event: mean={mean:.1f} p50={statistics.median(sizes):.0f} max={max(sizes)}")
+    print(f"reduction:          {FIXED_RECORD_SIZE / mean:.2f}x")
+
+
+async def live(count: int, save: Optional[str]) -> List[int]:
+    from src.bpf.collector import BPFCollector
+
+    sizes: List[int] = []
+    records: List[bytes] = []
+    queue = asyncio.Queue()
+    collector = BPFCollector(queue)
+    callback = collector.event_callback
+
+    def recording_callback(cpu, data, size):
+        sizes.append(size)
+        if save:
+            records.append(ctypes.string_at(data, size))
+        callback(cpu, data, size)
+
+    collector.event_callback = recording_callback
+    collector.load_program()
+    collector.start_polling()
+    try:
+        await asyncio.to_thread(exec_storm, count, ("ls", "-al", "/tmp"))
+        await drain(queue, count)
+    finally:
+        collector.stop_polling()
+        collector.bpf.cleanup()
+    if save:
+        save_records(save, records)
+    return sizes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--live", action="store_true")
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--save", help="원시 레코드 저장 경로 (--live 전용)")
+    args = parser.parse_args()
+
+    if args.live:
+        sizes = asyncio.run(live(args.events, args.save))
+    else:
+        sizes = [len(encode_event(event)) for event in SAMPLE_EVENTS]
+    report(sizes)
+
+
+if __name__ == "__main__":
+    main()
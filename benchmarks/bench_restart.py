@@ -0,0 +1,124 @@
+"""수집기 재시작(롤링 업데이트) 전후 유실 이벤트 측정
+
+수집기 A가 실행 중일 때 sleep 프로세스를 여러 개 시작하고, A를 강제 종료한 뒤
+수집기 B를 띄워 sleep이 B 실행 중에 종료하도록 합니다. B가 받은 sleep 종료 이벤트 수로
+재시작을 넘어간 프로세스의 유실을 맵 고정 사용 여부별로 비교합니다.
+A와 B 사이(공백 구간)에 종료한 프로세스는 트레이스포인트가 분리되어 있어 고정하지 않으면
+유실되고, 고정하면 종료 코드와 시각 없이 종료 미관찰 이벤트(unobserved)로 전달됩니다.
+
+실행:
+    sudo python3 -m benchmarks.bench_restart [--procs 200] [--sleep 10]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shlex
+import shutil
+import signal
+import subprocess
+import sys
+import time
+
+from ._common import BENCH_HOSTNAME
+
+PIN_DIR = "/sys/fs/bpf/watcher-proc-bench"
+
+
+async def child(seconds: float) -> None:
+    """수집기를 띄우고 seconds 동안 받은 종료 이벤트의 PID를 JSON으로 출력"""
+    from src.bpf.collector import BPFCollector
+    from src.bpf.event import ERR_EXIT_UNOBSERVED
+
+    queue = asyncio.Queue()
+    collector = BPFCollector(queue)
+    collector.load_program()
+    collector.start_polling()
+    print("ready", flush=True)
+
+    pids = []
+    unobserved = []
+    deadline = time.monotonic() + seconds
+    try:
+        while (remaining := deadline - time.monotonic()) > 0:
+            try:
+                event = await asyncio.wait_for(queue.get(), remaining)
+            except asyncio.TimeoutError:
+                break
+            pids.append(event.pid)
+            if int(event.error_flags, 2) & ERR_EXIT_UNOBSERVED:
+                unobserved.append(event.pid)
+    finally:
+        collector.stop_polling()
+    print(json.dumps({"pids": pids, "unobserved": unobserved}), flush=True)
+
+
+def start_child(seconds: float, pin_dir: str) -> subprocess.Popen:
+    env = {**os.environ, "BPF_PIN_DIR": pin_dir, "BPF_TRANSPORT": "ringbuf"}
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.bench_restart", "--child", str(seconds)],
+        env=env, stdout=subprocess.PIPE, text=True,
+    )
+    if proc.stdout.readline().strip() != "ready":
+        proc.kill()
+        raise RuntimeError("수집기 시작 실패")
+    return proc
+
+
+def start_sleepers(count: int, seconds: float) -> subprocess.Popen:
+    """벤치마크 호스트네임에서 count개의 sleep을 백그라운드로 실행하고 PID 출력"""
+    script = (
+        f"hostname {shlex.quote(BENCH_HOSTNAME)}; i=0; "
+        f"while [ $i -lt {count} ]; do sleep {seconds} & echo $!; i=$((i+1)); done; wait"
+    )
+    return subprocess.Popen(["unshare", "--uts", "sh", "-c", script],
+                            stdout=subprocess.PIPE, text=True)
+
+
+def run(name: str, pin_dir: str, procs: int, sleep_sec: float) -> None:
+    collector_a = start_child(sleep_sec * 10, pin_dir)
+    sleepers = start_sleepers(procs, sleep_sec)
+    pids = {int(sleepers.stdout.readline()) for _ in range(procs)}
+
+    # 롤링 업데이트: 이전 파드를 종료(크래시 포함)한 뒤 새 파드 시작
+    start = time.monotonic()
+    collector_a.send_signal(signal.SIGKILL)
+    collector_a.wait()
+    collector_b = start_child(sleep_sec + 5, pin_dir)
+    gap = time.monotonic() - start
+
+    sleepers.wait()
+    output, _ = collector_b.communicate()
+    result = json.loads(output.strip().splitlines()[-1])
+    received = pids & set(result["pids"])
+    unobserved = pids & set(result["unobserved"])
+    print(
+        f"{name:<12} procs={procs:<6} received={len(received):<6} "
+        f"unobserved={len(unobserved):<6} "
+        f"lost={procs - len(received):<6} gap={gap:.2f}s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--child", type=float, help=argparse.SUPPRESS)
+    parser.add_argument("--procs", type=int, default=200)
+    parser.add_argument("--sleep", type=float, default=10.0,
+                        help="sleep 시간 (수집기 재시작보다 길어야 함)")
+    args = parser.parse_args()
+
+    if args.child is not None:
+        asyncio.run(child(args.child))
+        return
+
+    print("== events lost across collector restart ==")
+    run("unpinned", "", args.procs, args.sleep)
+    try:
+        run("pinned", PIN_DIR, args.procs, args.sleep)
+    finally:
+        shutil.rmtree(PIN_DIR, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""BPF 프로그램 로드 경로별 시작 시간과 RSS 비교
+
+로드 비용은 프로세스마다 한 번만 측정할 수 있으므로 각 경로를 새 프로세스에서 실행합니다.
+모든 경로가 program.c를 clang으로 컴파일하므로 경로 간 차이는 헤더 준비 시간(headers)에서
+나고, 컴파일 시간(compile)과 RSS는 헤더 출처와 무관하게 비슷합니다.
+
+- host_headers: 호스트의 /lib/modules 헤더로 컴파일
+- cached_headers (cold): 빈 캐시 디렉토리에서 kheaders 압축 해제 후 컴파일
+- cached_headers (warm): 이미 풀어 둔 kheaders로 컴파일
+
+실행:
+    sudo python3 -m benchmarks.bench_startup
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+
+async def child() -> None:
+    """컬렉터를 한 번 로드하고 측정 결과를 JSON으로 출력"""
+    from src.bpf.collector import BPFCollector
+
+    collector = BPFCollector(asyncio.Queue())
+    collector.load_program()
+    collector.bpf.cleanup()
+    print(json.dumps(collector.load_report.__dict__))
+
+
+def run_child(name: str, env: dict) -> None:
+    env = {**os.environ, **env}
+    env.pop("BCC_KERNEL_SOURCE", None)
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_startup", "--child"],
+        env=env, check=True, capture_output=True, text=True,
+    ).stdout
+    report = json.loads(output.strip().splitlines()[-1])
+    mib = 1024 * 1024
+    print(
+        f"{name:<24} path={report['path']:<16} headers={report['headers_seconds']:>6.2f}s "
+        f"compile={report['seconds']:>6.2f}s "
+        f"rss before={report['rss_before'] // mib}MiB "
+        f"loaded={report['rss_loaded'] // mib}MiB "
+        f"trimmed={report['rss_trimmed'] // mib}MiB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        asyncio.run(child())
+        return
+
+    print("== BPF startup ==")
+    run_child("host headers", {"BPF_HEADER_CACHE_DIR": ""})
+    with tempfile.TemporaryDirectory() as cache_dir:
+        run_child("cached headers (cold)", {"BPF_HEADER_CACHE_DIR": cache_dir})
+        run_child("cached headers (warm)", {"BPF_HEADER_CACHE_DIR": cache_dir})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""다중 쓰레드 워크로드의 종료 처리 회귀 벤치마크
+
+쓰레드를 많이 만드는 프로그램을 반복 실행하여, 프로그램당 이벤트가 정확히 하나이고
+종료 코드가 올바른지, 그리고 마지막 쓰레드가 아닌 종료가 process_data 조회 없이
+건너뛰어지는지(thread_exit_skipped)와 exit_handler의 커널 실행 시간을 확인합니다.
+
+실행:
+    sudo python3 -m benchmarks.bench_thread_exit [--programs 200] [--threads 32]
+"""
+
+import argparse
+import asyncio
+import sys
+
+from src.bpf.collector import BPFCollector
+from src.bpf.stats import read_stats
+from ._common import bpf_stats_enabled, exec_storm, total_prog_stats
+
+EXIT_CODE = 7
+
+
+def workload(threads: int) -> list:
+    """쓰레드를 만들어 먼저 종료시킨 뒤 EXIT_CODE로 끝나는 파이썬 프로그램"""
+    script = (
+        "import sys, threading\n"
+        f"ts = [threading.Thread(target=lambda: None) for _ in range({threads})]\n"
+        "[t.start() for t in ts]\n"
+        "[t.join() for t in ts]\n"
+        f"sys.exit({EXIT_CODE})\n"
+    )
+    return [sys.executable, "-c", script]
+
+
+async def collect(queue: asyncio.Queue, timeout: float = 2.0) -> list:
+    """timeout 동안 새 이벤트가 없을 때까지 큐를 비움"""
+    events = []
+    while True:
+        try:
+            events.append(await asyncio.wait_for(queue.get(), timeout))
+        except asyncio.TimeoutError:
+            return events
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--programs", type=int, default=200)
+    parser.add_argument("--threads", type=int, default=32)
+    args = parser.parse_args()
+
+    queue = asyncio.Queue()
+    collector = BPFCollector(queue)
+    collector.load_program()
+    collector.start_polling()
+    try:
+        with bpf_stats_enabled():
+            before_stats = read_stats(collector.bpf["stats"])
+            before = total_prog_stats(collector.bpf)
+            await asyncio.to_thread(exec_storm, args.programs, workload(args.threads))
+            events = await collect(queue)
+            after = total_prog_stats(collector.bpf)
+            after_stats = read_stats(collector.bpf["stats"])
+    finally:
+        collector.stop_polling()
+        collector.bpf.cleanup()
+
+    # 같은 UTS 네임스페이스의 sh, hostname 이벤트 제외
+    programs = [e for e in events if "python" in e.binary_path]
+    correct = sum(1 for e in programs if e.exit_code == EXIT_CODE)
+    skipped = after_stats["thread_exit_skipped"] - before_stats["thread_exit_skipped"]
+    run_ns, run_cnt = (after["exit_handler"][i] - before["exit_handler"][i] for i in (0, 1))
+
+    print(f"== thread exit ({args.programs} programs x {args.threads} threads) ==")
+    print(f"events              {len(programs)} (expected {args.programs})")
+    print(f"correct exit code   {correct}/{len(programs)}")
+    print(f"skipped thread exit {skipped} (map lookups avoided)")
+    print(f"exit_handler        runs={run_cnt} avg={run_ns / max(run_cnt, 1):.0f}ns")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
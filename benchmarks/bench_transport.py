@@ -0,0 +1,47 @@
+"""perf 버퍼 vs 링 버퍼 전송 방식 비교
+
+동일한 exec 폭주를 두 전송 방식으로 수집하여 초당 이벤트 수와
+이벤트당 CPU 사용량을 비교합니다.
+
+실행:
+    sudo python3 -m benchmarks.bench_transport [--events 20000]
+"""
+
+import argparse
+import asyncio
+import time
+
+from src.bpf.collector import BPFCollector, TRANSPORT_PERF, TRANSPORT_RINGBUF
+from src.config.settings import settings
+from ._common import Sample, cpu_seconds, drain, exec_storm, print_samples
+
+
+async def run(transport: str, events: int) -> Sample:
+    settings.bpf_transport = transport
+    queue = asyncio.Queue()
+    collector = BPFCollector(queue)
+    collector.load_program()
+    collector.start_polling()
+    try:
+        cpu_start = cpu_seconds()
+        start = time.monotonic()
+        await asyncio.to_thread(exec_storm, events)
+        received = await drain(queue, events)
+        elapsed = time.monotonic() - start
+        return Sample(collector.transport, received, elapsed, cpu_seconds() - cpu_start)
+    finally:
+        collector.stop_polling()
+        collector.bpf.cleanup()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=20000)
+    args = parser.parse_args()
+
+    samples = [await run(t, args.events) for t in (TRANSPORT_PERF, TRANSPORT_RINGBUF)]
+    print_samples(f"transport ({args.events} execs)", samples)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
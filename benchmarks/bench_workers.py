@@ -0,0 +1,124 @@
+"""이벤트 처리 방식별 처리량과 지연 비교 (이벤트당 태스크 vs 워커 풀)
+
+합성 이벤트 소스가 일정한 속도로 큐에 이벤트를 넣고, 핸들러는 API 호출을 흉내 내어
+로그 정규 분포 지연만큼 대기합니다. 큐에 넣은 시각부터 처리 완료까지의 지연을 측정합니다.
+BPF가 필요 없습니다.
+
+- spawn: 이벤트마다 create_task (기존 방식, 동시 처리 수 제한 없음)
+- pool-N: 워커 N개가 큐를 소비 (WorkerPool)
+
+실행:
+    python3 -m benchmarks.bench_workers [--events 20000] [--rate 2000]
+        [--latency-ms 20] [--workers 16,64,256]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import List
+
+from src.events.workers import WorkerPool
+from ._common import cpu_seconds
+
+
+class SyntheticSource:
+    """일정 속도로 (넣은 시각) 이벤트를 생성"""
+
+    def __init__(self, queue: asyncio.Queue, events: int, rate: float):
+        self.queue = queue
+        self.events = events
+        self.rate = rate
+
+    async def run(self) -> None:
+        start = time.perf_counter()
+        for i in range(self.events):
+            # 폴링 배치처럼 밀린 만큼 한 번에 넣음
+            delay = start + i / self.rate - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self.queue.put_nowait(time.perf_counter())
+
+
+def make_handler(latencies: List[float], latency_ms: float):
+    sigma = 0.5
+
+    async def handle(enqueued: float) -> None:
+        await asyncio.sleep(random.lognormvariate(0, sigma) * latency_ms / 1000)
+        latencies.append(time.perf_counter() - enqueued)
+    return handle
+
+
+async def run_spawn(source: SyntheticSource, handle) -> None:
+    """기존 방식: 꺼내는 즉시 태스크 생성"""
+    queue = source.queue
+    tasks = set()
+
+    async def consume():
+        while True:
+            event = await queue.get()
+            task = asyncio.create_task(handle(event))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            queue.task_done()
+
+    consumer = asyncio.create_task(consume())
+    await source.run()
+    await queue.join()
+    while tasks:
+        await asyncio.gather(*list(tasks))
+    consumer.cancel()
+
+
+async def run_pool(source: SyntheticSource, handle, workers: int) -> None:
+    pool = WorkerPool(source.queue, handle, workers)
+    task = asyncio.create_task(pool.run())
+    await source.run()
+    await source.queue.join()
+    pool.stop()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+def percentile(values: List[float], p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+async def measure(name: str, args, workers: int = 0) -> None:
+    latencies: List[float] = []
+    source = SyntheticSource(asyncio.Queue(), args.events, args.rate)
+    handle = make_handler(latencies, args.latency_ms)
+
+    cpu_before = cpu_seconds()
+    start = time.perf_counter()
+    if workers:
+        await run_pool(source, handle, workers)
+    else:
+        await run_spawn(source, handle)
+    elapsed = time.perf_counter() - start
+    cpu = cpu_seconds() - cpu_before
+
+    print(
+        f"{name:<10} events/s={len(latencies) / elapsed:>9.1f} "
+        f"p50={percentile(latencies, 0.50) * 1000:>8.1f}ms "
+        f"p99={percentile(latencies, 0.99) * 1000:>8.1f}ms "
+        f"cpu/event={cpu * 1e6 / len(latencies):>7.1f}us"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--rate", type=float, default=2000, help="초당 생성 이벤트 수")
+    parser.add_argument("--latency-ms", type=float, default=20, help="핸들러 지연 중앙값")
+    parser.add_argument("--workers", default="16,64,256")
+    args = parser.parse_args()
+
+    print(f"== handler execution ({args.events} events @ {args.rate:.0f}/s) ==")
+    await measure("spawn", args)
+    for workers in (int(w) for w in args.workers.split(",")):
+        await measure(f"pool-{workers}", args, workers)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -33,6 +33,17 @@ class APIClient:
             # self.logger.exception(f"API 오류: endpoint={endpoint}")
             return False
 
+    @staticmethod
+    def _resource_usage(event: Event) -> Dict[str, Any]:
+        """종료 시점의 프로세스 자원 사용량"""
+        return {
+            'user_time_ms': event.base.utime_ns / 1e6,
+            'system_time_ms': event.base.stime_ns / 1e6,
+            'max_rss_kb': event.base.maxrss_kb,
+            'voluntary_ctxt_switches': event.base.nvcsw,
+            'involuntary_ctxt_switches': event.base.nivcsw,
+        }
+
     async def send_binary_execution(self, event: Event) -> bool:
         """실행 이벤트 전송"""
         endpoint = f"/api/{event.metadata.class_div}/{event.homework.homework_dir}/{event.metadata.student_id}/logs/run"
@@ -40,10 +51,12 @@ class APIClient:
         data = {
             'timestamp': event.metadata.timestamp.isoformat(),
             'exit_code': event.base.exit_code,
+            'runtime_ms': event.base.runtime_ms,
             'cmdline': event.base.args,
             'cwd': event.base.cwd,
             'target_path': event.base.binary_path,
-            'process_type': 'binary'
+            'process_type': 'binary',
+            **self._resource_usage(event)
         }
         return await self._send_event(endpoint, data)
 
@@ -54,10 +67,12 @@ class APIClient:
         data = {
             'timestamp': event.metadata.timestamp.isoformat(),
             'exit_code': event.base.exit_code,
+            'runtime_ms': event.base.runtime_ms,
             'cmdline': event.base.args,
             'cwd': event.base.cwd,
             'target_path': event.homework.source_file,
-            'process_type': 'python'
+            'process_type': 'python',
+            **self._resource_usage(event)
         }
         return await self._send_event(endpoint, data)
 
@@ -68,9 +83,11 @@ class APIClient:
         data = {
             'timestamp': event.metadata.timestamp.isoformat(),
             'exit_code': event.base.exit_code,
+            'runtime_ms': event.base.runtime_ms,
             'cmdline': event.base.args,
             'cwd': event.base.cwd,
             'binary_path': event.base.binary_path,
-            'target_path': event.homework.source_file
+            'target_path': event.homework.source_file,
+            'phases_ms': event.base.phases_ms
         }
         return await self._send_event(endpoint, data) 
\ No newline at end of file
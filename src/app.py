@@ -5,14 +5,20 @@ BPF 프로그램을 실행하고 이벤트를 처리하는 메인 로직을 구
 
 import asyncio
 import logging
+import signal
 
 from src.bpf.collector import BPFCollector
 from src.bpf.event import RawBpfEvent
 from src.events.models import EventBuilder
+from src.events.lanes import LanePool, LaneQueue
+from src.events.queue import EventQueue, compiler_classifier
+from src.events.spool import EventSpool
+from src.events.workers import WorkerPool
 from src.process.filter import ProcessFilter
 from src.homework.checker import HomeworkChecker
 from src.handlers.chain import build_handler_chain
 from src.utils.logging import get_logger, set_pid, setup_logging, set_hostname
+from src.utils.loop import run
 from src.config.settings import settings
 from src.metrics.prometheus import PrometheusMetrics
 
@@ -23,10 +29,30 @@ class Application:
         self.logger = get_logger(__name__)
         
         # 애플리케이션 컴포넌트 초기화
-        self.event_queue = asyncio.Queue()
+        compilers = [
+            path for name in ("GCC", "CLANG", "GPP")
+            for path in settings.PROCESS_PATTERNS[name]
+        ]
+        classify = compiler_classifier(compilers)
+        # 동시에 처리하는 이벤트 수 제한 (초과분은 큐에 남아 과부하 정책 적용)
+        if settings.event_lanes > 0:
+            # 같은 학생(호스트네임)의 이벤트는 한 레인에서 순서대로 처리
+            self.event_queue = LaneQueue(
+                settings.event_lanes, settings.event_queue_size,
+                settings.event_queue_policy, classify,
+            )
+            self.workers = LanePool(self.event_queue, self.handle_event)
+        else:
+            self.event_queue = EventQueue(
+                settings.event_queue_size, settings.event_queue_policy, classify,
+            )
+            self.workers = WorkerPool(self.event_queue, self.handle_event, settings.event_workers)
+        self.spool = EventSpool(settings.event_spool_path)
         self.collector = None
         self.handler_chain = None
         self.is_running = False
+        self._stop = asyncio.Event()
+        self._worker_task = None
         self.metrics = PrometheusMetrics()
 
     async def handle_event(self, event: RawBpfEvent):
@@ -44,17 +70,38 @@ class Application:
             set_pid(None)
             set_hostname(None)
 
+    def request_stop(self):
+        """종료 요청 (SIGTERM/SIGINT 핸들러)"""
+        if not self._stop.is_set():
+            self.logger.info("[종료] 종료 신호 수신")
+            self._stop.set()
+
     async def process_events(self):
-        """이벤트 처리 루프 - 동시 처리 지원"""
-        while self.is_running:
-            event = await self.event_queue.get()
-            asyncio.create_task(self.handle_event(event))
-            self.event_queue.task_done()
+        """이벤트 처리 루프 - 종료 요청까지 워커 풀로 동시 처리"""
+        self._worker_task = asyncio.create_task(self.workers.run())
+        stop = asyncio.create_task(self._stop.wait())
+        await asyncio.wait({self._worker_task, stop}, return_when=asyncio.FIRST_COMPLETED)
+        stop.cancel()
+        if self._worker_task.done():
+            # 워커는 이벤트 처리 예외를 잡으므로 여기에 오면 예기치 못한 오류
+            self._worker_task.result()
+
+    def replay_spool(self):
+        """이전 실행이 저장한 미전송 이벤트를 큐에 넣음"""
+        events = self.spool.replay()
+        queued = sum(1 for event in events if self.event_queue.put_nowait(event))
+        if events:
+            self.logger.info(f"[시작] 스풀에서 미전송 이벤트 {queued}/{len(events)}개 복구")
 
     async def start(self):
         """애플리케이션 시작"""
         try:
             self.logger.info("[시작] 프로세스 모니터링 시작")
+
+            # 종료 신호를 받으면 수집을 멈추고 남은 이벤트를 처리한 뒤 종료
+            loop = asyncio.get_running_loop()
+            for sig in (signal.SIGTERM, signal.SIGINT):
+                loop.add_signal_handler(sig, self.request_stop)
             
             # 프로메테우스 메트릭 서버 시작
             self.logger.debug("[초기화] 프로메테우스 메트릭 서버 시작")
@@ -65,6 +112,11 @@ class Application:
             self.logger.debug("[초기화] BPF 컬렉터 초기화 시작")
             self.collector = BPFCollector(self.event_queue)
             self.collector.load_program()
+            self.metrics.add_scraper(self.collector.stats_scraper())
+            self.metrics.add_scraper(self.collector.process_map_scraper())
+            exec_rate_reporter = self.collector.exec_rate_reporter()
+            if exec_rate_reporter:
+                self.metrics.add_scraper(exec_rate_reporter)
             self.collector.start_polling()
             self.logger.debug("[초기화] BPF 컬렉터 초기화 완료")
             
@@ -79,6 +131,7 @@ class Application:
             self.logger.debug("[초기화] 핸들러 체인 구성 완료")
             
             # 이벤트 처리 시작
+            self.replay_spool()
             self.is_running = True
             self.logger.info("[실행] 이벤트 처리 시작")
             await self.process_events()
@@ -89,15 +142,50 @@ class Application:
             await self.shutdown()
 
     async def shutdown(self):
-        """애플리케이션 종료"""
+        """애플리케이션 종료
+
+        수집을 멈추고 큐에 남은 이벤트와 처리 중인 이벤트를 기한 안에 처리한 뒤,
+        처리하지 못한 이벤트는 스풀에 저장합니다.
+        """
         self.is_running = False
         if self.collector:
             self.logger.debug("[종료] BPF 컬렉터 정리 시작")
             self.collector.stop_polling()
-            await self.event_queue.join()
+            # 폴링 쓰레드가 이벤트 루프에 넘긴 이벤트를 큐에 반영
+            await asyncio.sleep(0)
             self.logger.debug("[종료] BPF 컬렉터 정리 완료")
+
+        pending = self.event_queue.qsize()
+        drained, unsent = await self._drain()
+        persisted = self.spool.write(unsent)
+        self.logger.info(
+            f"[종료] 남은 이벤트 {pending}개: 처리 {drained}, 스풀 저장 {persisted}, "
+            f"유실 {len(unsent) - persisted}"
+        )
         self.logger.info("[종료] 프로그램 종료")
 
+    async def _drain(self):
+        """기한 안에 남은 이벤트 처리
+
+        Returns:
+            (처리한 이벤트 수, 처리하지 못한 이벤트 목록)
+        """
+        if not self.workers.running:
+            return 0, self.event_queue.drain()
+
+        handled = self.workers.handled
+        try:
+            # 워커가 task_done()을 처리 후에 호출하므로 처리 중인 이벤트까지 기다림
+            await asyncio.wait_for(self.event_queue.join(), settings.shutdown_drain_timeout_sec)
+        except asyncio.TimeoutError:
+            self.logger.warning(
+                f"[종료] {settings.shutdown_drain_timeout_sec}초 안에 이벤트를 모두 처리하지 못함"
+            )
+        self.workers.stop()
+        await asyncio.gather(self._worker_task, return_exceptions=True)
+        unsent = self.workers.interrupted + self.event_queue.drain()
+        return self.workers.handled - handled, unsent
+
 if __name__ == "__main__":
     app = Application()
-    asyncio.run(app.start()) 
\ No newline at end of file
+    run(app.start(), settings.event_loop) 
\ No newline at end of file
@@ -0,0 +1,122 @@
+"""커널 exec 허용 목록 관리
+
+PROCESS_PATTERNS에 등록된 컴파일러/인터프리터 실행 파일의 (dev, inode)를
+커널 맵(exec_allowlist)에 채웁니다. 학생 컨테이너마다 루트 파일시스템이 다르므로
+호스트 PID 네임스페이스에서 보이는 /proc/<pid>/root를 통해 컨테이너별로 stat합니다.
+경로에 glob 패턴(/usr/libexec/gcc/*/*/cc1 등)을 쓰면 컨테이너마다 펼쳐서 등록합니다.
+"""
+
+import glob
+import os
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from ..utils.logging import get_logger
+
+ExeKey = Tuple[int, int]  # (커널 dev_t, inode)
+
+MAX_SYMLINK_DEPTH = 8
+
+
+def kernel_dev(st_dev: int) -> int:
+    """stat의 st_dev를 커널 내부 dev_t 인코딩(MAJOR << 20 | MINOR)으로 변환"""
+    return (os.major(st_dev) << 20) | os.minor(st_dev)
+
+
+def resolve_in_root(root: str, path: str) -> Optional[str]:
+    """root 기준으로 path의 심볼릭 링크를 따라간 실제 경로
+
+    /proc/<pid>/root 아래에서 절대 경로 심볼릭 링크를 그대로 따라가면
+    감시 프로세스의 루트로 빠져나가므로 링크 대상을 root 기준으로 다시 붙입니다.
+    """
+    current = path
+    for _ in range(MAX_SYMLINK_DEPTH):
+        full_path = os.path.join(root, current.lstrip('/'))
+        try:
+            target = os.readlink(full_path)
+        except OSError:
+            return full_path if os.path.exists(full_path) else None
+        if target.startswith('/'):
+            current = target
+        else:
+            current = os.path.normpath(os.path.join(os.path.dirname(current), target))
+    return None
+
+
+def expand_in_root(root: str, path: str) -> List[str]:
+    """root 기준으로 glob 패턴을 펼친 컨테이너 내부 경로 목록 (패턴이 아니면 그대로)"""
+    if not glob.has_magic(path):
+        return [path]
+    matches = glob.glob(os.path.join(root, path.lstrip('/')))
+    return sorted('/' + os.path.relpath(match, root) for match in matches)
+
+
+class ExecAllowlist:
+    """컨테이너별 허용 실행 파일 키를 수집하여 커널 맵과 동기화"""
+
+    def __init__(self, table, paths: Iterable[str], proc_root: str = "/proc"):
+        self.logger = get_logger(__name__)
+        self.table = table
+        self.paths: List[str] = list(paths)
+        self.proc_root = proc_root
+        # 마운트 네임스페이스 inode -> 해당 네임스페이스에서 수집한 키
+        self._namespaces: Dict[int, Set[ExeKey]] = {}
+        self._installed: Set[ExeKey] = set()
+
+    def _stat_keys(self, root: str) -> Set[ExeKey]:
+        """root 파일시스템에서 허용 경로들의 키 수집"""
+        keys = set()
+        for pattern in self.paths:
+            for path in expand_in_root(root, pattern):
+                resolved = resolve_in_root(root, path)
+                if not resolved:
+                    continue
+                try:
+                    st = os.stat(resolved)
+                except OSError:
+                    continue
+                keys.add((kernel_dev(st.st_dev), st.st_ino))
+        return keys
+
+    def _roots(self) -> Iterator[Tuple[int, str]]:
+        """마운트 네임스페이스별 대표 프로세스의 루트 경로"""
+        seen = set()
+        for entry in os.scandir(self.proc_root):
+            if not entry.name.isdigit():
+                continue
+            try:
+                mnt_ns = os.stat(os.path.join(entry.path, "ns", "mnt")).st_ino
+            except OSError:
+                continue
+            if mnt_ns in seen:
+                continue
+            seen.add(mnt_ns)
+            yield mnt_ns, os.path.join(entry.path, "root")
+
+    def refresh(self) -> None:
+        """새 컨테이너의 키를 추가하고 사라진 컨테이너의 키를 제거"""
+        namespaces: Dict[int, Set[ExeKey]] = {}
+        for mnt_ns, root in self._roots():
+            if mnt_ns in self._namespaces:
+                namespaces[mnt_ns] = self._namespaces[mnt_ns]
+            else:
+                namespaces[mnt_ns] = self._stat_keys(root)
+        self._namespaces = namespaces
+
+        wanted = set().union(*namespaces.values()) if namespaces else set()
+        added = wanted - self._installed
+        removed = self._installed - wanted
+
+        for dev, ino in added:
+            self.table[self.table.Key(dev=dev, ino=ino)] = self.table.Leaf(1)
+        for dev, ino in removed:
+            try:
+                del self.table[self.table.Key(dev=dev, ino=ino)]
+            except KeyError:
+                pass
+        self._installed = wanted
+
+        if added or removed:
+            self.logger.info(
+                f"[허용 목록] 갱신: 네임스페이스 {len(namespaces)}개, "
+                f"키 {len(wanted)}개 (+{len(added)}, -{len(removed)})"
+            )
@@ -0,0 +1,103 @@
+"""청크로 나뉜 명령줄 인수 재조립
+
+ARGSIZE를 넘는 명령줄 인수는 exec 시점에 ARGS_CHUNK 레코드로 나뉘어 전송되고,
+EXIT 레코드에는 앞서 보낸 청크 수가 기록됩니다. 청크는 PID별로 모아 두었다가
+EXIT 레코드를 받으면 순번대로 이어 붙여 이벤트를 완성합니다.
+
+perf 버퍼는 CPU별로 나뉘어 있어 같은 폴링 패스 안에서 EXIT 레코드가 다른 CPU의
+청크보다 먼저 읽힐 수 있습니다. 따라서 청크가 필요한 EXIT 레코드는 폴링 패스가
+끝날 때(flush) 완성합니다. 늦게 완성된 이벤트가 같은 패스의 뒤이은 이벤트보다 뒤로
+밀리지 않도록(예: 긴 gcc 명령 뒤의 ./main) complete()는 패스의 이벤트를 커널 종료 순서로 합칩니다.
+"""
+
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from .event import (
+    ERR_ARGS_TOO_LONG, EVENT_ARGS_CHUNK, HEADER, HEADER_SIZE, RawBpfEvent, decode_record
+)
+from ..utils.logging import get_logger
+
+
+class ArgvAssembler:
+    """PID와 순번으로 명령줄 인수 청크를 재조립"""
+
+    def __init__(self, max_pending: int = 4096):
+        # EXIT 레코드를 받지 못한 프로세스(수집 중단, 맵 퇴출 등)의 청크가 쌓이지 않도록 제한
+        self.max_pending = max_pending
+        self._chunks: "OrderedDict[int, Dict[int, bytes]]" = OrderedDict()
+        self._waiting: List[bytes] = []
+        self.logger = get_logger(__name__)
+
+    def feed(self, buf) -> Optional[RawBpfEvent]:
+        """레코드 하나 처리
+
+        Returns:
+            바로 완성된 이벤트, 청크이거나 청크를 기다리는 EXIT 레코드이면 None
+        """
+        view = memoryview(buf)
+        if len(view) < HEADER_SIZE:
+            raise ValueError(f"레코드 크기가 헤더보다 작음: {len(view)}")
+
+        record_type, _, _, _, args_len, chunk, pid, *_ = HEADER.unpack_from(view)
+        if record_type == EVENT_ARGS_CHUNK:
+            self._add_chunk(pid, chunk, bytes(view[HEADER_SIZE:HEADER_SIZE + args_len]))
+            return None
+        if chunk:
+            # 콜백 버퍼는 콜백이 끝나면 재사용되므로 복사해 둠
+            self._waiting.append(bytes(view))
+            return None
+        return decode_record(view)
+
+    def flush(self) -> List[RawBpfEvent]:
+        """청크를 기다리던 EXIT 레코드를 완성하여 반환"""
+        waiting, self._waiting = self._waiting, []
+        events = []
+        for record in waiting:
+            try:
+                events.append(self._complete(record))
+            except ValueError as e:
+                self.logger.error(f"[오류] 레코드 변환 실패: {e}")
+        return events
+
+    def complete(self, ready: List[RawBpfEvent]) -> List[RawBpfEvent]:
+        """바로 완성된 이벤트와 청크를 기다리던 이벤트를 커널 종료 시각 순서로 합침
+
+        같은 학생의 이벤트 순서를 유지하기 위해 정렬하며, 같은 시각이면 읽은 순서를 유지합니다.
+        CPU별 perf 버퍼의 패스 안 순서 뒤바뀜도 함께 바로잡습니다.
+        """
+        events = ready + self.flush()
+        events.sort(key=lambda event: event.exit_ns)
+        return events
+
+    @property
+    def pending(self) -> int:
+        """청크를 모으는 중인 프로세스 수"""
+        return len(self._chunks)
+
+    def _add_chunk(self, pid: int, seq: int, data: bytes) -> None:
+        if seq == 0:
+            # 같은 PID의 새 exec는 이전 청크를 대체
+            self._chunks.pop(pid, None)
+        parts = self._chunks.setdefault(pid, {})
+        parts[seq] = data
+        self._chunks.move_to_end(pid)
+        while len(self._chunks) > self.max_pending:
+            self._chunks.popitem(last=False)
+
+    def _complete(self, record: bytes) -> RawBpfEvent:
+        _, _, _, _, _, chunk_count, pid, *_ = HEADER.unpack_from(record)
+        parts = self._chunks.pop(pid, {})
+        tail = []
+        for seq in range(chunk_count):
+            if seq not in parts:
+                break
+            tail.append(parts[seq])
+
+        if len(tail) < chunk_count:
+            # 청크 유실: 끊기기 전까지만 이어 붙이고 잘렸음을 표시
+            self.logger.warning(
+                f"[유실] PID {pid} 명령줄 인수 청크 {chunk_count - len(tail)}/{chunk_count}개 유실"
+            )
+            return decode_record(record, args_tail=b''.join(tail), extra_flags=ERR_ARGS_TOO_LONG)
+        return decode_record(record, args_tail=b''.join(tail))
@@ -1,11 +1,46 @@
 import os
 import logging
+import platform
 import threading
+import time
 import asyncio
-from typing import Optional, Any
+from functools import partial
+from typing import Optional, Any, List, Dict, Tuple
 from bcc import BPF
-from .event import RawBpfStruct
-import ctypes
+from bcc.libbcc import lib
+from bcc.utils import get_online_cpus
+from .argv import ArgvAssembler
+from .event import EVENT_EXEC, RawBpfEvent, decode_exec, record_type, record_view
+from .allowlist import ExecAllowlist
+from .loader import (
+    LOAD_PATH_CACHED_HEADERS, LOAD_PATH_HOST_HEADERS, KernelHeaderCache, LoadReport,
+    measure_load
+)
+from .ratelimit import ExecRateReporter
+from .pinning import EVENTS_PIN, PROCESS_DATA_PIN, MapPins, drain_orphans, layout_version
+from .selection import ExecSelector, SelectionRules
+from .stats import BPFStatsScraper, ProcessMapScraper
+from .tuning import PAGE_SIZE, BufferUsage, PerfBufferTuner, buffer_bytes
+from ..config.settings import settings
+from ..process.toolchain import TOOLCHAIN_STAGE_PATHS, ToolchainGrouper
+from ..process.tracker import InflightTracker
+from ..metrics.prometheus import (
+    BPF_BUFFER_BYTES, BPF_BUFFER_PAGES, BPF_HANDOFF_BATCH_SIZE, BPF_LOST_EVENTS,
+    BPF_PINNED_ENTRIES_REUSED, BPF_PINNED_ORPHANS, BPF_RECEIVED_EVENTS
+)
+
+# 링 버퍼(BPF_MAP_TYPE_RINGBUF)를 지원하는 최소 커널 버전
+RINGBUF_MIN_KERNEL = (5, 8)
+
+# 꼬리 호출 한도(33회) 중 앞 단계 핸들러가 사용하는 횟수를 뺀 청크 수 상한
+ARGV_MAX_CHUNKS_LIMIT = 28
+
+TRANSPORT_RINGBUF = "ringbuf"
+TRANSPORT_PERF = "perf"
+
+# 이벤트 소비 방식
+POLL_MODE_THREAD = "thread"  # 별도 폴링 쓰레드에서 poll 후 배치 전달
+POLL_MODE_LOOP = "loop"      # 이벤트 루프에 fd를 등록하여 루프에서 직접 소비
 
 class BPFCollector:
     """BPF 이벤트 수집 담당"""
@@ -15,27 +50,216 @@ class BPFCollector:
         self.logger = logging.getLogger(__name__)
         self._running = True
         self._loop = asyncio.get_running_loop()
+        self.transport: Optional[str] = None
+        self.received = 0
+        self._batch: List[RawBpfEvent] = []
+        self.argv = ArgvAssembler()
+        self.tracker: Optional[InflightTracker] = None
+        if settings.exec_events:
+            self.tracker = InflightTracker(
+                threshold_sec=settings.long_running_threshold_sec,
+                max_entries=settings.inflight_max_entries,
+                ttl_sec=settings.inflight_ttl_sec,
+            )
+        self.toolchain: Optional[ToolchainGrouper] = None
+        if settings.toolchain_grouping:
+            self.toolchain = ToolchainGrouper(settings.toolchain_max_pending, settings.inflight_ttl_sec)
+        self._reader_fds: List[int] = []
+        self._timer_task: Optional[asyncio.Task] = None
+        self.lost: Dict[int, int] = {}
+        self.tuner = PerfBufferTuner(
+            state_path=settings.perf_buffer_state_path,
+            base_page_cnt=settings.perf_buffer_page_cnt,
+            max_page_cnt=settings.perf_buffer_max_page_cnt,
+            target_loss_rate=settings.perf_buffer_target_loss_rate,
+        )
+        self.perf_page_cnt = self.tuner.base_page_cnt
+        self.allowlist: Optional[ExecAllowlist] = None
+        self.load_report: Optional[LoadReport] = None
+        self._next_allowlist_refresh = 0.0
+        self.selector: Optional[ExecSelector] = None
+        self.pins: Optional[MapPins] = None
+        # 고정 맵에서 이어받은 실행 중 프로세스 수 (퇴출 수 추정 보정)
+        self.inherited_entries = 0
+        self._next_selection_refresh = 0.0
         self.logger.info("[초기화] BPFCollector 초기화 완료")
 
+    @staticmethod
+    def _kernel_version() -> tuple:
+        """실행 중인 커널의 (major, minor) 버전"""
+        try:
+            major, minor = platform.release().split('.')[:2]
+            return int(major), int(''.join(c for c in minor if c.isdigit()) or 0)
+        except ValueError:
+            return (0, 0)
+
+    def _select_transport(self) -> str:
+        """설정과 커널 버전에 따라 이벤트 전송 방식 결정"""
+        if settings.bpf_transport == TRANSPORT_PERF:
+            return TRANSPORT_PERF
+        if settings.bpf_transport == TRANSPORT_RINGBUF:
+            return TRANSPORT_RINGBUF
+
+        kernel = self._kernel_version()
+        if kernel < RINGBUF_MIN_KERNEL:
+            self.logger.info(f"[BPF] 커널 {kernel[0]}.{kernel[1]}은 링 버퍼 미지원, perf 버퍼 사용")
+            return TRANSPORT_PERF
+        return TRANSPORT_RINGBUF
+
+    def _build_cflags(self, transport: str) -> List[str]:
+        """BPF 프로그램 컴파일 옵션 생성"""
+        cflags = [
+            f"-DPROCESS_DATA_MAX_ENTRIES={settings.process_data_max_entries}",
+            f"-DARGV_MAX_CHUNKS={min(settings.argv_max_chunks, ARGV_MAX_CHUNKS_LIMIT)}",
+            f"-DDENTRY_CACHE_SIZE={settings.dentry_cache_size}",
+            f"-DEXEC_RATE_LIMIT={settings.exec_rate_limit}",
+            f"-DEXEC_RATE_BURST={settings.exec_rate_burst}",
+            f"-DDENTRY_CACHE_TTL_NS={settings.dentry_cache_ttl_sec * 1000000000}ULL",
+        ]
+        if settings.kernel_exec_filter:
+            cflags.append("-DEXEC_FILTER")
+        if settings.exec_events:
+            cflags.append("-DEXEC_EVENTS")
+        if settings.cgroup_rules:
+            cflags.append("-DCGROUP_RULES")
+        if self.pins:
+            names = [PROCESS_DATA_PIN]
+            if transport == TRANSPORT_RINGBUF:
+                names.append(EVENTS_PIN)
+            cflags += self.pins.cflags(names)
+        if transport == TRANSPORT_RINGBUF:
+            cflags += [
+                "-DUSE_RINGBUF",
+                f"-DRINGBUF_PAGE_CNT={settings.ringbuf_page_cnt}",
+                f"-DRINGBUF_WAKEUP_BATCH={settings.ringbuf_wakeup_batch}",
+                f"-DRINGBUF_WAKEUP_NS={settings.ringbuf_wakeup_timeout_ms * 1000000}ULL",
+            ]
+        return cflags
+
     def event_callback(self, cpu: int, data: Any, size: int) -> None:
         """BPF 이벤트 콜백
         
-        커널에서 받은 이벤트를 파이썬 이벤트 객체로 변환하여 큐에 전달합니다.
+        커널에서 받은 이벤트를 파이썬 이벤트 객체로 변환하여 배치에 모읍니다.
+        명령줄 인수 청크는 재조립기에 모아 두었다가 EXIT 레코드와 합칩니다.
+        exec 시작 알림은 큐로 보내지 않고 실행 중 프로세스 추적에만 사용합니다.
+        배치는 폴링 한 번이 끝난 뒤 _flush_batch()에서 한꺼번에 큐로 전달됩니다.
+        링 버퍼 콜백은 첫 번째 인자로 CPU 번호 대신 ctx를 전달합니다.
         """
         try:
-            # 커널 구조체를 파이썬 객체로 변환
-            raw_struct = ctypes.cast(data, ctypes.POINTER(RawBpfStruct)).contents
-            # 구조체를 이벤트로 변환
-            raw_event = raw_struct.to_event()
-            
-            # 이벤트 큐에 전달
-            self._loop.call_soon_threadsafe(
-                self.event_queue.put_nowait,
-                raw_event
-            )
+            # 가변 길이 레코드를 파이썬 이벤트로 변환
+            view = record_view(data, size)
+            if self.tracker and record_type(view) == EVENT_EXEC:
+                start = decode_exec(view)
+                self.tracker.start(start.pid, start.hostname, start.binary_path, start.exec_ns)
+                return
+            event = self.argv.feed(view)
+            if event:
+                self._batch.append(event)
         except Exception as e:
             self.logger.error(f"[오류] 콜백 처리 중 오류: {e}")
 
+    def _take_batch(self) -> List[RawBpfEvent]:
+        """모아 둔 이벤트 배치를 꺼내고 수신 메트릭 갱신"""
+        batch, self._batch = self.argv.complete(self._batch), []
+        if batch and self.tracker:
+            for event in batch:
+                self.tracker.finish(event.pid)
+        if batch:
+            self.received += len(batch)
+            BPF_RECEIVED_EVENTS.inc(len(batch))
+            if self.toolchain:
+                # 컴파일 하위 단계는 드라이버 이벤트에 합치고 큐로 보내지 않음
+                batch = self.toolchain.group(batch)
+            BPF_HANDOFF_BATCH_SIZE.observe(len(batch))
+        return batch
+
+    def _flush_batch(self) -> None:
+        """폴링 한 번 동안 모은 이벤트를 한 번의 쓰레드 간 호출로 이벤트 루프에 전달"""
+        batch = self._take_batch()
+        if batch:
+            self._loop.call_soon_threadsafe(self._enqueue_batch, batch)
+
+    def _enqueue_batch(self, batch: List[RawBpfEvent]) -> None:
+        """이벤트 루프에서 배치를 큐에 일괄 추가"""
+        for event in batch:
+            self.event_queue.put_nowait(event)
+
+    def lost_callback(self, cpu: int, lost: int) -> None:
+        """perf 버퍼 유실 콜백
+
+        CPU별 perf 버퍼가 가득 차서 커널이 버린 이벤트 수를 기록합니다.
+        """
+        self.lost[cpu] = self.lost.get(cpu, 0) + lost
+        BPF_LOST_EVENTS.labels(cpu=str(cpu)).inc(lost)
+        self.logger.warning(f"[유실] CPU {cpu} perf 버퍼 오버플로: {lost}개 이벤트 유실")
+
+    def _open_perf_buffer(self) -> None:
+        """CPU별 perf 버퍼 열기
+
+        BCC의 open_perf_buffer는 유실 콜백에 CPU 번호를 넘겨주지 않으므로
+        CPU마다 직접 버퍼를 열어 유실 수를 CPU별로 집계합니다.
+        """
+        if settings.perf_buffer_autotune:
+            self.perf_page_cnt = self.tuner.page_cnt()
+
+        events = self.bpf["events"]
+        cpus = get_online_cpus()
+        for cpu in cpus:
+            events._open_perf_buffer(
+                cpu, self.event_callback, self.perf_page_cnt, partial(self.lost_callback, cpu), 1
+            )
+
+        total = buffer_bytes(self.perf_page_cnt, len(cpus))
+        BPF_BUFFER_PAGES.labels(transport=TRANSPORT_PERF).set(self.perf_page_cnt)
+        BPF_BUFFER_BYTES.labels(transport=TRANSPORT_PERF).set(total)
+        self.logger.info(
+            f"[BPF] perf 버퍼 열기: CPU {len(cpus)}개 x {self.perf_page_cnt} 페이지 "
+            f"(총 {total // 1024} KiB)"
+        )
+
+    def _record_buffer_usage(self) -> None:
+        """perf 버퍼 유실률을 기록하고 다음 실행을 위한 크기 권장"""
+        if self.transport != TRANSPORT_PERF:
+            return
+
+        usage = BufferUsage(
+            page_cnt=self.perf_page_cnt,
+            received=self.received,
+            lost=sum(self.lost.values()),
+        )
+        if usage.lost:
+            cpu_count = len(get_online_cpus())
+            recommended = self.tuner.recommend(usage)
+            self.logger.warning(
+                f"[유실] 유실률 {usage.loss_rate:.4%} (수신={usage.received}, 유실={usage.lost}) - "
+                f"권장 크기 {recommended} 페이지 "
+                f"(총 {buffer_bytes(recommended, cpu_count) // 1024} KiB)"
+            )
+        if settings.perf_buffer_autotune:
+            self.tuner.save(usage)
+
+    def _prepare_kernel_headers(self) -> str:
+        """컴파일에 사용할 커널 헤더 준비 후 로드 경로 반환"""
+        if settings.bpf_header_cache_dir and "BCC_KERNEL_SOURCE" not in os.environ:
+            header_dir = KernelHeaderCache(settings.bpf_header_cache_dir).prepare()
+            if header_dir:
+                # BCC는 이 환경 변수가 있으면 /lib/modules 대신 해당 디렉토리의 헤더를 사용
+                os.environ["BCC_KERNEL_SOURCE"] = header_dir
+        if "BCC_KERNEL_SOURCE" in os.environ:
+            return LOAD_PATH_CACHED_HEADERS
+        return LOAD_PATH_HOST_HEADERS
+
+    def _compile(self, bpf_text: str) -> Tuple[BPF, str]:
+        """선택한 전송 방식으로 컴파일, 링 버퍼 실패 시 perf 버퍼로 대체"""
+        transport = self._select_transport()
+        try:
+            return BPF(text=bpf_text, cflags=self._build_cflags(transport)), transport
+        except Exception as e:
+            if transport != TRANSPORT_RINGBUF:
+                raise
+            self.logger.warning(f"[BPF] 링 버퍼 프로그램 로드 실패, perf 버퍼로 대체: {e}")
+            return BPF(text=bpf_text, cflags=self._build_cflags(TRANSPORT_PERF)), TRANSPORT_PERF
+
     def load_program(self) -> None:
         """BPF 프로그램 로드 및 설정"""
         try:
@@ -44,32 +268,141 @@ class BPFCollector:
             with open(os.path.join(current_dir, 'program.c'), 'r') as f:
                 bpf_text = f.read()
             
-            self.bpf = BPF(text=bpf_text)
+            start = time.monotonic()
+            load_path = self._prepare_kernel_headers()
+            headers_seconds = time.monotonic() - start
+            self.pins = self._prepare_pins(bpf_text)
+            reused = self.pins is not None and self.pins.exists(PROCESS_DATA_PIN)
+            (self.bpf, self.transport), self.load_report = measure_load(
+                load_path, lambda: self._compile(bpf_text), headers_seconds
+            )
+            self.logger.info(f"[BPF] 컴파일 및 로드: {self.load_report}")
+            if self.pins:
+                self._reuse_pinned_maps(reused)
             
             # 핸들러 설정 (새로운 순서)
             handlers = [
                 self.bpf.load_func("init_handler", BPF.TRACEPOINT),
                 self.bpf.load_func("binary_handler", BPF.TRACEPOINT),
                 self.bpf.load_func("cwd_handler", BPF.TRACEPOINT),
-                self.bpf.load_func("args_handler", BPF.TRACEPOINT)
+                self.bpf.load_func("args_handler", BPF.TRACEPOINT),
+                self.bpf.load_func("args_chunk_handler", BPF.TRACEPOINT)
             ]
             
             prog_array = self.bpf.get_table("prog_array")
             for idx, handler in enumerate(handlers):
                 prog_array[idx] = handler
+
+            # 선택 규칙이 비어 있으면 모든 exec를 버리므로 트레이스포인트 연결 전에 채움
+            self.selector = ExecSelector(
+                self.bpf["host_rules"],
+                SelectionRules.from_settings(settings),
+                cgroup_table=self.bpf["cgroup_rules"] if settings.cgroup_rules else None,
+                rules_path=settings.selection_rules_path,
+                cgroup_root=settings.cgroup_root,
+            )
+            self._refresh_selection()
+
+            if settings.kernel_exec_filter:
+                # 트레이스포인트 연결 전에 허용 목록을 채워 시작 직후 유실 방지
+                paths = [p for patterns in settings.PROCESS_PATTERNS.values() for p in patterns]
+                if settings.toolchain_grouping:
+                    # 하위 단계도 통과시켜야 드라이버 이벤트에 단계별 시간을 합칠 수 있음
+                    paths += TOOLCHAIN_STAGE_PATHS
+                self.allowlist = ExecAllowlist(self.bpf["exec_allowlist"], paths)
+                self._refresh_allowlist()
             
-            self.bpf["events"].open_perf_buffer(self.event_callback)
+            if self.transport == TRANSPORT_RINGBUF:
+                self.bpf["events"].open_ring_buffer(self.event_callback)
+                BPF_BUFFER_PAGES.labels(transport=TRANSPORT_RINGBUF).set(settings.ringbuf_page_cnt)
+                BPF_BUFFER_BYTES.labels(transport=TRANSPORT_RINGBUF).set(settings.ringbuf_page_cnt * PAGE_SIZE)
+            else:
+                self._open_perf_buffer()
             self.bpf.attach_tracepoint(tp="sched:sched_process_exec", fn_name="init_handler")
             self.bpf.attach_tracepoint(tp="sched:sched_process_exit", fn_name="exit_handler")
-            self.logger.info("[BPF] 프로그램 로드 완료")
+            self.logger.info(f"[BPF] 프로그램 로드 완료 (전송 방식: {self.transport})")
             
         except Exception as e:
             self.logger.error(f"[오류] BPF 프로그램 로드 실패: {e}")
             raise
 
+    def _refresh_allowlist(self) -> None:
+        """허용 목록 갱신 (새 학생 컨테이너 반영)"""
+        try:
+            self.allowlist.refresh()
+        except Exception as e:
+            self.logger.error(f"[오류] 허용 목록 갱신 실패: {e}")
+        self._next_allowlist_refresh = time.monotonic() + settings.exec_allowlist_refresh_sec
+
+    def _prepare_pins(self, bpf_text: str) -> Optional[MapPins]:
+        """맵 고정 디렉토리 준비 (bpffs가 없으면 고정하지 않음)"""
+        if not settings.bpf_pin_dir:
+            return None
+        version = layout_version(bpf_text, (
+            settings.process_data_max_entries, settings.ringbuf_page_cnt
+        ))
+        pins = MapPins(settings.bpf_pin_dir, version)
+        return pins if pins.prepare() else None
+
+    def _reuse_pinned_maps(self, reused: bool) -> None:
+        """이전 실행의 고정 맵을 이어받고 수집 중단 동안 종료한 프로세스 정리"""
+        self.pins.remove_stale()
+        if not reused:
+            self.logger.info(f"[BPF] 맵 고정: {self.pins.path}")
+            return
+        table = self.bpf["process_data"]
+        orphans = drain_orphans(table)
+        # 종료를 관찰하지 못한 이벤트는 첫 폴링 배치와 함께 전달
+        self._batch.extend(orphans)
+        self.inherited_entries = len(table)
+        BPF_PINNED_ORPHANS.inc(len(orphans))
+        BPF_PINNED_ENTRIES_REUSED.set(self.inherited_entries)
+        self.logger.info(
+            f"[BPF] 고정 맵 재사용: {self.pins.path} "
+            f"(실행 중 {self.inherited_entries}개 이어받음, 재시작 중 종료한 {len(orphans)}개 전송)"
+        )
+
+    def _refresh_selection(self) -> None:
+        """선택 규칙 갱신 (규칙 파일 변경, 새 cgroup 반영)"""
+        try:
+            self.selector.refresh()
+        except Exception as e:
+            self.logger.error(f"[오류] 선택 규칙 갱신 실패: {e}")
+        self._next_selection_refresh = time.monotonic() + settings.selection_refresh_sec
+
+    def _run_maintenance(self) -> None:
+        """폴링 사이에 수행하는 주기 작업"""
+        if self.allowlist and time.monotonic() >= self._next_allowlist_refresh:
+            self._refresh_allowlist()
+        if self.selector and time.monotonic() >= self._next_selection_refresh:
+            self._refresh_selection()
+        if self.tracker:
+            self.tracker.check()
+
+    def stats_scraper(self) -> BPFStatsScraper:
+        """커널 통계 맵을 읽는 메트릭 스크레이퍼 생성"""
+        return BPFStatsScraper(self.bpf["stats"])
+
+    def exec_rate_reporter(self) -> Optional[ExecRateReporter]:
+        """호스트별 exec 억제 횟수를 보고하는 스크레이퍼 생성 (빈도 제한을 끈 경우 None)"""
+        if settings.exec_rate_limit <= 0:
+            return None
+        return ExecRateReporter(self.bpf["exec_rate"])
+
+    def process_map_scraper(self) -> ProcessMapScraper:
+        """process_data 맵 점유율을 읽는 메트릭 스크레이퍼 생성"""
+        return ProcessMapScraper(
+            self.bpf["process_data"], self.bpf["stats"], settings.process_data_max_entries,
+            inherited=self.inherited_entries,
+        )
+
     def start_polling(self) -> None:
-        """폴링 쓰레드 시작"""
+        """이벤트 소비 시작 (폴링 쓰레드 또는 이벤트 루프 리더)"""
         self._running = True
+        if settings.bpf_poll_mode == POLL_MODE_LOOP:
+            self._start_loop_reader()
+            return
+
         self._polling_thread = threading.Thread(
             target=self.run_polling,
             daemon=True
@@ -80,8 +413,11 @@ class BPFCollector:
     def stop_polling(self) -> None:
         """폴링 중지 및 정리"""
         self._running = False
+        if self._reader_fds:
+            self._stop_loop_reader()
         if hasattr(self, '_polling_thread'):
             self._polling_thread.join(timeout=1.0)
+        self._record_buffer_usage()
         self.logger.info("[종료] BPF 폴링 중지")
 
     def run_polling(self) -> None:
@@ -93,9 +429,72 @@ class BPFCollector:
         self.logger.info("[실행] BPF 이벤트 폴링 시작")
         while self._running:
             try:
-                self.bpf.perf_buffer_poll()
+                self.poll()
+                self._run_maintenance()
             except KeyboardInterrupt:
                 self.logger.info("[종료] 키보드 인터럽트로 인한 폴링 종료")
                 break
             except Exception as e:
-                self.logger.error(f"[오류] BPF 폴링 중 오류 발생: {e}") 
\ No newline at end of file
+                self.logger.error(f"[오류] BPF 폴링 중 오류 발생: {e}")
+
+    def poll(self) -> None:
+        """전송 방식에 맞춰 한 번 폴링"""
+        if self.transport == TRANSPORT_RINGBUF:
+            # 커널은 배치가 차거나 타임아웃이 지났을 때만 깨우므로,
+            # 타임아웃 후에는 깨우기 없이 제출된 나머지 이벤트를 직접 소비
+            self.bpf.ring_buffer_poll(settings.bpf_poll_timeout_ms)
+            self.bpf.ring_buffer_consume()
+        else:
+            self.bpf.perf_buffer_poll(timeout=settings.bpf_poll_timeout_ms)
+        self._flush_batch()
+
+    def _event_fds(self) -> List[int]:
+        """이벤트 버퍼의 poll 가능한 fd 목록
+
+        링 버퍼는 맵 fd 하나, perf 버퍼는 CPU별 리더 fd를 사용합니다.
+        """
+        if self.transport == TRANSPORT_RINGBUF:
+            return [self.bpf["events"].map_fd]
+        return [lib.perf_reader_fd(reader) for reader in self.bpf.perf_buffers.values()]
+
+    def _consume_ready(self) -> None:
+        """준비된 이벤트를 이벤트 루프에서 바로 소비"""
+        try:
+            if self.transport == TRANSPORT_RINGBUF:
+                self.bpf.ring_buffer_consume()
+            else:
+                self.bpf.perf_buffer_consume()
+        except Exception as e:
+            self.logger.error(f"[오류] BPF 이벤트 소비 중 오류 발생: {e}")
+        batch = self._take_batch()
+        if batch:
+            self._enqueue_batch(batch)
+
+    def _start_loop_reader(self) -> None:
+        """이벤트 버퍼 fd를 이벤트 루프에 등록 (폴링 쓰레드 없음)"""
+        if not self.bpf:
+            self.logger.error("[오류] BPF 프로그램이 로드되지 않음")
+            raise RuntimeError("BPF program not loaded")
+
+        self._reader_fds = self._event_fds()
+        for fd in self._reader_fds:
+            self._loop.add_reader(fd, self._consume_ready)
+        self._timer_task = self._loop.create_task(self._run_loop_timer())
+        self.logger.info(f"[시작] BPF 이벤트 루프 리더 등록 (fd {len(self._reader_fds)}개)")
+
+    async def _run_loop_timer(self) -> None:
+        """깨우기 없이 제출된 이벤트 소비와 주기 작업 실행"""
+        while self._running:
+            await asyncio.sleep(settings.bpf_poll_timeout_ms / 1000)
+            self._consume_ready()
+            await asyncio.to_thread(self._run_maintenance)
+
+    def _stop_loop_reader(self) -> None:
+        """등록한 fd를 해제하고 남은 이벤트를 마저 소비"""
+        for fd in self._reader_fds:
+            self._loop.remove_reader(fd)
+        self._reader_fds = []
+        if self._timer_task:
+            self._timer_task.cancel()
+            self._timer_task = None
+        self._consume_ready()
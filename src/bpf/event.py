@@ -1,47 +1,253 @@
 import ctypes
-from dataclasses import dataclass
+import os
+import struct
+from dataclasses import dataclass, field
+from typing import Dict, Optional
 
 # 상수 정의
 UTS_LEN = 65
 MAX_PATH_LEN = 256
 ARGSIZE = 256
 
+# 커널이 최대 RSS를 페이지 단위로 기록하므로 KiB로 변환할 때 사용
+PAGE_KB = os.sysconf("SC_PAGE_SIZE") // 1024
+
+# 레코드 타입 (program.c의 EVENT_* 와 일치)
+EVENT_EXIT = 1
+EVENT_ARGS_CHUNK = 2
+EVENT_EXEC = 3
+
+# 에러 플래그 (program.c의 ERR_* 와 일치)
+ERR_ARGS_TOO_LONG = 0x00000004
+ERR_EXIT_UNOBSERVED = 0x00000008
+
+# 종료를 관찰하지 못해 알 수 없는 종료 코드
+EXIT_CODE_UNKNOWN = -1
+
 class RawBpfStruct(ctypes.Structure):
-    """BPF 커널 이벤트 구조체
-    
-    커널 공간과 통신하기 위한 C 구조체입니다.
+    """BPF 커널 이벤트 레코드 헤더
+
+    커널 공간과 통신하기 위한 C 구조체입니다 (program.c의 struct event_hdr_t).
+    헤더 뒤에 hostname, binary_path, cwd, args가 NUL 없이 각 길이만큼 이어집니다.
+    ARGS_CHUNK 레코드는 args 조각만 담으며, chunk는 순번입니다.
     이 구조체는 직접 수정하지 말고, 항상 RawBpfEvent를 통해 접근하세요.
     """
     _fields_ = [
+        ("type", ctypes.c_uint16),                    # 2 bytes
+        ("hostname_len", ctypes.c_uint16),            # 2 bytes
+        ("binary_path_len", ctypes.c_uint16),         # 2 bytes
+        ("cwd_len", ctypes.c_uint16),                 # 2 bytes
+        ("args_len", ctypes.c_uint16),                # 2 bytes
+        ("chunk", ctypes.c_uint16),                   # 2 bytes (EXIT: 청크 수)
         ("pid", ctypes.c_uint32),                     # 4 bytes
         ("error_flags", ctypes.c_uint32),             # 4 bytes
-        ("hostname", ctypes.c_char * UTS_LEN),        # 65 bytes
-        ("binary_path", ctypes.c_ubyte * MAX_PATH_LEN),  # 256 bytes
-        ("cwd", ctypes.c_ubyte * MAX_PATH_LEN),         # 256 bytes
-        ("args", ctypes.c_ubyte * ARGSIZE),             # 256 bytes
-        ("binary_path_offset", ctypes.c_int),         # 4 bytes
-        ("cwd_offset", ctypes.c_int),                 # 4 bytes
-        ("args_len", ctypes.c_uint32),                # 4 bytes
-        ("exit_code", ctypes.c_int)                   # 4 bytes
-    ]                                                 # 총 857 bytes
+        ("exit_code", ctypes.c_int),                  # 4 bytes
+        ("exec_ns", ctypes.c_uint64),                 # 8 bytes (CLOCK_MONOTONIC)
+        ("exit_ns", ctypes.c_uint64),                 # 8 bytes (EXIT 레코드만)
+        ("utime_ns", ctypes.c_uint64),                # 8 bytes (EXIT 레코드만, 이하 동일)
+        ("stime_ns", ctypes.c_uint64),                # 8 bytes
+        ("maxrss_pages", ctypes.c_uint64),            # 8 bytes
+        ("nvcsw", ctypes.c_uint64),                   # 8 bytes
+        ("nivcsw", ctypes.c_uint64),                  # 8 bytes
+        ("ppid", ctypes.c_uint32),                    # 4 bytes (EXEC, EXIT 레코드)
+        ("pad", ctypes.c_uint32),                     # 4 bytes
+    ]                                                 # 총 88 bytes
+
+    @property
+    def payload_len(self) -> int:
+        """헤더 뒤에 이어지는 가변 길이 필드의 전체 길이"""
+        return self.hostname_len + self.binary_path_len + self.cwd_len + self.args_len
 
     def to_event(self) -> 'RawBpfEvent':
-        """구조체를 이벤트 객체로 변환"""
+        """구조체와 뒤따르는 필드를 이벤트 객체로 변환"""
+        payload = ctypes.string_at(ctypes.addressof(self) + ctypes.sizeof(self), self.payload_len)
+        cwd_start = self.hostname_len + self.binary_path_len
+        args_start = cwd_start + self.cwd_len
         return RawBpfEvent(
             pid=self.pid,
             error_flags=bin(self.error_flags),
-            hostname=self.hostname.decode(),
-            binary_path=bytes(self.binary_path[self.binary_path_offset:]).strip(b'\0').decode('utf-8'),
-            cwd=bytes(self.cwd[self.cwd_offset:]).strip(b'\0').decode('utf-8'),
-            args=' '.join(arg.decode('utf-8', errors='replace') 
-                         for arg in bytes(self.args[:self.args_len]).split(b'\0') if arg),
-            exit_code=self.exit_code
+            hostname=payload[:self.hostname_len].decode(),
+            binary_path=payload[self.hostname_len:cwd_start].decode('utf-8'),
+            cwd=payload[cwd_start:args_start].decode('utf-8'),
+            args=' '.join(arg.decode('utf-8', errors='replace')
+                         for arg in payload[args_start:].split(b'\0') if arg),
+            exit_code=self.exit_code,
+            exec_ns=self.exec_ns,
+            exit_ns=self.exit_ns,
+            utime_ns=self.utime_ns,
+            stime_ns=self.stime_ns,
+            maxrss_kb=self.maxrss_pages * PAGE_KB,
+            nvcsw=self.nvcsw,
+            nivcsw=self.nivcsw,
+            ppid=self.ppid,
         )
 
+# RawBpfStruct와 같은 레이아웃의 헤더 포맷 (콜백 경로에서 ctypes 객체 생성 없이 사용)
+HEADER = struct.Struct('<HHHHHHIIiQQQQQQQI4x')
+HEADER_SIZE = HEADER.size
+assert HEADER_SIZE == ctypes.sizeof(RawBpfStruct)
+
+_RECORD_TYPE = struct.Struct('<H')
+
+def record_type(buf) -> int:
+    """레코드 헤더의 타입"""
+    return _RECORD_TYPE.unpack_from(buf)[0]
+
+def decode_exec(buf) -> 'ExecStart':
+    """EXEC 레코드를 exec 시작 알림으로 변환
+
+    Raises:
+        ValueError: EXEC 레코드가 아니거나 헤더에 기록된 길이보다 짧은 경우
+    """
+    view = memoryview(buf)
+    if len(view) < HEADER_SIZE:
+        raise ValueError(f"레코드 크기가 헤더보다 작음: {len(view)}")
+
+    (record_type, hostname_len, binary_path_len, _, _, _, pid, _, _,
+     exec_ns, *_) = HEADER.unpack_from(view)
+    if record_type != EVENT_EXEC:
+        raise ValueError(f"EXEC 레코드가 아님: {record_type}")
+
+    binary_path_start = HEADER_SIZE + hostname_len
+    end = binary_path_start + binary_path_len
+    if len(view) < end:
+        raise ValueError(f"레코드가 잘림: size={len(view)}, 필요={end}")
+
+    return ExecStart(
+        pid=pid,
+        hostname=str(view[HEADER_SIZE:binary_path_start], 'utf-8'),
+        binary_path=str(view[binary_path_start:end], 'utf-8'),
+        exec_ns=exec_ns,
+    )
+
+def decode_record(buf, args_tail: bytes = b'', extra_flags: int = 0) -> 'RawBpfEvent':
+    """레코드 버퍼(bytes, memoryview 등)를 이벤트로 변환
+
+    헤더는 struct로 한 번에 읽고, 각 필드는 헤더의 길이로 계산한 오프셋에서
+    memoryview 슬라이스를 바로 문자열로 디코딩하여 중간 bytes 복사를 만들지 않습니다.
+
+    Args:
+        buf: EXIT 레코드
+        args_tail: ARGS_CHUNK 레코드로 받은 뒷부분 명령줄 인수
+        extra_flags: 사용자 공간에서 추가할 에러 플래그
+
+    Raises:
+        ValueError: 알 수 없는 레코드 타입이거나 헤더에 기록된 길이보다 짧은 경우
+    """
+    view = memoryview(buf)
+    if len(view) < HEADER_SIZE:
+        raise ValueError(f"레코드 크기가 헤더보다 작음: {len(view)}")
+
+    (record_type, hostname_len, binary_path_len, cwd_len, args_len, _,
+     pid, error_flags, exit_code, exec_ns, exit_ns,
+     utime_ns, stime_ns, maxrss_pages, nvcsw, nivcsw, ppid) = HEADER.unpack_from(view)
+    if record_type != EVENT_EXIT:
+        raise ValueError(f"알 수 없는 레코드 타입: {record_type}")
+
+    binary_path_start = HEADER_SIZE + hostname_len
+    cwd_start = binary_path_start + binary_path_len
+    args_start = cwd_start + cwd_len
+    end = args_start + args_len
+    if len(view) < end:
+        raise ValueError(f"레코드가 잘림: size={len(view)}, 필요={end}")
+
+    if args_tail:
+        args = str(bytes(view[args_start:end]) + args_tail, 'utf-8', 'replace')
+    else:
+        args = str(view[args_start:end], 'utf-8', 'replace')
+    return RawBpfEvent(
+        pid=pid,
+        error_flags=bin(error_flags | extra_flags),
+        hostname=str(view[HEADER_SIZE:binary_path_start], 'utf-8'),
+        binary_path=str(view[binary_path_start:cwd_start], 'utf-8'),
+        cwd=str(view[cwd_start:args_start], 'utf-8'),
+        args=' '.join(arg for arg in args.split('\0') if arg),
+        exit_code=exit_code,
+        exec_ns=exec_ns,
+        exit_ns=exit_ns,
+        utime_ns=utime_ns,
+        stime_ns=stime_ns,
+        maxrss_kb=maxrss_pages * PAGE_KB,
+        nvcsw=nvcsw,
+        nivcsw=nivcsw,
+        ppid=ppid,
+    )
+
+def _raw_field(value: ctypes.Structure, name: str) -> bytes:
+    """구조체 필드의 원본 바이트 (ctypes char 배열은 첫 NUL에서 잘리므로 직접 읽음)"""
+    field = getattr(type(value), name)
+    return ctypes.string_at(ctypes.addressof(value) + field.offset, field.size)
+
+
+def decode_process_data(value: ctypes.Structure) -> 'RawBpfEvent':
+    """process_data 맵 값(struct data_t)을 종료를 관찰하지 못한 이벤트로 변환
+
+    수집기 재시작 중에 종료한 프로세스는 exec 시점 정보만 남아 있으므로,
+    종료 코드, 종료 시각, 자원 사용량 없이 ERR_EXIT_UNOBSERVED 플래그를 붙입니다.
+    ARGSIZE를 넘는 명령줄 인수의 나머지 조각은 이전 수집기가 받았으므로 잘립니다.
+    """
+    mask = MAX_PATH_LEN - 1
+    binary_path_offset = value.binary_path_offset & mask
+    cwd_offset = value.cwd_offset & mask
+    # 경로는 버퍼 끝(MAX_PATH_LEN - 1)에 맞춰 오른쪽 정렬되어 있음
+    binary_path = _raw_field(value, 'binary_path')[binary_path_offset:mask]
+    cwd = _raw_field(value, 'cwd')[cwd_offset:mask]
+    hostname = _raw_field(value, 'hostname')[:min(value.hostname_len, UTS_LEN)]
+    args = _raw_field(value, 'args')[:min(value.args_len, ARGSIZE)]
+
+    error_flags = value.error_flags | ERR_EXIT_UNOBSERVED
+    if value.args_chunks:
+        error_flags |= ERR_ARGS_TOO_LONG
+    return RawBpfEvent(
+        pid=value.pid,
+        error_flags=bin(error_flags),
+        hostname=str(hostname, 'utf-8', 'replace'),
+        binary_path=str(binary_path, 'utf-8', 'replace'),
+        cwd=str(cwd, 'utf-8', 'replace'),
+        args=' '.join(arg for arg in str(args, 'utf-8', 'replace').split('\0') if arg),
+        exit_code=EXIT_CODE_UNKNOWN,
+        exec_ns=value.exec_ns,
+        ppid=value.ppid,
+    )
+
+def record_view(data: int, size: int) -> memoryview:
+    """콜백 버퍼(주소, 크기)를 복사 없이 memoryview로 감싸기 (콜백 안에서만 유효)"""
+    return memoryview((ctypes.c_ubyte * size).from_address(data)).cast('B')
+
+def decode_event(data: int, size: int) -> 'RawBpfEvent':
+    """콜백 버퍼(주소, 크기)의 레코드를 복사 없이 이벤트로 변환"""
+    return decode_record(record_view(data, size))
+
+def encode_event(event: 'RawBpfEvent') -> bytes:
+    """이벤트를 커널 레코드 형식으로 직렬화 (테스트 및 벤치마크용)"""
+    hostname = event.hostname.encode()
+    binary_path = event.binary_path.encode()
+    cwd = event.cwd.encode()
+    args = event.args.replace(' ', '\0').encode() + b'\0' if event.args else b''
+    header = RawBpfStruct(
+        type=EVENT_EXIT,
+        hostname_len=len(hostname),
+        binary_path_len=len(binary_path),
+        cwd_len=len(cwd),
+        args_len=len(args),
+        pid=event.pid,
+        error_flags=int(event.error_flags, 2),
+        exit_code=event.exit_code,
+        exec_ns=event.exec_ns,
+        exit_ns=event.exit_ns,
+        utime_ns=event.utime_ns,
+        stime_ns=event.stime_ns,
+        maxrss_pages=event.maxrss_kb // PAGE_KB,
+        nvcsw=event.nvcsw,
+        nivcsw=event.nivcsw,
+        ppid=event.ppid,
+    )
+    return bytes(header) + hostname + binary_path + cwd + args
+
 @dataclass(frozen=True)
 class RawBpfEvent:
     """BPF 이벤트 기본 데이터 클래스
-    
+
     커널 공간의 RawBpfStruct를 파이썬 친화적인 형태로 변환한 클래스입니다.
     이 클래스는 커널에서 받은 원시 데이터를 나타내며, 불변 객체입니다.
     """
@@ -52,3 +258,39 @@ class RawBpfEvent:
     error_flags: str       # BPF 프로그램 에러 플래그
     exit_code: int         # 프로세스 종료 코드
     hostname: str          # 호스트 이름 (예: "jcode-os-1-202012180-hash")
+    exec_ns: int = 0       # exec 시각 (커널 CLOCK_MONOTONIC 나노초, 0이면 알 수 없음)
+    exit_ns: int = 0       # 종료 시각 (커널 CLOCK_MONOTONIC 나노초)
+    # 자원 사용량 (쓰레드 그룹 전체, getrusage(RUSAGE_SELF)와 같은 기준)
+    utime_ns: int = 0      # 사용자 모드 CPU 시간
+    stime_ns: int = 0      # 커널 모드 CPU 시간
+    maxrss_kb: int = 0     # 최대 RSS (KiB)
+    nvcsw: int = 0         # 자발적 문맥 교환 횟수
+    nivcsw: int = 0        # 비자발적 문맥 교환 횟수
+    ppid: int = 0          # exec 시점의 부모 프로세스 ID
+    # 컴파일러 드라이버에 합쳐진 하위 단계별 실행 시간 (cc1, as, ld 등, 밀리초)
+    phases_ms: Dict[str, float] = field(default_factory=dict, hash=False)
+    # 이전 실행이 스풀에 저장한 이벤트를 복구한 경우 (종료 시각 기준 지연 측정에서 제외)
+    replayed: bool = field(default=False, compare=False)
+
+    @property
+    def runtime_ms(self) -> Optional[float]:
+        """프로세스 실행 시간 (종료 - exec, 밀리초)"""
+        if not self.exec_ns or not self.exit_ns:
+            return None
+        return (self.exit_ns - self.exec_ns) / 1e6
+
+    @property
+    def cpu_ms(self) -> float:
+        """CPU 사용 시간 (사용자 + 커널, 밀리초)"""
+        return (self.utime_ns + self.stime_ns) / 1e6
+
+@dataclass(frozen=True)
+class ExecStart:
+    """exec 시작 알림
+
+    종료 이벤트와 달리 핸들러 체인으로 보내지 않고, 실행 중인 프로세스 추적에만 사용합니다.
+    """
+    pid: int                # 프로세스 ID
+    hostname: str          # 호스트 이름
+    binary_path: str        # 실행 파일 경로
+    exec_ns: int = 0        # exec 시각 (커널 CLOCK_MONOTONIC 나노초)
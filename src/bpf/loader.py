@@ -0,0 +1,155 @@
+"""BPF 프로그램 로드 보조 기능
+
+BCC는 시작할 때마다 program.c를 내장 clang/LLVM으로 컴파일합니다.
+BCC 파이썬 바인딩은 미리 빌드한 오브젝트를 로드하거나 컴파일 결과를 재사용할 수 없으므로
+(컴파일 결과에 그 프로세스의 맵 fd가 들어감) 이 모듈은 컴파일 자체를 없애지 못하며,
+clang 컴파일 시간과 LLVM 메모리는 모든 경로에서 그대로 듭니다. 다루는 부분은 다음과 같습니다.
+
+- 커널 헤더 캐시: /sys/kernel/kheaders.tar.xz를 커널 릴리스별 디렉토리에 한 번만 풀어 두고
+  BCC_KERNEL_SOURCE로 지정합니다. BCC도 kheaders를 /tmp에 풀지만 컨테이너의 /tmp는
+  파드마다 새로 만들어지므로, 상태 볼륨에 풀어 두면 파드 재시작 때 압축 해제를 반복하지 않습니다.
+  kheaders가 없는 커널에서는 호스트 헤더를 사용하므로 /usr/src, /lib/modules 마운트는 필요합니다.
+- 컴파일 후 메모리 반환: LLVM이 사용한 힙을 malloc_trim으로 운영체제에 돌려줍니다.
+- 헤더 준비 시간, 컴파일 및 로드 시간과 RSS를 헤더 출처(경로)별로 기록합니다.
+"""
+
+import ctypes
+import os
+import platform
+import shutil
+import tarfile
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple, TypeVar
+
+from ..metrics.prometheus import BPF_LOAD_RSS_BYTES, BPF_LOAD_SECONDS
+from ..utils.logging import get_logger
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+# 커널이 제공하는 헤더 압축 파일 (CONFIG_IKHEADERS)
+KHEADERS_ARCHIVE = "/sys/kernel/kheaders.tar.xz"
+
+# 로드 경로: 컴파일에 사용한 헤더 출처 (메트릭 라벨, 두 경로 모두 clang으로 컴파일)
+LOAD_PATH_CACHED_HEADERS = "cached_headers"  # 캐시한 kheaders로 컴파일
+LOAD_PATH_HOST_HEADERS = "host_headers"      # 호스트 마운트 헤더로 컴파일
+
+# 압축 해제가 끝났음을 표시하는 파일 (중간에 중단된 디렉토리는 재사용하지 않음)
+_COMPLETE_MARKER = ".complete"
+
+T = TypeVar("T")
+
+
+def rss_bytes() -> int:
+    """현재 프로세스의 RSS (바이트)"""
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * PAGE_SIZE
+
+
+def release_compiler_memory() -> bool:
+    """컴파일 중 늘어난 힙을 운영체제에 반환 (glibc 전용)"""
+    try:
+        return bool(ctypes.CDLL("libc.so.6").malloc_trim(0))
+    except (OSError, AttributeError):
+        return False
+
+
+class KernelHeaderCache:
+    """커널 릴리스별 kheaders 압축 해제 캐시"""
+
+    def __init__(self, cache_dir: str, release: Optional[str] = None,
+                 archive: str = KHEADERS_ARCHIVE):
+        self.cache_dir = cache_dir
+        self.release = release or platform.release()
+        self.archive = archive
+        self.logger = get_logger(__name__)
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.cache_dir, self.release)
+
+    def is_ready(self) -> bool:
+        return os.path.exists(os.path.join(self.path, _COMPLETE_MARKER))
+
+    def prepare(self) -> Optional[str]:
+        """캐시된 헤더 디렉토리 반환, 없으면 압축 해제하여 생성
+
+        Returns:
+            헤더 디렉토리 경로, kheaders를 사용할 수 없으면 None
+        """
+        if self.is_ready():
+            return self.path
+        if not os.path.exists(self.archive):
+            self.logger.info(f"[BPF] {self.archive} 없음, 호스트 커널 헤더 사용")
+            return None
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_dir = tempfile.mkdtemp(prefix=f".{self.release}-", dir=self.cache_dir)
+            try:
+                self._extract(tmp_dir)
+                open(os.path.join(tmp_dir, _COMPLETE_MARKER), "w").close()
+                if os.path.exists(self.path):
+                    # 중단된 이전 압축 해제 결과 정리
+                    shutil.rmtree(self.path)
+                os.rename(tmp_dir, self.path)
+            finally:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+        except OSError as e:
+            self.logger.warning(f"[BPF] 커널 헤더 캐시 생성 실패: {e}")
+            return self.path if self.is_ready() else None
+
+        self.logger.info(f"[BPF] 커널 헤더 캐시 생성: {self.path}")
+        return self.path
+
+    def _extract(self, target: str) -> None:
+        with tarfile.open(self.archive, "r:xz") as tar:
+            if hasattr(tarfile, "data_filter"):
+                tar.extractall(target, filter="data")
+            else:
+                tar.extractall(target)
+
+
+@dataclass
+class LoadReport:
+    """BPF 프로그램 로드 경로별 비용"""
+    path: str
+    seconds: float      # clang 컴파일 및 로드 시간 (헤더 준비 제외)
+    rss_before: int     # 로드 전 RSS (바이트)
+    rss_loaded: int     # 컴파일 및 로드 직후 RSS
+    rss_trimmed: int    # 컴파일러 메모리 반환 후 RSS
+    headers_seconds: float = 0.0  # 커널 헤더 준비 시간 (kheaders 압축 해제 포함)
+
+    def __str__(self) -> str:
+        mib = 1024 * 1024
+        return (
+            f"경로={self.path} 헤더 준비={self.headers_seconds:.2f}s 컴파일={self.seconds:.2f}s "
+            f"RSS {self.rss_before // mib}MiB -> {self.rss_loaded // mib}MiB "
+            f"(반환 후 {self.rss_trimmed // mib}MiB)"
+        )
+
+
+def measure_load(path: str, load: Callable[[], T],
+                 headers_seconds: float = 0.0) -> Tuple[T, LoadReport]:
+    """load()를 실행하며 소요 시간과 RSS를 측정하고 메트릭에 기록
+
+    Args:
+        path: 로드 경로 (헤더 출처)
+        load: 컴파일 및 로드 함수
+        headers_seconds: load() 전에 걸린 헤더 준비 시간
+    """
+    rss_before = rss_bytes()
+    start = time.monotonic()
+    result = load()
+    seconds = time.monotonic() - start
+    rss_loaded = rss_bytes()
+    release_compiler_memory()
+
+    report = LoadReport(path, seconds, rss_before, rss_loaded, rss_bytes(), headers_seconds)
+    BPF_LOAD_SECONDS.labels(path=path, stage="headers").set(report.headers_seconds)
+    BPF_LOAD_SECONDS.labels(path=path, stage="compile").set(report.seconds)
+    BPF_LOAD_RSS_BYTES.labels(path=path, stage="before").set(report.rss_before)
+    BPF_LOAD_RSS_BYTES.labels(path=path, stage="loaded").set(report.rss_loaded)
+    BPF_LOAD_RSS_BYTES.labels(path=path, stage="trimmed").set(report.rss_trimmed)
+    return result, report
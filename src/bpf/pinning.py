@@ -0,0 +1,146 @@
+"""BPF 맵 고정 (bpffs)
+
+감시 파드가 재시작되면 BPF 프로그램이 분리되고 process_data 맵도 사라져, 재시작 전에
+exec하고 재시작 후에 종료한 프로세스의 이벤트가 모두 유실됩니다. process_data와
+링 버퍼를 bpffs에 고정해 두면 새 프로세스가 같은 맵을 다시 사용하므로,
+
+- 재시작 전에 exec한 프로세스의 종료 이벤트를 재시작 후에도 전송하고
+- 소비자가 없던 동안 링 버퍼에 남은 레코드를 이어서 읽습니다.
+
+맵 레이아웃(struct data_t, 레코드 헤더, 맵 크기)이 바뀐 업그레이드에서는 이전 맵을
+재사용할 수 없으므로, 레이아웃 해시별 하위 디렉토리에 고정하고 다른 버전은 정리합니다.
+perf 버퍼는 프로세스의 perf 이벤트 fd에 묶여 있어 고정해도 레코드가 보존되지 않으므로
+링 버퍼 전송 방식에서만 고정합니다.
+"""
+
+import hashlib
+import os
+import re
+import shutil
+from typing import Iterable, List
+
+from .event import RawBpfEvent, decode_process_data
+from ..utils.logging import get_logger
+
+PROCESS_DATA_PIN = "process_data"
+EVENTS_PIN = "events"
+
+# 고정한 맵의 값/레코드 레이아웃을 결정하는 program.c 구조체
+_LAYOUT_STRUCTS = ("data_t", "event_hdr_t")
+
+
+def is_bpffs(path: str, mounts: str = "/proc/self/mounts") -> bool:
+    """path가 bpffs 마운트 아래에 있는지 확인"""
+    path = os.path.realpath(path)
+    best, fs_type = "", None
+    try:
+        with open(mounts) as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                mount_point = fields[1].replace("\\040", " ")
+                if (path == mount_point or path.startswith(mount_point.rstrip("/") + "/")) \
+                        and len(mount_point) > len(best):
+                    best, fs_type = mount_point, fields[2]
+    except OSError:
+        return False
+    return fs_type == "bpf"
+
+
+def layout_version(bpf_text: str, sizes: Iterable[object]) -> str:
+    """고정 맵 레이아웃 해시 (구조체 정의와 맵 크기가 같으면 같은 값)"""
+    digest = hashlib.sha1()
+    for name in _LAYOUT_STRUCTS:
+        match = re.search(rf"struct {name} \{{.*?\}};", bpf_text, re.DOTALL)
+        if not match:
+            raise ValueError(f"program.c에 struct {name} 정의가 없음")
+        # 주석과 공백 차이는 레이아웃에 영향이 없으므로 제외
+        body = re.sub(r"//[^\n]*", "", match.group(0))
+        digest.update(" ".join(body.split()).encode())
+    for size in sizes:
+        digest.update(f"|{size}".encode())
+    return digest.hexdigest()[:12]
+
+
+class MapPins:
+    """레이아웃 버전별 고정 맵 디렉토리"""
+
+    def __init__(self, base_dir: str, version: str):
+        self.base_dir = base_dir
+        self.version = version
+        self.logger = get_logger(__name__)
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.base_dir, self.version)
+
+    def pin_path(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    def exists(self, name: str) -> bool:
+        """이전 실행이 고정한 맵이 있는지 확인"""
+        return os.path.exists(self.pin_path(name))
+
+    def prepare(self) -> bool:
+        """고정 디렉토리 생성
+
+        Returns:
+            bpffs에 고정할 수 있으면 True
+        """
+        if not is_bpffs(self.base_dir if os.path.exists(self.base_dir)
+                        else os.path.dirname(self.base_dir)):
+            self.logger.warning(f"[BPF] {self.base_dir}가 bpffs가 아님, 맵 고정 사용 안 함")
+            return False
+        try:
+            os.makedirs(self.path, exist_ok=True)
+        except OSError as e:
+            self.logger.warning(f"[BPF] 맵 고정 디렉토리 생성 실패: {e}")
+            return False
+        return True
+
+    def cflags(self, names: Iterable[str]) -> List[str]:
+        """program.c의 <이름>_PIN 매크로 (BPF_TABLE_PINNED 경로)"""
+        return [f'-D{name.upper()}_PIN="{self.pin_path(name)}"' for name in names]
+
+    def remove_stale(self) -> List[str]:
+        """다른 레이아웃 버전의 고정 맵 제거 (참조가 없어지면 커널이 해제)"""
+        removed = []
+        try:
+            entries = os.listdir(self.base_dir)
+        except OSError:
+            return removed
+        for entry in entries:
+            if entry == self.version:
+                continue
+            shutil.rmtree(os.path.join(self.base_dir, entry), ignore_errors=True)
+            removed.append(entry)
+        if removed:
+            self.logger.info(f"[BPF] 이전 레이아웃의 고정 맵 정리: {removed}")
+        return removed
+
+
+def drain_orphans(table, proc_root: str = "/proc") -> List[RawBpfEvent]:
+    """소비자가 없던 동안 종료한 프로세스의 process_data 항목을 이벤트로 바꾸고 삭제
+
+    재시작 사이에 종료한 프로세스는 종료 핸들러가 실행되지 않아 항목이 남으므로,
+    더 이상 존재하지 않는 PID의 항목을 종료를 관찰하지 못한 이벤트(ERR_EXIT_UNOBSERVED)로
+    바꿔 전송하고, 항목은 지워 LRU 공간을 돌려받습니다.
+
+    Returns:
+        삭제한 항목의 이벤트 (변환에 실패한 항목은 삭제만 함)
+    """
+    logger = get_logger(__name__)
+    events = []
+    for key, value in list(table.items()):
+        if os.path.exists(os.path.join(proc_root, str(key.value))):
+            continue
+        try:
+            events.append(decode_process_data(value))
+        except (AttributeError, TypeError, ValueError) as e:
+            logger.warning(f"[BPF] PID {key.value}의 process_data 항목 변환 실패: {e}")
+        try:
+            del table[key]
+        except KeyError:
+            pass
+    return events
@@ -1,5 +1,6 @@
 #include <uapi/linux/ptrace.h>
 #include <linux/sched.h>
+#include <linux/sched/signal.h>
 #include <linux/nsproxy.h>
 #include <linux/dcache.h>
 #include <linux/fs.h>
@@ -18,7 +19,91 @@
 #define ERR_DENTRY_TOO_DEEP   0x00000001  // dentry 깊이가 MAX_DENTRY_LEVEL 초과
 #define ERR_DNAME_TOO_LONG    0x00000002  // 개별 dname 길이가 MAX_DNAME_LEN 초과
 #define ERR_ARGS_TOO_LONG     0x00000004  // 명령줄 인수가 ARGSIZE 초과
-
+#define ERR_EXIT_UNOBSERVED   0x00000008  // 수집기 재시작 중 종료 (사용자 공간에서 설정, 종료 코드/시각/자원 사용량 없음)
+
+// 통계 카운터 인덱스 (src/bpf/stats.py의 STAT_NAMES와 순서 일치)
+#define STAT_EXEC_FORWARDED   0  // 커널 필터를 통과해 수집된 exec
+#define STAT_EXEC_DROPPED     1  // 커널 필터에서 버려진 exec
+#define STAT_PROC_INSERTED    2  // process_data에 새로 추가된 항목
+#define STAT_PROC_INSERT_FAIL 3  // process_data 추가 실패
+#define STAT_PROC_DELETED     4  // process_data에서 삭제된 항목
+#define STAT_DENTRY_CACHE_HIT 5  // 경로 캐시 적중
+#define STAT_DENTRY_CACHE_MISS 6 // 경로 캐시 실패 (dentry 순회 수행)
+#define STAT_THREAD_EXIT_SKIPPED 7 // 마지막 쓰레드가 아니어서 건너뛴 종료
+#define STAT_EXEC_THROTTLED   8  // 호스트별 실행 빈도 제한으로 버려진 exec
+#define STAT_EXEC_SEEN        9  // init_handler에 들어온 모든 exec
+#define STAT_EXEC_NOT_SELECTED 10 // 호스트네임/cgroup 선택 규칙에서 제외된 exec
+#define STAT_BINARY_FAILED    11 // binary_handler 단계 실패
+#define STAT_CWD_FAILED       12 // cwd_handler 단계 실패
+#define STAT_ARGS_FAILED      13 // args_handler 단계 실패
+#define STAT_TAIL_CALL_FAILED 14 // 꼬리 호출 실패 (다음 단계로 넘어가지 못함)
+#define STAT_EXIT_SUBMITTED   15 // 사용자 공간으로 전송한 종료 레코드
+#define STAT_EXIT_FAILED      16 // 종료 레코드 조립 실패
+#define STAT_ERR_DENTRY_TOO_DEEP 17 // 전송한 레코드 중 ERR_DENTRY_TOO_DEEP
+#define STAT_ERR_DNAME_TOO_LONG  18 // 전송한 레코드 중 ERR_DNAME_TOO_LONG
+#define STAT_ERR_ARGS_TOO_LONG   19 // 전송한 레코드 중 ERR_ARGS_TOO_LONG
+#define STAT_SUBMIT_FAILED    20 // 버퍼가 가득 차 전송하지 못한 레코드
+#define STAT_MAX              21
+
+// args 수집 한도: ARGSIZE 이후 ARGSIZE 크기 청크를 최대 ARGV_MAX_CHUNKS개 추가 전송
+// (꼬리 호출 한도 33회 중 앞 단계가 4회를 사용하므로 28 이하)
+#ifndef ARGV_MAX_CHUNKS
+#define ARGV_MAX_CHUNKS 8
+#endif
+
+// dentry 경로 캐시 (DENTRY_CACHE_SIZE가 0이면 사용 안 함)
+#ifndef DENTRY_CACHE_SIZE
+#define DENTRY_CACHE_SIZE 4096
+#endif
+// 상위 디렉토리 이름 변경이 캐시에 반영되기까지 걸리는 최대 시간
+#ifndef DENTRY_CACHE_TTL_NS
+#define DENTRY_CACHE_TTL_NS 60000000000ULL
+#endif
+
+// 호스트네임별 exec 빈도 제한 (초당 EXEC_RATE_LIMIT회, 최대 EXEC_RATE_BURST회 연속 허용, 0이면 사용 안 함)
+#ifndef EXEC_RATE_LIMIT
+#define EXEC_RATE_LIMIT 0
+#endif
+#ifndef EXEC_RATE_BURST
+#define EXEC_RATE_BURST 200
+#endif
+#ifndef EXEC_RATE_HOSTS
+#define EXEC_RATE_HOSTS 4096
+#endif
+
+// process_data 최대 항목 수 (사용자 공간에서 cflags로 덮어씀)
+#ifndef PROCESS_DATA_MAX_ENTRIES
+#define PROCESS_DATA_MAX_ENTRIES 10240
+#endif
+
+// 수집 대상 선택 규칙 맵 크기 (사용자 공간에서 설정과 규칙 파일로 채움)
+#ifndef HOST_RULES_SIZE
+#define HOST_RULES_SIZE 256
+#endif
+#ifndef CGROUP_RULES_SIZE
+#define CGROUP_RULES_SIZE 4096
+#endif
+// cgroup 규칙을 확인할 최대 계층 깊이 (루트 아래 1단계부터)
+#ifndef CGROUP_RULE_DEPTH
+#define CGROUP_RULE_DEPTH 8
+#endif
+
+#ifndef EXEC_ALLOWLIST_SIZE
+#define EXEC_ALLOWLIST_SIZE 16384
+#endif
+
+// 링 버퍼 설정 (사용자 공간에서 cflags로 덮어씀)
+#ifndef RINGBUF_PAGE_CNT
+#define RINGBUF_PAGE_CNT 256
+#endif
+#ifndef RINGBUF_WAKEUP_BATCH
+#define RINGBUF_WAKEUP_BATCH 32
+#endif
+#ifndef RINGBUF_WAKEUP_NS
+#define RINGBUF_WAKEUP_NS 100000000ULL
+#endif
+
+// 프로세스별 수집 상태 (process_data 맵 값, 사용자 공간으로 직접 전송하지 않음)
 struct data_t {
     u32 pid;
     u32 error_flags;
@@ -29,13 +114,244 @@ struct data_t {
     int binary_path_offset;
     int cwd_offset;
     u32 args_len;
+    u32 hostname_len;
+    int exit_code;
+    u64 exec_ns;        // exec 시각 (bpf_ktime_get_ns, CLOCK_MONOTONIC)
+    u32 ppid;           // exec 시점의 부모 tgid (종료 시점에는 재부모화되었을 수 있음)
+    u32 args_chunks;    // 전송한 ARGS_CHUNK 레코드 수
+    u64 args_next;      // 다음 청크의 사용자 공간 주소
+    u64 args_end;
+};
+
+// 레코드 타입
+#define EVENT_EXIT 1
+#define EVENT_ARGS_CHUNK 2  // ARGSIZE를 넘는 명령줄 인수 조각 (exec 시점에 전송)
+#define EVENT_EXEC 3        // exec 시작 알림 (EXEC_EVENTS 사용 시, hostname과 binary_path만 포함)
+
+// 사용자 공간으로 전송하는 가변 길이 레코드의 고정 헤더 (88 bytes)
+// 헤더 뒤에 hostname, binary_path, cwd, args가 NUL 없이 각 길이만큼 이어짐
+// ARGS_CHUNK 레코드는 args 조각만 담음
+// src/bpf/event.py의 RawBpfStruct와 레이아웃 일치
+struct event_hdr_t {
+    u16 type;
+    u16 hostname_len;
+    u16 binary_path_len;
+    u16 cwd_len;
+    u16 args_len;
+    u16 chunk;          // EXIT: 앞서 전송한 ARGS_CHUNK 수, ARGS_CHUNK: 순번
+    u32 pid;
+    u32 error_flags;
     int exit_code;
+    u64 exec_ns;        // exec 시각 (bpf_ktime_get_ns, CLOCK_MONOTONIC)
+    u64 exit_ns;        // 종료 시각 (EXIT 레코드만)
+    // 자원 사용량 (EXIT 레코드만, 쓰레드 그룹 전체)
+    u64 utime_ns;
+    u64 stime_ns;
+    u64 maxrss_pages;   // 최대 RSS (페이지)
+    u64 nvcsw;          // 자발적 문맥 교환
+    u64 nivcsw;         // 비자발적 문맥 교환
+    u32 ppid;           // 부모 tgid (EXEC, EXIT 레코드)
+    u32 pad;
+};
+
+// 레코드 조립용 버퍼 (헤더 + 필드 최대 길이 합 921 bytes보다 큰 2의 거듭제곱)
+#define EVENT_BUF_SIZE 2048
+#define EVENT_FIELD_OFF_MASK (EVENT_BUF_SIZE / 2 - 1)
+#define EVENT_FIELD_LEN_MASK (EVENT_BUF_SIZE / 4 - 1)
+
+struct event_buf_t {
+    u8 data[EVENT_BUF_SIZE];
+};
+
+// 허용 실행 파일 키 (사용자 공간에서 PROCESS_PATTERNS 경로를 stat하여 채움)
+struct exe_key_t {
+    u32 dev;    // 커널 내부 dev_t 인코딩 (MAJOR << 20 | MINOR)
+    u32 pad;
+    u64 ino;
 };
 
 BPF_PERCPU_ARRAY(tmp_array, struct data_t, 1);
-BPF_HASH(process_data, u32, struct data_t);
-BPF_PROG_ARRAY(prog_array, 4);
+BPF_PERCPU_ARRAY(event_buf, struct event_buf_t, 1);
+// 가득 차면 가장 오래 사용되지 않은 항목을 밀어내므로 새 exec가 유실되지 않음
+#ifdef PROCESS_DATA_PIN
+// bpffs에 고정된 맵이 있으면 재사용하여 재시작 전에 exec한 프로세스의 종료도 수집
+BPF_TABLE_PINNED("lru_hash", u32, struct data_t, process_data, PROCESS_DATA_MAX_ENTRIES, PROCESS_DATA_PIN);
+#else
+BPF_TABLE("lru_hash", u32, struct data_t, process_data, PROCESS_DATA_MAX_ENTRIES);
+#endif
+BPF_PROG_ARRAY(prog_array, 5);
+BPF_HASH(exec_allowlist, struct exe_key_t, u32, EXEC_ALLOWLIST_SIZE);
+
+// 선택 규칙 (src/bpf/selection.py의 RULE_* 와 일치)
+#define RULE_ALLOW 1
+#define RULE_DENY  2
+#define HOST_RULE_LEN 64
+
+// 호스트네임 접두어 규칙: 가장 긴 접두어가 일치한 규칙을 적용
+// (예: "jcode-" 허용, "jcode-os-2-" 거부 -> os-2 분반만 제외)
+struct host_rule_key_t {
+    u32 prefixlen;  // 비트 단위
+    char name[HOST_RULE_LEN];
+};
+BPF_LPM_TRIE(host_rules, struct host_rule_key_t, u8, HOST_RULES_SIZE);
+
+#ifdef CGROUP_RULES
+// cgroup id(cgroup v2 디렉토리 inode) 규칙, 호스트네임 규칙보다 우선
+BPF_HASH(cgroup_rules, u64, u8, CGROUP_RULES_SIZE);
+#endif
+BPF_PERCPU_ARRAY(stats, u64, STAT_MAX);
+
+#if EXEC_RATE_LIMIT > 0
+// exec 한 번의 비용 (나노초 단위 크레딧)
+#define EXEC_RATE_COST_NS (1000000000ULL / EXEC_RATE_LIMIT)
+#define EXEC_RATE_CAPACITY_NS (EXEC_RATE_COST_NS * EXEC_RATE_BURST)
+
+struct host_key_t {
+    char name[UTS_LEN];
+};
+
+// GCRA(토큰 버킷과 같은 동작) 상태: 여러 CPU가 동시에 갱신하므로 원자적 덧셈만 사용
+struct exec_rate_t {
+    u64 tat_ns;         // 이론상 도착 시각: exec마다 EXEC_RATE_COST_NS씩 증가, 현재보다 용량 이상 앞서면 억제
+    u64 suppressed;     // 누적 억제 횟수 (사용자 공간에서 주기적으로 읽어 보고)
+};
+
+BPF_TABLE("lru_hash", struct host_key_t, struct exec_rate_t, exec_rate, EXEC_RATE_HOSTS);
+#endif
+
+#if DENTRY_CACHE_SIZE > 0
+// dentry 포인터 -> 조립된 경로 (get_dentry_path 결과와 같은 오른쪽 정렬 버퍼)
+// dentry가 해제된 뒤 같은 주소에 다른 파일이 올 수 있으므로 inode 번호와 세대로 검증
+struct path_cache_t {
+    u64 ino;
+    u64 cached_ns;
+    u32 generation;
+    u32 error_flags;
+    int offset;
+    char path[MAX_PATH_LEN];
+};
+
+BPF_TABLE("lru_hash", u64, struct path_cache_t, dentry_cache, DENTRY_CACHE_SIZE);
+BPF_PERCPU_ARRAY(path_cache_tmp, struct path_cache_t, 1);  // 스택 한도 때문에 맵 값 조립용
+#endif
+
+static __always_inline void stat_inc(u32 idx)
+{
+    u64 *value = stats.lookup(&idx);
+    if (value)
+        (*value)++;
+}
+
+// process_data 항목 삭제 (실제로 삭제된 경우만 집계, 퇴출 수 추정에 사용)
+static __always_inline void process_data_delete(u32 *pid)
+{
+    if (process_data.delete(pid) == 0)
+        stat_inc(STAT_PROC_DELETED);
+}
+
+// 수집 단계 실패: 통계를 남기고 수집 중이던 항목 삭제
+static __always_inline int stage_failed(u32 *pid, u32 stat)
+{
+    stat_inc(stat);
+    process_data_delete(pid);
+    return 0;
+}
+
+#ifdef USE_RINGBUF
+// 모든 CPU가 공유하는 단일 링 버퍼 (커널 5.8 이상)
+#ifdef EVENTS_PIN
+// BCC helpers.h의 BPF_RINGBUF_OUTPUT 정의를 그대로 옮기고 섹션에 bpffs 고정 경로만 추가
+// (BPF_TABLE_PINNED와 같은 "maps/<타입>:<경로>" 섹션, BPF_F_TABLE의 구조체에는
+// ringbuf_* 멤버가 없어 events.ringbuf_output 호출을 쓸 수 없음)
+// 소비자 위치가 맵에 저장되므로 재시작 후 읽지 못한 레코드부터 이어서 소비
+struct events_table_t {
+    int key;
+    u32 leaf;
+    /* map.ringbuf_output(data, data_size, flags) */
+    int (*ringbuf_output) (void *, u64, u64);
+    /* map.ringbuf_reserve(data_size) */
+    void* (*ringbuf_reserve) (u64);
+    /* map.ringbuf_discard(data, flags) */
+    void (*ringbuf_discard) (void *, u64);
+    /* map.ringbuf_submit(data, flags) */
+    void (*ringbuf_submit) (void *, u64);
+    /* map.ringbuf_query(flags) */
+    u64 (*ringbuf_query) (u64);
+    u32 max_entries;
+};
+__attribute__((section("maps/ringbuf:" EVENTS_PIN)))
+struct events_table_t events = { .max_entries = ((RINGBUF_PAGE_CNT) * PAGE_SIZE) };
+BPF_ANNOTATE_KV_PAIR(events, int, u32);
+#else
+BPF_RINGBUF_OUTPUT(events, RINGBUF_PAGE_CNT);
+#endif
+
+// 적응형 깨우기 상태: 마지막 깨우기 이후 쌓인 이벤트 수와 시각
+struct wakeup_state_t {
+    u64 pending;
+    u64 last_wakeup_ns;
+};
+BPF_ARRAY(ringbuf_wakeup, struct wakeup_state_t, 1);
+
+// 배치가 찼거나 타임아웃이 지난 경우에만 사용자 공간을 깨움
+static __always_inline u64 ringbuf_wakeup_flags(void)
+{
+    u32 zero = 0;
+    struct wakeup_state_t *state = ringbuf_wakeup.lookup(&zero);
+    if (!state)
+        return 0;
+
+    u64 now = bpf_ktime_get_ns();
+    __sync_fetch_and_add(&state->pending, 1);
+
+    if (state->pending >= RINGBUF_WAKEUP_BATCH ||
+        now - state->last_wakeup_ns >= RINGBUF_WAKEUP_NS) {
+        state->pending = 0;
+        state->last_wakeup_ns = now;
+        return BPF_RB_FORCE_WAKEUP;
+    }
+    return BPF_RB_NO_WAKEUP;
+}
+#else
 BPF_PERF_OUTPUT(events);
+#endif
+
+// EXIT 이외 레코드의 자원 사용량 필드 초기화 (CPU별 버퍼 재사용)
+static __always_inline void clear_rusage(struct event_hdr_t *hdr)
+{
+    hdr->utime_ns = 0;
+    hdr->stime_ns = 0;
+    hdr->maxrss_pages = 0;
+    hdr->nvcsw = 0;
+    hdr->nivcsw = 0;
+}
+
+// 버퍼의 off 위치에 len 바이트를 복사하고 다음 필드 위치를 반환
+// 마스킹으로 off + len이 항상 버퍼 안에 있음을 검증기에 보장
+static __always_inline u32 pack_field(u8 *buf, u32 off, const void *src, u32 len)
+{
+    off &= EVENT_FIELD_OFF_MASK;
+    len &= EVENT_FIELD_LEN_MASK;
+    if (len > 0)
+        bpf_probe_read_kernel(&buf[off], len, src);
+    return off + len;
+}
+
+// 조립된 레코드를 사용된 길이만큼만 전송 (실패 시 음수 반환)
+// 링 버퍼는 가득 차면 유실 알림 없이 버리므로 실패 수를 직접 셈
+static __always_inline int submit_event(struct pt_regs *ctx, u8 *buf, u32 size)
+{
+    int ret;
+    size &= EVENT_BUF_SIZE - 1;
+#ifdef USE_RINGBUF
+    ret = events.ringbuf_output(buf, size, ringbuf_wakeup_flags());
+#else
+    ret = events.perf_submit(ctx, buf, size);
+#endif
+    if (ret < 0)
+        stat_inc(STAT_SUBMIT_FAILED);
+    return ret;
+}
 
 static __always_inline int get_dentry_path(struct dentry *dentry, char *buf, int buf_size, u32 *error_flags)
 {
@@ -96,22 +412,213 @@ static __always_inline int get_dentry_path(struct dentry *dentry, char *buf, int
     return pos;
 }
 
+// 캐시를 거쳐 dentry 경로 조립 (buf는 MAX_PATH_LEN 크기)
+// 학생들은 같은 과제 디렉토리에서 같은 컴파일러와 a.out을 반복 실행하므로
+// 적중 시 최대 MAX_DENTRY_LEVEL번의 상위 dentry 순회를 복사 한 번으로 대체
+static __always_inline int get_dentry_path_cached(struct dentry *dentry, char *buf, u32 *error_flags)
+{
+#if DENTRY_CACHE_SIZE > 0
+    u64 key = (u64)dentry;
+    u64 ino = 0;
+    u32 generation = 0;
+    struct inode *inode = NULL;
+    bpf_probe_read(&inode, sizeof(inode), &dentry->d_inode);
+    if (inode) {
+        bpf_probe_read(&ino, sizeof(ino), &inode->i_ino);
+        bpf_probe_read(&generation, sizeof(generation), &inode->i_generation);
+    }
+
+    u64 now = bpf_ktime_get_ns();
+    struct path_cache_t *cached = dentry_cache.lookup(&key);
+    if (cached && cached->ino == ino && cached->generation == generation &&
+        now - cached->cached_ns < DENTRY_CACHE_TTL_NS) {
+        bpf_probe_read_kernel(buf, MAX_PATH_LEN, cached->path);
+        *error_flags |= cached->error_flags;
+        stat_inc(STAT_DENTRY_CACHE_HIT);
+        return cached->offset;
+    }
+    stat_inc(STAT_DENTRY_CACHE_MISS);
+
+    u32 flags = 0;
+    int pos = get_dentry_path(dentry, buf, MAX_PATH_LEN, &flags);
+    *error_flags |= flags;
+
+    u32 zero = 0;
+    struct path_cache_t *entry = path_cache_tmp.lookup(&zero);
+    if (entry) {
+        entry->ino = ino;
+        entry->cached_ns = now;
+        entry->generation = generation;
+        entry->error_flags = flags;
+        entry->offset = pos;
+        bpf_probe_read_kernel(entry->path, MAX_PATH_LEN, buf);
+        dentry_cache.update(&key, entry);
+    }
+    return pos;
+#else
+    return get_dentry_path(dentry, buf, MAX_PATH_LEN, error_flags);
+#endif
+}
+
+#ifdef EXEC_FILTER
+// 실행 파일 경로에 hw<숫자> 디렉토리가 포함되는지 확인
+// 경로 문자열을 만들지 않고 각 dentry 이름의 앞부분만 읽음
+// 정확한 과제 경로 검증은 사용자 공간의 HomeworkChecker가 담당
+static __always_inline int in_homework_dir(struct dentry *dentry)
+{
+    struct dentry *d = dentry;
+    struct dentry *parent;
+
+    for (int i = 0; i < MAX_DENTRY_LEVEL && d != NULL; i++) {
+        bpf_probe_read(&parent, sizeof(parent), &d->d_parent);
+        if (d == parent)
+            break;
+
+        struct qstr d_name = {};
+        bpf_probe_read(&d_name, sizeof(d_name), &d->d_name);
+
+        // hw1 ~ hw20 (HomeworkChecker의 디렉토리 이름 규칙과 같음)
+        // 경로상 위치(/home/coder/project/hwN 등)는 사용자 공간에서 확인하므로 여기서는 더 넓게 허용
+        if (d_name.len == 3 || d_name.len == 4) {
+            char name[4] = {};
+            bpf_probe_read(name, sizeof(name), d_name.name);
+            if (name[0] == 'h' && name[1] == 'w') {
+                if (d_name.len == 3 && name[2] >= '1' && name[2] <= '9')
+                    return 1;
+                if (d_name.len == 4 &&
+                    ((name[2] == '1' && name[3] >= '0' && name[3] <= '9') ||
+                     (name[2] == '2' && name[3] == '0')))
+                    return 1;
+            }
+        }
+
+        d = parent;
+    }
+    return 0;
+}
+
+// 허용 목록의 실행 파일이거나 과제 디렉토리 내 실행 파일인지 확인
+static __always_inline int exec_allowed(struct task_struct *task)
+{
+    struct mm_struct *mm;
+    bpf_probe_read(&mm, sizeof(mm), &task->mm);
+    if (!mm)
+        return 0;
+
+    struct file *exe_file;
+    bpf_probe_read(&exe_file, sizeof(exe_file), &mm->exe_file);
+    if (!exe_file)
+        return 0;
+
+    struct inode *inode;
+    bpf_probe_read(&inode, sizeof(inode), &exe_file->f_inode);
+    if (!inode)
+        return 0;
+
+    struct super_block *sb;
+    bpf_probe_read(&sb, sizeof(sb), &inode->i_sb);
+    if (!sb)
+        return 0;
+
+    struct exe_key_t key = {};
+    unsigned long ino;
+    bpf_probe_read(&ino, sizeof(ino), &inode->i_ino);
+    bpf_probe_read(&key.dev, sizeof(key.dev), &sb->s_dev);
+    key.ino = ino;
+
+    if (exec_allowlist.lookup(&key))
+        return 1;
+
+    struct path fpath;
+    bpf_probe_read(&fpath, sizeof(fpath), &exe_file->f_path);
+    return in_homework_dir(fpath.dentry);
+}
+#endif
+
+// 호스트네임과 cgroup 선택 규칙 검사, 수집 대상이면 1
+static __always_inline int exec_selected(struct uts_namespace *uts_ns)
+{
+    // 커널의 nodename은 NUL 이후가 0으로 채워져 있으므로 규칙보다 짧은 호스트네임은 일치하지 않음
+    struct host_rule_key_t key = {.prefixlen = HOST_RULE_LEN * 8};
+    bpf_probe_read_kernel(key.name, sizeof(key.name), uts_ns->name.nodename);
+    u8 *rule = host_rules.lookup(&key);
+    int selected = rule && *rule == RULE_ALLOW;
+
+#ifdef CGROUP_RULES
+    // 가장 깊은 계층에서 일치한 규칙 적용 (파드 cgroup 규칙을 컨테이너 cgroup 규칙이 덮어씀)
+    #pragma unroll
+    for (int level = 1; level <= CGROUP_RULE_DEPTH; level++) {
+        u64 id = bpf_get_current_ancestor_cgroup_id(level);
+        if (!id)
+            break;
+        u8 *action = cgroup_rules.lookup(&id);
+        if (action)
+            selected = *action == RULE_ALLOW;
+    }
+#endif
+    return selected;
+}
+
+#if EXEC_RATE_LIMIT > 0
+// 호스트네임별 토큰 버킷 검사, 허용하면 1
+// 여러 CPU에서 동시에 갱신하면 약간 더 허용될 수 있으나 폭주 억제에는 충분함
+static __always_inline int exec_rate_allowed(struct uts_namespace *uts_ns)
+{
+    // 커널의 nodename은 NUL 이후가 0으로 채워져 있으므로 그대로 키로 사용
+    struct host_key_t key = {};
+    bpf_probe_read_kernel(key.name, sizeof(key.name), uts_ns->name.nodename);
+
+    u64 now = bpf_ktime_get_ns();
+    struct exec_rate_t *rate = exec_rate.lookup(&key);
+    if (!rate) {
+        struct exec_rate_t init = {
+            .tat_ns = now + EXEC_RATE_COST_NS,
+        };
+        exec_rate.update(&key, &init);
+        return 1;
+    }
+
+    // 쉬는 동안 쌓인 크레딧은 용량까지만 인정 (이론상 도착 시각을 현재로 당김)
+    // 다른 CPU가 이미 더 늦은 시각을 기록했으면 경과 시간은 0으로 봄
+    // 동시에 당기면 다른 CPU의 덧셈 하나를 덮어쓸 수 있으나 CPU 수 이내로 제한됨
+    if (rate->tat_ns < now)
+        rate->tat_ns = now;
+    __sync_fetch_and_add(&rate->tat_ns, EXEC_RATE_COST_NS);
+
+    // 다른 CPU가 더한 비용까지 포함한 값으로 판단
+    u64 tat = rate->tat_ns;
+    if (tat > now && tat - now > EXEC_RATE_CAPACITY_NS) {
+        // 억제한 exec의 비용은 돌려줌
+        __sync_fetch_and_add(&rate->tat_ns, -EXEC_RATE_COST_NS);
+        __sync_fetch_and_add(&rate->suppressed, 1);
+        return 0;
+    }
+    return 1;
+}
+#endif
+
 // 첫 번째 핸들러: 호스트네임 검증 및 PID 설정
 int init_handler(struct pt_regs *ctx) {
     u32 pid = bpf_get_current_pid_tgid() >> 32;
     u32 zero = 0;
+    stat_inc(STAT_EXEC_SEEN);
     
     struct data_t *tmp = tmp_array.lookup(&zero);
     if (!tmp)
         return 0;
     
-    // 기본 정보 설정
+    // 기본 정보 설정 (CPU별 버퍼를 재사용하므로 이전 값 초기화)
     tmp->pid = pid;
+    tmp->error_flags = ERR_NONE;
+    tmp->args_len = 0;
+    tmp->args_chunks = 0;
+    tmp->exec_ns = bpf_ktime_get_ns();
     
     // UTS namespace에서 hostname 읽기
     struct task_struct *task = (struct task_struct *)bpf_get_current_task();
     if (!task)
         return 0;
+    tmp->ppid = task->real_parent->tgid;
     
     struct nsproxy *ns = task->nsproxy;
     if (!ns)
@@ -122,22 +629,43 @@ int init_handler(struct pt_regs *ctx) {
         return 0;
     
     // hostname 읽기
-    bpf_probe_read_kernel_str(tmp->hostname, UTS_LEN, uts_ns->name.nodename);
+    int hostname_len = bpf_probe_read_kernel_str(tmp->hostname, UTS_LEN, uts_ns->name.nodename);
+    tmp->hostname_len = hostname_len > 0 ? hostname_len - 1 : 0;
+
 
+    // 수집 대상 호스트네임/cgroup 확인 (규칙은 재컴파일 없이 맵으로 갱신)
+    if (!exec_selected(uts_ns)) {
+        stat_inc(STAT_EXEC_NOT_SELECTED);
+        return 0;
+    }
 
-    // jcode- 접두어 확인
-    if (tmp->hostname[0] != 'j' || 
-        tmp->hostname[1] != 'c' ||
-        tmp->hostname[2] != 'o' ||
-        tmp->hostname[3] != 'd' ||
-        tmp->hostname[4] != 'e' ||
-        tmp->hostname[5] != '-') {
+#ifdef EXEC_FILTER
+    // 관심 없는 실행 파일은 경로 수집 전에 버림
+    if (!exec_allowed(task)) {
+        stat_inc(STAT_EXEC_DROPPED);
+        return 0;
+    }
+#endif
+#if EXEC_RATE_LIMIT > 0
+    // 한 컨테이너의 exec 폭주가 노드 전체 수집을 막지 않도록 제한
+    if (!exec_rate_allowed(uts_ns)) {
+        stat_inc(STAT_EXEC_THROTTLED);
         return 0;
     }
+#endif
+    stat_inc(STAT_EXEC_FORWARDED);
     
     // 모든 검증을 통과한 경우에만 맵에 등록
-    process_data.update(&pid, tmp);
+    // (같은 PID의 재exec는 기존 항목을 덮어쓰므로 추가로 세지 않음)
+    int existed = process_data.lookup(&pid) != NULL;
+    if (process_data.update(&pid, tmp) < 0) {
+        stat_inc(STAT_PROC_INSERT_FAIL);
+        return 0;
+    }
+    if (!existed)
+        stat_inc(STAT_PROC_INSERTED);
     prog_array.call(ctx, 1);  // binary_handler로
+    stat_inc(STAT_TAIL_CALL_FAILED);
     return 0;
 }
 
@@ -146,41 +674,37 @@ int binary_handler(struct pt_regs *ctx) {
     u32 pid = bpf_get_current_pid_tgid() >> 32;
     struct data_t *data = process_data.lookup(&pid);
     if (!data) {
-        process_data.delete(&pid);
-        return 0;
+        return stage_failed(&pid, STAT_BINARY_FAILED);
     }
     
     struct task_struct *task = (struct task_struct *)bpf_get_current_task();
     if (!task) {
-        process_data.delete(&pid);
-        return 0;
+        return stage_failed(&pid, STAT_BINARY_FAILED);
     }
 
     struct mm_struct *mm;
     bpf_probe_read(&mm, sizeof(mm), &task->mm);
     if (!mm) {
-        process_data.delete(&pid);
-        return 0;
+        return stage_failed(&pid, STAT_BINARY_FAILED);
     }
 
     struct file *exe_file;
     bpf_probe_read(&exe_file, sizeof(exe_file), &mm->exe_file);
     if (!exe_file) {
-        process_data.delete(&pid);
-        return 0;
+        return stage_failed(&pid, STAT_BINARY_FAILED);
     }
 
     struct path fpath;
     bpf_probe_read(&fpath, sizeof(fpath), &exe_file->f_path);
 
-    data->binary_path_offset = get_dentry_path(
+    data->binary_path_offset = get_dentry_path_cached(
         fpath.dentry,
         data->binary_path,
-        sizeof(data->binary_path),
         &data->error_flags
     );
 
     prog_array.call(ctx, 2);  // cwd_handler로
+    stat_inc(STAT_TAIL_CALL_FAILED);
     return 0;
 }
 
@@ -189,34 +713,31 @@ int cwd_handler(struct pt_regs *ctx) {
     u32 pid = bpf_get_current_pid_tgid() >> 32;
     struct data_t *data = process_data.lookup(&pid);
     if (!data) {
-        process_data.delete(&pid);
-        return 0;
+        return stage_failed(&pid, STAT_CWD_FAILED);
     }
     
     struct task_struct *task = (struct task_struct *)bpf_get_current_task();
     if (!task) {
-        process_data.delete(&pid);
-        return 0;
+        return stage_failed(&pid, STAT_CWD_FAILED);
     }
 
     struct fs_struct *fs = NULL;
     bpf_probe_read(&fs, sizeof(fs), &task->fs);
     if (!fs) {
-        process_data.delete(&pid);
-        return 0;
+        return stage_failed(&pid, STAT_CWD_FAILED);
     }
 
     struct path pwd = {};
     bpf_probe_read(&pwd, sizeof(pwd), &fs->pwd);
     struct dentry *dentry = pwd.dentry;
     if (!dentry) {
-        process_data.delete(&pid);
-        return 0;
+        return stage_failed(&pid, STAT_CWD_FAILED);
     }
 
-    data->cwd_offset = get_dentry_path(dentry, data->cwd, sizeof(data->cwd), &data->error_flags);
+    data->cwd_offset = get_dentry_path_cached(dentry, data->cwd, &data->error_flags);
     
     prog_array.call(ctx, 3);  // args_handler로
+    stat_inc(STAT_TAIL_CALL_FAILED);
     return 0;
 }
 
@@ -225,45 +746,171 @@ int args_handler(struct pt_regs *ctx) {
     u32 pid = bpf_get_current_pid_tgid() >> 32;
     struct data_t *data = process_data.lookup(&pid);
     if (!data) {
-        process_data.delete(&pid);
-        return 0;
+        return stage_failed(&pid, STAT_ARGS_FAILED);
     }
     
     struct task_struct *task = (struct task_struct *)bpf_get_current_task();
     if (!task) {
-        process_data.delete(&pid);
-        return 0;
+        return stage_failed(&pid, STAT_ARGS_FAILED);
     }
     
     struct mm_struct *mm = task->mm;
     if (!mm || !mm->arg_start) {
-        process_data.delete(&pid);
-        return 0;
+        return stage_failed(&pid, STAT_ARGS_FAILED);
     }
     
     u64 start = (u64)mm->arg_start;
     u64 end   = (u64)mm->arg_end;
-    u64 length = 0;
-
-    if (end > start) {
-        length = end - start;
-    }
+    // arg_end < arg_start이면 부호 없는 뺄셈이 넘치므로 0으로 둠
+    u64 total = end > start ? end - start : 0;
+    u64 length = total;
 
     if (length > ARGSIZE) {
-        data->error_flags |= ERR_ARGS_TOO_LONG;
         length = ARGSIZE;
     }
 
     data->args_len = (u32)length;
     bpf_probe_read_user(data->args, length, (void *)start);
+
+#ifdef EXEC_EVENTS
+    // 종료하지 않는 프로세스도 추적할 수 있도록 exec 시작을 알림
+    u32 zero = 0;
+    struct event_buf_t *ev = event_buf.lookup(&zero);
+    if (ev) {
+        u32 binary_path_len = (MAX_PATH_LEN - 1 - data->binary_path_offset) & (MAX_PATH_LEN - 1);
+        struct event_hdr_t *hdr = (struct event_hdr_t *)ev->data;
+        hdr->type = EVENT_EXEC;
+        hdr->hostname_len = data->hostname_len;
+        hdr->binary_path_len = binary_path_len;
+        hdr->cwd_len = 0;
+        hdr->args_len = 0;
+        hdr->chunk = 0;
+        hdr->pid = pid;
+        hdr->error_flags = data->error_flags;
+        hdr->exit_code = 0;
+        hdr->exec_ns = data->exec_ns;
+        hdr->exit_ns = 0;
+        clear_rusage(hdr);
+        hdr->ppid = data->ppid;
+        hdr->pad = 0;
+
+        u32 off = sizeof(struct event_hdr_t);
+        off = pack_field(ev->data, off, data->hostname, data->hostname_len);
+        off = pack_field(ev->data, off, &data->binary_path[data->binary_path_offset & (MAX_PATH_LEN - 1)], binary_path_len);
+        submit_event(ctx, ev->data, off);
+    }
+#endif
+
+    if (total > ARGSIZE) {
+        // 나머지는 청크 핸들러가 조각으로 전송 (꼬리 호출 실패 시 잘린 채로 둠)
+        data->args_next = start + ARGSIZE;
+        data->args_end = end;
+        prog_array.call(ctx, 4);  // args_chunk_handler로
+        stat_inc(STAT_TAIL_CALL_FAILED);
+        data->error_flags |= ERR_ARGS_TOO_LONG;
+    }
     
     // 여기서는 perf_submit 하지 않음
     return 0;
 }
 
+// 다섯 번째 핸들러: ARGSIZE 이후 명령줄 인수를 청크 단위로 전송
+// 자기 자신을 꼬리 호출하여 청크마다 한 번씩 실행되며, 사용자 공간에서 PID와 순번으로 재조립
+int args_chunk_handler(struct pt_regs *ctx) {
+    u32 pid = bpf_get_current_pid_tgid() >> 32;
+    struct data_t *data = process_data.lookup(&pid);
+    if (!data)
+        return 0;
+
+    if (data->args_end <= data->args_next)
+        return 0;
+    u64 remaining = data->args_end - data->args_next;
+    if (data->args_chunks >= ARGV_MAX_CHUNKS) {
+        data->error_flags |= ERR_ARGS_TOO_LONG;
+        return 0;
+    }
+
+    u32 zero = 0;
+    struct event_buf_t *ev = event_buf.lookup(&zero);
+    if (!ev)
+        return 0;
+
+    u32 len = remaining > ARGSIZE ? ARGSIZE : (u32)remaining;
+    struct event_hdr_t *hdr = (struct event_hdr_t *)ev->data;
+    hdr->type = EVENT_ARGS_CHUNK;
+    hdr->hostname_len = 0;
+    hdr->binary_path_len = 0;
+    hdr->cwd_len = 0;
+    hdr->args_len = len;
+    hdr->chunk = data->args_chunks;
+    hdr->pid = pid;
+    hdr->error_flags = 0;
+    hdr->exit_code = 0;
+    hdr->exec_ns = 0;
+    hdr->exit_ns = 0;
+    clear_rusage(hdr);
+    hdr->ppid = 0;
+    hdr->pad = 0;
+
+    len &= EVENT_FIELD_LEN_MASK;
+    if (bpf_probe_read_user(&ev->data[sizeof(struct event_hdr_t)], len, (void *)data->args_next) < 0) {
+        data->error_flags |= ERR_ARGS_TOO_LONG;
+        return 0;
+    }
+    submit_event(ctx, ev->data, sizeof(struct event_hdr_t) + len);
+
+    data->args_next += len;
+    data->args_chunks++;
+    prog_array.call(ctx, 4);  // 다음 청크
+    // 꼬리 호출 한도에 걸린 경우
+    if (data->args_next < data->args_end) {
+        stat_inc(STAT_TAIL_CALL_FAILED);
+        data->error_flags |= ERR_ARGS_TOO_LONG;
+    }
+    return 0;
+}
+
+// 종료하는 쓰레드 그룹의 자원 사용량 기록
+// 먼저 종료한 쓰레드의 값은 signal에 누적되어 있고, 그룹 리더는 좀비로 남아 있으므로 따로 더함
+// maxrss는 마지막 쓰레드 종료 시 do_exit가 트레이스포인트 전에 signal->maxrss에 반영
+static __always_inline void fill_rusage(struct event_hdr_t *hdr, struct task_struct *task)
+{
+    struct signal_struct *sig = task->signal;
+    hdr->utime_ns = task->utime;
+    hdr->stime_ns = task->stime;
+    hdr->nvcsw = task->nvcsw;
+    hdr->nivcsw = task->nivcsw;
+    hdr->maxrss_pages = 0;
+    if (sig) {
+        hdr->utime_ns += sig->utime;
+        hdr->stime_ns += sig->stime;
+        hdr->nvcsw += sig->nvcsw;
+        hdr->nivcsw += sig->nivcsw;
+        hdr->maxrss_pages = sig->maxrss;
+    }
+
+    struct task_struct *leader = task->group_leader;
+    if (leader && leader != task) {
+        hdr->utime_ns += leader->utime;
+        hdr->stime_ns += leader->stime;
+        hdr->nvcsw += leader->nvcsw;
+        hdr->nivcsw += leader->nivcsw;
+    }
+}
+
 // exit 트레이스포인트용 핸들러
 int exit_handler(struct pt_regs *ctx) {
     u32 pid = bpf_get_current_pid_tgid() >> 32;
+
+    // sched_process_exit는 쓰레드마다 발생하므로 쓰레드 그룹의 마지막 쓰레드만 처리
+    // (do_exit는 트레이스포인트 전에 signal->live를 감소시키므로 0이면 마지막 쓰레드)
+    struct task_struct *task = (struct task_struct *)bpf_get_current_task();
+    if (!task)
+        return 0;
+    if (task->signal && task->signal->live.counter != 0) {
+        stat_inc(STAT_THREAD_EXIT_SKIPPED);
+        return 0;
+    }
     
     // process_data에서 해당 PID의 데이터 조회
     struct data_t *data = process_data.lookup(&pid);
@@ -271,18 +918,50 @@ int exit_handler(struct pt_regs *ctx) {
         return 0;
     
     // exit code 수집
-    struct task_struct *task = (struct task_struct *)bpf_get_current_task();
-    if (!task) {
-        process_data.delete(&pid);
-        return 0;
-    }
-    
     data->exit_code = task->exit_code >> 8; // 상위 8비트가 실제 exit code
         
-    // 데이터를 사용자 공간으로 전송
-    events.perf_submit(ctx, data, sizeof(struct data_t));
+    // 사용된 길이만큼만 레코드로 조립하여 사용자 공간으로 전송
+    u32 zero = 0;
+    struct event_buf_t *ev = event_buf.lookup(&zero);
+    if (!ev) {
+        return stage_failed(&pid, STAT_EXIT_FAILED);
+    }
+
+    u32 binary_path_len = (MAX_PATH_LEN - 1 - data->binary_path_offset) & (MAX_PATH_LEN - 1);
+    u32 cwd_len = (MAX_PATH_LEN - 1 - data->cwd_offset) & (MAX_PATH_LEN - 1);
+
+    struct event_hdr_t *hdr = (struct event_hdr_t *)ev->data;
+    hdr->type = EVENT_EXIT;
+    hdr->hostname_len = data->hostname_len;
+    hdr->binary_path_len = binary_path_len;
+    hdr->cwd_len = cwd_len;
+    hdr->args_len = data->args_len;
+    hdr->chunk = data->args_chunks;
+    hdr->pid = data->pid;
+    hdr->error_flags = data->error_flags;
+    hdr->exit_code = data->exit_code;
+    hdr->exec_ns = data->exec_ns;
+    hdr->exit_ns = bpf_ktime_get_ns();
+    fill_rusage(hdr, task);
+    hdr->ppid = data->ppid;
+    hdr->pad = 0;
+
+    u32 off = sizeof(struct event_hdr_t);
+    off = pack_field(ev->data, off, data->hostname, data->hostname_len);
+    off = pack_field(ev->data, off, &data->binary_path[data->binary_path_offset & (MAX_PATH_LEN - 1)], binary_path_len);
+    off = pack_field(ev->data, off, &data->cwd[data->cwd_offset & (MAX_PATH_LEN - 1)], cwd_len);
+    off = pack_field(ev->data, off, data->args, data->args_len);
+    if (submit_event(ctx, ev->data, off) == 0) {
+        stat_inc(STAT_EXIT_SUBMITTED);
+        if (data->error_flags & ERR_DENTRY_TOO_DEEP)
+            stat_inc(STAT_ERR_DENTRY_TOO_DEEP);
+        if (data->error_flags & ERR_DNAME_TOO_LONG)
+            stat_inc(STAT_ERR_DNAME_TOO_LONG);
+        if (data->error_flags & ERR_ARGS_TOO_LONG)
+            stat_inc(STAT_ERR_ARGS_TOO_LONG);
+    }
     
     // 맵에서 데이터 삭제
-    process_data.delete(&pid);
+    process_data_delete(&pid);
     return 0;
 } 
\ No newline at end of file
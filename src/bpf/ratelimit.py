@@ -0,0 +1,42 @@
+"""호스트네임별 exec 빈도 제한 보고
+
+커널은 학생 컨테이너(호스트네임)마다 토큰 버킷으로 exec 빈도를 제한하고,
+억제한 횟수를 exec_rate 맵에 누적합니다. 이 모듈은 맵을 주기적으로 읽어
+이전 보고 이후 억제된 실행 수를 호스트별로 한 줄씩 집계해 기록합니다.
+"""
+
+from typing import Dict
+
+from ..metrics.prometheus import EXEC_SUPPRESSED, EXEC_THROTTLED_HOSTS
+from ..utils.logging import get_logger
+
+
+class ExecRateReporter:
+    """exec_rate 맵의 억제 횟수 증가분을 로그와 메트릭으로 보고"""
+
+    def __init__(self, table):
+        self.table = table
+        self._last: Dict[bytes, int] = {}
+        self.logger = get_logger(__name__)
+
+    def __call__(self) -> Dict[str, int]:
+        """
+        Returns:
+            이번 주기에 억제된 실행이 있는 호스트네임별 억제 횟수
+        """
+        current: Dict[bytes, int] = {}
+        suppressed: Dict[str, int] = {}
+        for key, value in self.table.items():
+            name = bytes(key.name).split(b'\0', 1)[0]
+            current[name] = value.suppressed
+            delta = value.suppressed - self._last.get(name, 0)
+            if delta > 0:
+                suppressed[name.decode('utf-8', 'replace')] = delta
+        # LRU로 밀려난 호스트는 다시 나타나면 0부터 누적되므로 현재 항목만 기억
+        self._last = current
+
+        EXEC_THROTTLED_HOSTS.set(len(suppressed))
+        for hostname, count in suppressed.items():
+            EXEC_SUPPRESSED.inc(count)
+            self.logger.warning(f"[억제] {hostname}: 실행 빈도 제한으로 {count}회 실행 억제")
+        return suppressed
@@ -0,0 +1,189 @@
+"""수집 대상 선택 규칙 관리
+
+init_handler는 호스트네임 접두어 규칙(host_rules, LPM 트라이)과 cgroup 규칙(cgroup_rules)으로
+수집할 exec를 고릅니다. 규칙은 설정(HOST_ALLOW_PREFIXES 등)으로 초기화하고, 규칙 파일이 있으면
+파일 내용으로 대체합니다. 규칙 파일은 주기적으로 확인하여 바뀌었을 때만 커널 맵에 반영하므로,
+분반 추가나 일시 제외에 BPF 프로그램 재컴파일이나 파드 재시작이 필요하지 않습니다.
+
+규칙 파일 형식 (JSON, 빠진 항목은 빈 목록):
+    {
+        "host_allow": ["jcode-"],
+        "host_deny": ["jcode-os-2-"],
+        "cgroup_allow": [],
+        "cgroup_deny": ["kubepods.slice/kubepods-burstable.slice/kubepods-burstable-pod<uid>.slice"]
+    }
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
+from ..utils.logging import get_logger
+
+# 규칙 동작 (program.c의 RULE_* 와 일치)
+RULE_ALLOW = 1
+RULE_DENY = 2
+
+# 호스트네임 접두어 최대 길이 (program.c의 HOST_RULE_LEN)
+HOST_RULE_LEN = 64
+
+
+@dataclass(frozen=True)
+class SelectionRules:
+    """호스트네임 접두어와 cgroup 경로 허용/거부 규칙"""
+    host_allow: Tuple[str, ...] = ()
+    host_deny: Tuple[str, ...] = ()
+    cgroup_allow: Tuple[str, ...] = ()
+    cgroup_deny: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_settings(cls, settings) -> 'SelectionRules':
+        return cls(
+            host_allow=tuple(settings.host_allow_prefixes),
+            host_deny=tuple(settings.host_deny_prefixes),
+            cgroup_allow=tuple(settings.cgroup_allow),
+            cgroup_deny=tuple(settings.cgroup_deny),
+        )
+
+    @classmethod
+    def from_file(cls, path: str) -> 'SelectionRules':
+        """규칙 파일 읽기
+
+        Raises:
+            OSError: 파일을 읽을 수 없는 경우
+            ValueError: JSON 형식이 잘못되었거나 규칙이 빈 문자열이 아닌 문자열 목록이 아닌 경우
+        """
+        with open(path) as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            raise ValueError("규칙 파일은 JSON 객체여야 함")
+        rules = {}
+        for name in ("host_allow", "host_deny", "cgroup_allow", "cgroup_deny"):
+            items = data.get(name, [])
+            # "jcode-"처럼 문자열 하나를 쓰면 글자마다 접두어가 되어 모든 호스트가 선택되므로 거부
+            if not isinstance(items, list) or not all(isinstance(item, str) and item for item in items):
+                raise ValueError(f"{name}은 빈 문자열이 아닌 문자열 목록이어야 함: {items!r}")
+            rules[name] = tuple(items)
+        return cls(**rules)
+
+    def host_rules(self) -> Dict[str, int]:
+        """접두어별 동작 (같은 접두어가 양쪽에 있으면 거부)"""
+        rules = {prefix: RULE_ALLOW for prefix in self.host_allow}
+        rules.update({prefix: RULE_DENY for prefix in self.host_deny})
+        return rules
+
+
+def host_rule_key(prefix: str) -> Tuple[int, bytes]:
+    """접두어를 LPM 트라이 키(비트 단위 길이, 이름)로 변환
+
+    Raises:
+        ValueError: 비어 있거나 HOST_RULE_LEN을 넘는 접두어
+    """
+    name = prefix.encode()
+    if not name or len(name) > HOST_RULE_LEN:
+        raise ValueError(f"호스트네임 접두어 길이는 1~{HOST_RULE_LEN} bytes: {prefix!r}")
+    return len(name) * 8, name
+
+
+def cgroup_id(root: str, path: str) -> int:
+    """cgroup v2 디렉토리의 id (bpf_get_current_cgroup_id와 같은 디렉토리 inode 번호)"""
+    return os.stat(os.path.join(root, path.lstrip('/'))).st_ino
+
+
+class ExecSelector:
+    """선택 규칙을 커널 맵과 동기화"""
+
+    def __init__(self, host_table, defaults: SelectionRules, cgroup_table=None,
+                 rules_path: Optional[str] = None, cgroup_root: str = "/sys/fs/cgroup"):
+        """
+        Args:
+            host_table: host_rules LPM 트라이 맵
+            defaults: 규칙 파일이 없을 때 사용할 규칙 (설정)
+            cgroup_table: cgroup_rules 맵 (CGROUP_RULES를 켜지 않았으면 None)
+            rules_path: 실행 중 갱신할 수 있는 규칙 파일
+            cgroup_root: cgroup v2 마운트 경로
+        """
+        self.logger = get_logger(__name__)
+        self.host_table = host_table
+        self.cgroup_table = cgroup_table
+        self.defaults = defaults
+        self.rules_path = rules_path
+        self.cgroup_root = cgroup_root
+        self.rules: Optional[SelectionRules] = None
+        self._rules_mtime: Optional[float] = None
+        self._hosts: Dict[str, int] = {}
+        self._cgroups: Dict[int, int] = {}
+
+    def _rules_file_mtime(self) -> Optional[float]:
+        if not self.rules_path:
+            return None
+        try:
+            return os.stat(self.rules_path).st_mtime
+        except OSError:
+            return None
+
+    def _load(self) -> SelectionRules:
+        """규칙 파일이 바뀌었으면 다시 읽고, 없으면 기본 규칙 사용"""
+        mtime = self._rules_file_mtime()
+        if self.rules is not None and mtime == self._rules_mtime:
+            return self.rules
+        rules = self.defaults
+        if mtime is not None:
+            try:
+                rules = SelectionRules.from_file(self.rules_path)
+            except (OSError, ValueError, TypeError) as e:
+                # 잘못된 파일로 수집이 멈추지 않도록 기존 규칙 유지
+                self.logger.error(f"[선택 규칙] 규칙 파일 읽기 실패, 기존 규칙 유지: {e}")
+                return self.rules or self.defaults
+        self._rules_mtime = mtime
+        if rules != self.rules:
+            self.logger.info(f"[선택 규칙] 적용: {rules}")
+        return rules
+
+    def refresh(self) -> None:
+        """규칙 파일 변경과 새로 생긴 cgroup을 커널 맵에 반영"""
+        self.rules = self._load()
+        self._sync_hosts(self.rules.host_rules())
+        if self.cgroup_table is not None:
+            cgroups = self._resolve_cgroups(self.rules.cgroup_allow, RULE_ALLOW)
+            cgroups.update(self._resolve_cgroups(self.rules.cgroup_deny, RULE_DENY))
+            self._sync_cgroups(cgroups)
+
+    def _resolve_cgroups(self, paths: Iterable[str], action: int) -> Dict[int, int]:
+        """cgroup 경로를 id로 변환 (아직 생기지 않은 cgroup은 다음 갱신 때 반영)"""
+        resolved = {}
+        for path in paths:
+            try:
+                resolved[cgroup_id(self.cgroup_root, path)] = action
+            except OSError:
+                self.logger.debug(f"[선택 규칙] cgroup 없음: {path}")
+        return resolved
+
+    def _sync_hosts(self, wanted: Dict[str, int]) -> None:
+        keys = {}
+        for prefix in wanted:
+            try:
+                keys[prefix] = host_rule_key(prefix)
+            except ValueError as e:
+                self.logger.error(f"[선택 규칙] {e}")
+        for prefix in self._hosts.keys() - keys.keys():
+            try:
+                del self.host_table[self.host_table.Key(*host_rule_key(prefix))]
+            except KeyError:
+                pass
+        for prefix, (prefixlen, name) in keys.items():
+            if self._hosts.get(prefix) != wanted[prefix]:
+                self.host_table[self.host_table.Key(prefixlen, name)] = self.host_table.Leaf(wanted[prefix])
+        self._hosts = {prefix: wanted[prefix] for prefix in keys}
+
+    def _sync_cgroups(self, wanted: Dict[int, int]) -> None:
+        for cgid in self._cgroups.keys() - wanted.keys():
+            try:
+                del self.cgroup_table[self.cgroup_table.Key(cgid)]
+            except KeyError:
+                pass
+        for cgid, action in wanted.items():
+            if self._cgroups.get(cgid) != action:
+                self.cgroup_table[self.cgroup_table.Key(cgid)] = self.cgroup_table.Leaf(action)
+        self._cgroups = wanted
@@ -0,0 +1,102 @@
+"""BPF 프로그램 통계 카운터
+
+program.c의 stats 맵(CPU별 배열)을 읽어 프로메테우스 카운터로 내보냅니다.
+exec가 파이프라인의 어느 단계에서 걸러지거나 실패했는지를 DEBUG 로그 없이 확인할 수 있습니다.
+"""
+
+from typing import Dict
+
+from ..metrics.prometheus import (
+    BPF_KERNEL_STATS, BPF_PROCESS_MAP_CAPACITY, BPF_PROCESS_MAP_ENTRIES,
+    BPF_PROCESS_MAP_EVICTIONS, BPF_SUBMIT_FAILED_EVENTS
+)
+from ..utils.logging import get_logger
+
+# program.c의 STAT_* 인덱스 순서와 일치해야 함
+STAT_NAMES = [
+    "exec_forwarded",  # 커널 필터를 통과해 수집된 exec
+    "exec_dropped",    # 커널 필터에서 버려진 exec
+    "process_inserted",       # process_data에 새로 추가된 항목
+    "process_insert_failed",  # process_data 추가 실패
+    "process_deleted",        # process_data에서 삭제된 항목
+    "dentry_cache_hit",       # 경로 캐시 적중
+    "dentry_cache_miss",      # 경로 캐시 실패 (dentry 순회 수행)
+    "thread_exit_skipped",    # 마지막 쓰레드가 아니어서 건너뛴 종료
+    "exec_throttled",         # 호스트별 실행 빈도 제한으로 버려진 exec
+    "exec_seen",              # init_handler에 들어온 모든 exec
+    "exec_not_selected",      # 호스트네임/cgroup 선택 규칙에서 제외된 exec
+    "binary_failed",          # binary_handler 단계 실패
+    "cwd_failed",             # cwd_handler 단계 실패
+    "args_failed",            # args_handler 단계 실패
+    "tail_call_failed",       # 꼬리 호출 실패
+    "exit_submitted",         # 사용자 공간으로 전송한 종료 레코드
+    "exit_failed",            # 종료 레코드 조립 실패
+    "err_dentry_too_deep",    # 전송한 레코드 중 ERR_DENTRY_TOO_DEEP
+    "err_dname_too_long",     # 전송한 레코드 중 ERR_DNAME_TOO_LONG
+    "err_args_too_long",      # 전송한 레코드 중 ERR_ARGS_TOO_LONG
+    "submit_failed",          # 버퍼가 가득 차 전송하지 못한 레코드
+]
+
+
+def read_stats(table) -> Dict[str, int]:
+    """CPU별 카운터를 합산하여 이름별 값으로 반환"""
+    return {
+        name: int(table.sum(table.Key(idx)).value)
+        for idx, name in enumerate(STAT_NAMES)
+    }
+
+
+class BPFStatsScraper:
+    """stats 맵의 누적값 증가분을 프로메테우스 카운터에 반영"""
+
+    def __init__(self, table):
+        self.logger = get_logger(__name__)
+        self.table = table
+        self._last: Dict[str, int] = {}
+
+    def __call__(self) -> None:
+        for name, value in read_stats(self.table).items():
+            delta = value - self._last.get(name, 0)
+            if delta > 0:
+                BPF_KERNEL_STATS.labels(stat=name).inc(delta)
+                if name == "submit_failed":
+                    # 링 버퍼에는 유실 콜백이 없으므로 perf 유실 수와 별도로 내보냄
+                    BPF_SUBMIT_FAILED_EVENTS.inc(delta)
+                    self.logger.warning(f"[유실] 이벤트 버퍼가 가득 차 {delta}개 레코드 전송 실패")
+            self._last[name] = value
+
+
+class ProcessMapScraper:
+    """process_data 맵 점유율과 LRU 퇴출 수를 프로메테우스에 반영
+
+    LRU 맵은 퇴출 수를 따로 알려주지 않으므로, 추가된 항목 수에서 삭제된 항목 수와
+    현재 항목 수를 뺀 값으로 퇴출 수를 추정합니다.
+    """
+
+    def __init__(self, process_table, stats_table, capacity: int, inherited: int = 0):
+        """
+        Args:
+            inherited: 고정 맵에서 이어받은 항목 수 (이번 실행의 추가 수에 포함되지 않으므로 더해 줌)
+        """
+        self.process_table = process_table
+        self.stats_table = stats_table
+        self.capacity = capacity
+        self.inherited = inherited
+        self._evicted = 0
+        BPF_PROCESS_MAP_CAPACITY.set(capacity)
+
+    def evictions(self, entries: int) -> int:
+        """현재 항목 수 기준 누적 퇴출 수 추정값"""
+        stats = read_stats(self.stats_table)
+        inserted = stats["process_inserted"] + self.inherited
+        return max(inserted - stats["process_deleted"] - entries, 0)
+
+    def __call__(self) -> None:
+        # BCC 테이블의 len()은 키를 순회하여 센다
+        entries = len(self.process_table)
+        BPF_PROCESS_MAP_ENTRIES.set(entries)
+
+        evicted = self.evictions(entries)
+        if evicted > self._evicted:
+            BPF_PROCESS_MAP_EVICTIONS.inc(evicted - self._evicted)
+            self._evicted = evicted
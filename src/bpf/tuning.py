@@ -0,0 +1,99 @@
+"""perf 버퍼 크기 자동 조정
+
+이전 실행에서 관측한 유실률을 상태 파일에 저장해 두었다가,
+다음 시작 시 유실률이 목표치를 넘었으면 CPU당 페이지 수를 늘립니다.
+"""
+
+import json
+import os
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+from ..utils.logging import get_logger
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+
+def next_power_of_two(value: int) -> int:
+    """value 이상인 가장 작은 2의 거듭제곱"""
+    return 1 << max(value - 1, 0).bit_length()
+
+
+def buffer_bytes(page_cnt: int, cpu_count: int) -> int:
+    """CPU별 perf 버퍼가 차지하는 전체 메모리 (바이트)"""
+    return page_cnt * PAGE_SIZE * cpu_count
+
+
+@dataclass
+class BufferUsage:
+    """한 번의 실행 동안 관측한 perf 버퍼 사용 결과"""
+    page_cnt: int
+    received: int
+    lost: int
+
+    @property
+    def loss_rate(self) -> float:
+        total = self.received + self.lost
+        return self.lost / total if total else 0.0
+
+
+class PerfBufferTuner:
+    """유실률 기반 perf 버퍼 페이지 수 결정"""
+
+    def __init__(self, state_path: str, base_page_cnt: int, max_page_cnt: int,
+                 target_loss_rate: float):
+        self.logger = get_logger(__name__)
+        self.state_path = state_path
+        self.base_page_cnt = next_power_of_two(base_page_cnt)
+        self.max_page_cnt = next_power_of_two(max_page_cnt)
+        self.target_loss_rate = target_loss_rate
+
+    def recommend(self, usage: BufferUsage) -> int:
+        """관측 결과로부터 다음 실행에 사용할 페이지 수 계산
+
+        유실률이 목표치 이하이면 현재 크기를 유지하고, 초과하면
+        유실분을 수용할 수 있도록 (받은 + 유실) / 받은 배율만큼 키웁니다.
+        최소 두 배로 늘리며 max_page_cnt를 넘지 않습니다.
+        """
+        if usage.loss_rate <= self.target_loss_rate:
+            return usage.page_cnt
+        scale = (usage.received + usage.lost) / max(usage.received, 1)
+        wanted = max(int(usage.page_cnt * scale + 0.5), usage.page_cnt * 2)
+        return min(next_power_of_two(wanted), self.max_page_cnt)
+
+    def load(self) -> Optional[BufferUsage]:
+        """이전 실행의 사용 결과 읽기"""
+        try:
+            with open(self.state_path) as f:
+                return BufferUsage(**json.load(f))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as e:
+            self.logger.warning(f"[튜닝] 상태 파일 읽기 실패: {self.state_path}, 오류: {e}")
+            return None
+
+    def save(self, usage: BufferUsage) -> None:
+        """이번 실행의 사용 결과 저장"""
+        try:
+            os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+            tmp_path = f"{self.state_path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(asdict(usage), f)
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            self.logger.warning(f"[튜닝] 상태 파일 저장 실패: {self.state_path}, 오류: {e}")
+
+    def page_cnt(self) -> int:
+        """이번 실행에 사용할 페이지 수"""
+        previous = self.load()
+        if previous is None:
+            return self.base_page_cnt
+
+        page_cnt = max(self.recommend(previous), self.base_page_cnt)
+        if page_cnt != previous.page_cnt:
+            self.logger.info(
+                f"[튜닝] 이전 유실률 {previous.loss_rate:.4%} "
+                f"(수신={previous.received}, 유실={previous.lost}) - "
+                f"perf 버퍼 {previous.page_cnt} -> {page_cnt} 페이지"
+            )
+        return page_cnt
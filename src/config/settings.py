@@ -50,8 +50,113 @@ class Settings:
         # 로깅 설정
         self.log_level = os.getenv("LOG_LEVEL", "INFO").upper()
 
+        # 이벤트 루프: asyncio(기본) 또는 uvloop (설치되어 있지 않으면 asyncio 사용)
+        self.event_loop = os.getenv("EVENT_LOOP", "asyncio").lower()
+
+        # 이벤트 큐 설정: 최대 크기(0이면 무제한)와 가득 찼을 때의 정책
+        # (drop_oldest, drop_newest, drop_run_first)
+        self.event_queue_size = int(os.getenv("EVENT_QUEUE_SIZE", "10000"))
+        self.event_queue_policy = os.getenv("EVENT_QUEUE_POLICY", "drop_run_first").lower()
+        # 학생별 순서 보장 레인 수: 호스트네임 해시로 레인을 정하고 레인마다 워커 하나가 순서대로 처리
+        # (0이면 레인 없이 EVENT_WORKERS개 워커가 하나의 큐를 공유, 순서 보장 안 함)
+        # 레인별 최대 크기는 EVENT_QUEUE_SIZE / EVENT_LANES
+        self.event_lanes = int(os.getenv("EVENT_LANES", "64"))
+        # 핸들러 체인을 실행하는 워커 수 (동시 처리 이벤트 상한, API 서버가 느리면 큐에 쌓임)
+        self.event_workers = int(os.getenv("EVENT_WORKERS", "64"))
+        # 종료(SIGTERM) 시 남은 이벤트를 처리할 기한 (초, 파드의 terminationGracePeriodSeconds보다 짧게)
+        self.shutdown_drain_timeout_sec = float(os.getenv("SHUTDOWN_DRAIN_TIMEOUT_SEC", "20"))
+        # 기한 안에 처리하지 못한 이벤트를 저장하고 다음 시작 시 다시 전송할 파일 (빈 값이면 사용 안 함)
+        self.event_spool_path = os.getenv("EVENT_SPOOL_PATH", "/var/lib/watcher-proc/spool.jsonl")
+
         # 프로메테우스 설정
         self.prometheus_port = int(os.getenv("PROMETHEUS_PORT", "9090"))
+        # 커널 맵 등 주기적으로 읽어오는 메트릭의 갱신 주기 (초)
+        self.metrics_scrape_interval = float(os.getenv("METRICS_SCRAPE_INTERVAL", "15"))
+
+        # BPF 이벤트 전송 설정
+        # auto: 커널 5.8 이상이면 ringbuf, 그 외에는 perf 버퍼 사용
+        self.bpf_transport = os.getenv("BPF_TRANSPORT", "auto").lower()
+        # 링 버퍼 크기 (페이지 단위, 2의 거듭제곱이어야 함)
+        self.ringbuf_page_cnt = int(os.getenv("RINGBUF_PAGE_CNT", "256"))
+        # 사용자 공간 깨우기 조건: 이벤트가 N개 쌓이거나 타임아웃이 지났을 때
+        self.ringbuf_wakeup_batch = int(os.getenv("RINGBUF_WAKEUP_BATCH", "32"))
+        self.ringbuf_wakeup_timeout_ms = int(os.getenv("RINGBUF_WAKEUP_TIMEOUT_MS", "100"))
+        # 폴링 대기 시간 (종료 요청 확인 및 깨우기 없이 제출된 이벤트 소비 주기)
+        self.bpf_poll_timeout_ms = int(os.getenv("BPF_POLL_TIMEOUT_MS", "100"))
+        # 이벤트 소비 방식: thread(폴링 쓰레드) 또는 loop(이벤트 루프에서 직접 소비)
+        self.bpf_poll_mode = os.getenv("BPF_POLL_MODE", "thread").lower()
+
+        # perf 버퍼 설정 (CPU당 페이지 수, 2의 거듭제곱이어야 함)
+        self.perf_buffer_page_cnt = int(os.getenv("PERF_BUFFER_PAGE_CNT", "8"))
+        # 재시작 시 이전 실행의 유실률에 따라 perf 버퍼 크기를 자동 조정
+        self.perf_buffer_autotune = os.getenv("PERF_BUFFER_AUTOTUNE", "false").lower() == "true"
+        self.perf_buffer_max_page_cnt = int(os.getenv("PERF_BUFFER_MAX_PAGE_CNT", "1024"))
+        self.perf_buffer_target_loss_rate = float(os.getenv("PERF_BUFFER_TARGET_LOSS_RATE", "0.001"))
+        self.perf_buffer_state_path = os.getenv(
+            "PERF_BUFFER_STATE_PATH", "/var/lib/watcher-proc/perf_buffer.json"
+        )
+
+        # kheaders 압축 해제 캐시 디렉토리 (커널 릴리스별 하위 디렉토리, 빈 값이면 사용 안 함)
+        # 파드 재시작 시 압축 해제만 건너뛰며, program.c는 매번 clang으로 컴파일함
+        self.bpf_header_cache_dir = os.getenv("BPF_HEADER_CACHE_DIR", "/var/lib/watcher-proc/kheaders")
+
+        # process_data와 링 버퍼를 고정할 bpffs 디렉토리 (재시작 후 재사용, 빈 값이면 사용 안 함)
+        self.bpf_pin_dir = os.getenv("BPF_PIN_DIR", "/sys/fs/bpf/watcher-proc")
+
+        # 256 bytes를 넘는 명령줄 인수를 256 bytes 청크로 추가 수집할 최대 개수 (0이면 잘라냄, 최대 28)
+        self.argv_max_chunks = int(os.getenv("ARGV_MAX_CHUNKS", "8"))
+
+        # 호스트네임(학생 컨테이너)별 exec 빈도 제한: 초당 횟수와 연속 허용 횟수 (0이면 사용 안 함)
+        # 선택된 모든 exec(KERNEL_EXEC_FILTER를 켜면 필터를 통과한 exec만)를 세므로,
+        # make 한 번에도 cc1/as/ld/셸 exec가 많아 버스트를 넘지 않도록 설정해야 함
+        self.exec_rate_limit = int(os.getenv("EXEC_RATE_LIMIT", "0"))
+        self.exec_rate_burst = int(os.getenv("EXEC_RATE_BURST", "200"))
+
+        # exec 시작 알림을 받아 종료하지 않는 프로세스 추적
+        self.exec_events = os.getenv("EXEC_EVENTS", "false").lower() == "true"
+        # 장기 실행으로 보고할 실행 시간 (초)
+        self.long_running_threshold_sec = float(os.getenv("LONG_RUNNING_THRESHOLD_SEC", "300"))
+        # 추적 목록 크기 제한과 종료 이벤트를 받지 못한 항목의 만료 시간 (초)
+        self.inflight_max_entries = int(os.getenv("INFLIGHT_MAX_ENTRIES", "65536"))
+        self.inflight_ttl_sec = float(os.getenv("INFLIGHT_TTL_SEC", "86400"))
+
+        # 커널 dentry 경로 캐시 크기 (0이면 매번 dentry를 순회)
+        self.dentry_cache_size = int(os.getenv("DENTRY_CACHE_SIZE", "4096"))
+        # 캐시한 경로의 유효 시간 (상위 디렉토리 이름 변경 반영 지연 상한, 초)
+        self.dentry_cache_ttl_sec = int(os.getenv("DENTRY_CACHE_TTL_SEC", "60"))
+
+        # process_data 맵 최대 항목 수 (가득 차면 LRU로 오래된 항목을 밀어냄)
+        self.process_data_max_entries = int(os.getenv("PROCESS_DATA_MAX_ENTRIES", "10240"))
+
+        # 커널 exec 필터: PROCESS_PATTERNS 실행 파일과 과제 디렉토리 내 실행 파일만
+        # 경로 수집 단계로 넘기고 나머지는 커널에서 버림
+        # (TOOLCHAIN_GROUPING을 켜면 cc1/as/collect2/ld 등 하위 단계 실행 파일도 허용 목록에 추가)
+        self.kernel_exec_filter = os.getenv("KERNEL_EXEC_FILTER", "false").lower() == "true"
+        # 새 컨테이너의 실행 파일을 허용 목록에 반영하는 주기 (초)
+        self.exec_allowlist_refresh_sec = float(os.getenv("EXEC_ALLOWLIST_REFRESH_SEC", "10"))
+
+        # 수집 대상 선택: 호스트네임 접두어 허용/거부 목록 (쉼표 구분, 가장 긴 접두어 규칙 적용)
+        # 예: HOST_DENY_PREFIXES=jcode-os-2- 이면 os-2 분반만 수집 중단
+        self.host_allow_prefixes = _split_list(os.getenv("HOST_ALLOW_PREFIXES", "jcode-"))
+        self.host_deny_prefixes = _split_list(os.getenv("HOST_DENY_PREFIXES", ""))
+        # cgroup 규칙 사용 여부 (커널 5.6 이상, cgroup v2) 및 허용/거부 cgroup 경로 (cgroup_root 기준)
+        self.cgroup_rules = os.getenv("CGROUP_RULES", "false").lower() == "true"
+        self.cgroup_allow = _split_list(os.getenv("CGROUP_ALLOW", ""))
+        self.cgroup_deny = _split_list(os.getenv("CGROUP_DENY", ""))
+        self.cgroup_root = os.getenv("CGROUP_ROOT", "/sys/fs/cgroup")
+        # 실행 중 갱신할 수 있는 선택 규칙 파일 (JSON, 있으면 위 설정 대신 사용)과 확인 주기 (초)
+        self.selection_rules_path = os.getenv("SELECTION_RULES_PATH", "/etc/watcher-proc/selection.json")
+        self.selection_refresh_sec = float(os.getenv("SELECTION_REFRESH_SEC", "10"))
+
+        # 컴파일러 하위 단계(cc1, as, collect2, ld)를 개별 이벤트 대신 드라이버 이벤트의 단계별 시간으로 합침
+        self.toolchain_grouping = os.getenv("TOOLCHAIN_GROUPING", "true").lower() == "true"
+        # 드라이버 종료를 기다리는 묶음 최대 수 (초과 시 가장 오래된 묶음부터 버림, INFLIGHT_TTL_SEC가 지나면 만료)
+        self.toolchain_max_pending = int(os.getenv("TOOLCHAIN_MAX_PENDING", "1024"))
+
+
+def _split_list(value: str) -> List[str]:
+    """쉼표로 구분한 환경 변수 값을 목록으로 변환"""
+    return [item.strip() for item in value.split(",") if item.strip()]
 
 
 # 싱글톤 인스턴스 생성
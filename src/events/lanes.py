@@ -0,0 +1,79 @@
+"""학생별 순서 보장 레인
+
+이벤트마다 독립적으로 처리하면 API 지연이 들쭉날쭉할 때 한 학생의 컴파일 이벤트와
+뒤따르는 실행 이벤트가 순서가 바뀐 채 서버에 도착합니다. 호스트네임(학생 컨테이너)의
+해시로 고정된 수의 레인 중 하나를 정하고, 레인마다 워커 하나가 순서대로 처리하여
+같은 학생의 이벤트는 커널 순서를 유지하고 다른 학생의 이벤트는 병렬로 처리합니다.
+
+레인마다 크기 제한 큐(EventQueue)를 두므로, 이벤트가 몰리는 학생은 자기 레인에서만
+과부하 정책이 적용되어 다른 학생의 이벤트를 밀어내지 않습니다.
+"""
+
+import asyncio
+import zlib
+from typing import List
+
+from .queue import POLICY_DROP_OLDEST, Classifier, EventQueue
+from .workers import Handler, WorkerPool
+from ..bpf.event import RawBpfEvent
+from ..metrics.prometheus import EVENT_LANE_DEPTH, EVENT_QUEUE_DEPTH
+
+
+def lane_of(hostname: str, lanes: int) -> int:
+    """호스트네임의 레인 번호 (프로세스 재시작에도 같은 값인 crc32 사용)"""
+    return zlib.crc32(hostname.encode()) % lanes
+
+
+class LaneQueue:
+    """호스트네임 해시로 나눈 레인별 EventQueue 묶음"""
+
+    def __init__(self, lanes: int, maxsize: int, policy: str = POLICY_DROP_OLDEST,
+                 classify: Classifier = None):
+        """
+        Args:
+            lanes: 레인 수
+            maxsize: 전체 최대 이벤트 수 (레인마다 maxsize / lanes, 0이면 무제한)
+            policy: 레인이 가득 찼을 때의 과부하 정책
+            classify: 이벤트 종류(빌드/실행) 분류 함수
+        """
+        if lanes < 1:
+            raise ValueError(f"레인 수는 1 이상이어야 함: {lanes}")
+        per_lane = max(1, maxsize // lanes) if maxsize > 0 else 0
+        self.lanes: List[EventQueue] = [
+            EventQueue(per_lane, policy, classify, depth=EVENT_LANE_DEPTH.labels(lane=str(i)))
+            for i in range(lanes)
+        ]
+        # 전체 대기 이벤트 수는 수집 시점에 레인 합계로 계산
+        EVENT_QUEUE_DEPTH.set_function(self.qsize)
+
+    def lane(self, event: RawBpfEvent) -> EventQueue:
+        return self.lanes[lane_of(event.hostname, len(self.lanes))]
+
+    def put_nowait(self, event: RawBpfEvent) -> bool:
+        """이벤트를 호스트네임의 레인에 추가 (버렸으면 False)"""
+        return self.lane(event).put_nowait(event)
+
+    def qsize(self) -> int:
+        return sum(lane.qsize() for lane in self.lanes)
+
+    def empty(self) -> bool:
+        return all(lane.empty() for lane in self.lanes)
+
+    def drain(self) -> List[RawBpfEvent]:
+        """모든 레인의 남은 이벤트를 꺼냄 (레인 안에서는 도착 순서)"""
+        return [event for lane in self.lanes for event in lane.drain()]
+
+    async def join(self) -> None:
+        """모든 레인의 이벤트 처리가 끝날 때까지 대기"""
+        for lane in self.lanes:
+            await lane.join()
+
+
+class LanePool(WorkerPool):
+    """레인마다 워커 하나가 순서대로 처리하는 워커 풀"""
+
+    def __init__(self, queue: LaneQueue, handle: Handler):
+        super().__init__(queue, handle, len(queue.lanes))
+
+    def _assignments(self) -> List[asyncio.Queue]:
+        return list(self.queue.lanes)
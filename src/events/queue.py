@@ -0,0 +1,145 @@
+"""크기 제한 이벤트 큐
+
+API 서버가 느려지면 처리하지 못한 이벤트가 큐에 쌓여 메모리가 늘어나므로,
+최대 크기를 넘으면 과부하 정책에 따라 이벤트를 버립니다.
+
+과부하 정책:
+- drop_oldest: 가장 오래된 이벤트를 버리고 새 이벤트를 넣음
+- drop_newest: 새 이벤트를 버림
+- drop_run_first: 실행 이벤트를 빌드 이벤트보다 먼저 버림
+  (큐에 실행 이벤트가 있으면 가장 오래된 실행 이벤트를, 새 이벤트가 실행 이벤트이면
+  새 이벤트를, 빌드 이벤트만 남았으면 가장 오래된 빌드 이벤트를 버림)
+
+실행/빌드 이벤트는 따로 보관하고 순번으로 전체 도착 순서를 유지합니다.
+"""
+
+import asyncio
+import itertools
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from ..bpf.event import RawBpfEvent
+from ..metrics.prometheus import EVENT_QUEUE_DEPTH, EVENT_QUEUE_DROPPED
+
+# 과부하 정책
+POLICY_DROP_OLDEST = "drop_oldest"
+POLICY_DROP_NEWEST = "drop_newest"
+POLICY_DROP_RUN_FIRST = "drop_run_first"
+POLICIES = (POLICY_DROP_OLDEST, POLICY_DROP_NEWEST, POLICY_DROP_RUN_FIRST)
+
+# 이벤트 종류 (메트릭 라벨)
+KIND_BUILD = "build"
+KIND_RUN = "run"
+
+Classifier = Callable[[RawBpfEvent], str]
+
+
+def compiler_classifier(compiler_paths: Iterable[str]) -> Classifier:
+    """컴파일러 실행 파일이면 빌드, 그 외는 실행 이벤트로 분류
+
+    ProcessFilter와 같은 부분 문자열 비교를 사용합니다.
+    """
+    paths = tuple(compiler_paths)
+
+    def classify(event: RawBpfEvent) -> str:
+        if any(path in event.binary_path for path in paths):
+            return KIND_BUILD
+        return KIND_RUN
+    return classify
+
+
+class _KindQueues:
+    """종류별 deque (asyncio.Queue 내부 저장소)"""
+
+    def __init__(self):
+        self.items: Dict[str, Deque[Tuple[int, RawBpfEvent]]] = {
+            KIND_BUILD: deque(), KIND_RUN: deque()
+        }
+
+    def __len__(self) -> int:
+        return sum(len(items) for items in self.items.values())
+
+    def oldest(self) -> Optional[str]:
+        """가장 먼저 들어온 이벤트의 종류"""
+        heads = [(items[0][0], kind) for kind, items in self.items.items() if items]
+        return min(heads)[1] if heads else None
+
+
+class EventQueue(asyncio.Queue):
+    """과부하 정책이 있는 크기 제한 큐
+
+    asyncio.Queue의 maxsize는 put()을 막아 생산자를 멈추게 하지만, 생산자인 BPF 폴링은
+    멈출 수 없으므로 크기는 put_nowait()에서 정책으로 제한합니다.
+    """
+
+    def __init__(self, maxsize: int, policy: str = POLICY_DROP_OLDEST,
+                 classify: Optional[Classifier] = None, depth=EVENT_QUEUE_DEPTH):
+        """
+        Args:
+            maxsize: 최대 이벤트 수 (0이면 무제한)
+            policy: 가득 찼을 때의 과부하 정책
+            classify: 이벤트 종류(빌드/실행) 분류 함수
+            depth: 큐 길이를 기록할 게이지
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"알 수 없는 과부하 정책: {policy} (가능: {', '.join(POLICIES)})")
+        self.limit = maxsize
+        self.policy = policy
+        self.classify = classify or (lambda event: KIND_RUN)
+        self.depth = depth
+        self._seq = itertools.count()
+        super().__init__()
+
+    def _init(self, maxsize: int) -> None:
+        self._queue = _KindQueues()
+
+    def _put(self, entry: Tuple[str, RawBpfEvent]) -> None:
+        kind, item = entry
+        self._queue.items[kind].append((next(self._seq), item))
+
+    def _get(self) -> RawBpfEvent:
+        _, item = self._queue.items[self._queue.oldest()].popleft()
+        self.depth.set(len(self._queue))
+        return item
+
+    def put_nowait(self, item: RawBpfEvent) -> bool:
+        """이벤트 추가, 가득 찼으면 과부하 정책 적용
+
+        Returns:
+            새 이벤트를 넣었으면 True, 버렸으면 False
+        """
+        kind = self.classify(item)
+        if self.limit > 0 and self.qsize() >= self.limit:
+            if not self._make_room(kind):
+                EVENT_QUEUE_DROPPED.labels(reason="newest", kind=kind).inc()
+                return False
+        super().put_nowait((kind, item))
+        self.depth.set(len(self._queue))
+        return True
+
+    def drain(self) -> List[RawBpfEvent]:
+        """남은 이벤트를 모두 꺼냄 (도착 순서)"""
+        events = []
+        while not self.empty():
+            events.append(self.get_nowait())
+            self.task_done()
+        return events
+
+    def _make_room(self, incoming: str) -> bool:
+        """정책에 따라 큐의 이벤트 하나를 버림, 새 이벤트를 버려야 하면 False"""
+        if self.policy == POLICY_DROP_NEWEST:
+            return False
+        if self.policy == POLICY_DROP_RUN_FIRST:
+            if self._queue.items[KIND_RUN]:
+                self._evict(KIND_RUN, "run_first")
+                return True
+            if incoming == KIND_RUN:
+                return False
+        self._evict(self._queue.oldest(), "oldest")
+        return True
+
+    def _evict(self, kind: str, reason: str) -> None:
+        self._queue.items[kind].popleft()
+        EVENT_QUEUE_DROPPED.labels(reason=reason, kind=kind).inc()
+        # put()에서 늘린 미완료 작업 수를 맞춰 join()이 멈추지 않도록 함
+        self.task_done()
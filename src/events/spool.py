@@ -0,0 +1,135 @@
+"""미전송 이벤트 스풀
+
+종료 기한 안에 처리하지 못한 이벤트를 로컬 JSONL 파일에 저장하고, 다음 시작 시
+다시 큐에 넣어 전송합니다. 스풀 디렉토리는 호스트 경로(/var/lib/watcher-proc)이므로
+DaemonSet 롤아웃으로 파드가 교체되어도 같은 노드의 새 파드가 이어서 처리합니다.
+
+이벤트의 exec/종료 시각은 커널 단조 시각이라 부팅마다 기준이 달라지므로, 레코드마다
+부팅 ID와 저장 시점의 실제 시각 - 단조 시각 차이를 함께 저장합니다. 노드가 재부팅된 뒤
+복구하면 현재 부팅의 단조 시각으로 변환하고, 변환할 수 없는 레코드는 시각을 버립니다
+(이 경우 메타데이터 보강 단계가 처리 시각을 사용).
+
+처리 중에 취소된 이벤트는 API 요청이 서버에 도달했을 수도 있으므로, 재전송 시
+중복될 수 있습니다 (유실보다 중복을 택함).
+"""
+
+import dataclasses
+import json
+import os
+from typing import Iterable, List, Optional
+
+from ..bpf.event import RawBpfEvent
+from ..utils.clock import MonotonicClock, kernel_clock
+from ..utils.logging import get_logger
+
+_FIELDS = {f.name for f in dataclasses.fields(RawBpfEvent)}
+# 커널 단조 시각 필드 (0이면 알 수 없음)
+_KTIME_FIELDS = ("exec_ns", "exit_ns")
+
+BOOT_ID_PATH = "/proc/sys/kernel/random/boot_id"
+
+
+def read_boot_id(path: str = BOOT_ID_PATH) -> Optional[str]:
+    """현재 부팅 ID (읽을 수 없으면 None)"""
+    try:
+        with open(path) as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+class EventSpool:
+    """RawBpfEvent를 한 줄에 하나씩 저장하는 JSONL 파일"""
+
+    def __init__(self, path: str, clock: MonotonicClock = kernel_clock,
+                 boot_id_path: str = BOOT_ID_PATH):
+        """
+        Args:
+            path: 스풀 파일 경로 (빈 값이면 저장하지 않음)
+            clock: 커널 단조 시각 -> 실제 시각 변환기
+            boot_id_path: 부팅 ID 파일
+        """
+        self.path = path
+        self.clock = clock
+        self.boot_id_path = boot_id_path
+        self.logger = get_logger(__name__)
+
+    def write(self, events: Iterable[RawBpfEvent]) -> int:
+        """이벤트를 스풀 파일 끝에 추가
+
+        Returns:
+            저장한 이벤트 수 (스풀을 사용하지 않거나 쓰기에 실패하면 0)
+        """
+        events = list(events)
+        if not self.path or not events:
+            return 0
+        boot_id = read_boot_id(self.boot_id_path)
+        offset_ns = self.clock.calibrate()
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "a") as f:
+                for event in events:
+                    record = {
+                        "boot_id": boot_id,
+                        "clock_offset_ns": offset_ns,
+                        "event": dataclasses.asdict(event),
+                    }
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.error(f"[스풀] 이벤트 저장 실패: {e}")
+            return 0
+        return len(events)
+
+    def replay(self) -> List[RawBpfEvent]:
+        """저장된 이벤트를 읽고 스풀 파일 삭제
+
+        읽을 수 없는 줄은 건너뛰고, 이전 버전에 없던 필드는 기본값을 사용합니다.
+        """
+        if not self.path or not os.path.exists(self.path):
+            return []
+        boot_id = read_boot_id(self.boot_id_path)
+        offset_ns = self.clock.calibrate()
+        events = []
+        skipped = 0
+        unstamped = 0
+        try:
+            with open(self.path) as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        fields = {k: v for k, v in record["event"].items() if k in _FIELDS}
+                        if record.get("boot_id") != boot_id or boot_id is None:
+                            if not self._convert_ktime(fields, record.get("clock_offset_ns"), offset_ns):
+                                unstamped += 1
+                        fields["replayed"] = True
+                        events.append(RawBpfEvent(**fields))
+                    except (KeyError, TypeError, ValueError, AttributeError):
+                        skipped += 1
+            os.unlink(self.path)
+        except OSError as e:
+            self.logger.error(f"[스풀] 스풀 파일 읽기 실패: {e}")
+            return []
+        if skipped:
+            self.logger.warning(f"[스풀] 읽을 수 없는 줄 {skipped}개 건너뜀")
+        if unstamped:
+            self.logger.warning(f"[스풀] 다른 부팅의 시각을 변환할 수 없어 {unstamped}개 이벤트의 시각을 버림")
+        return events
+
+    @staticmethod
+    def _convert_ktime(fields: dict, saved_offset_ns: Optional[int], offset_ns: int) -> bool:
+        """다른 부팅에서 저장한 단조 시각을 현재 부팅 기준으로 변환
+
+        실제 시각 = 단조 시각 + 차이이므로, 저장 당시 차이로 실제 시각을 구한 뒤
+        현재 차이를 빼서 현재 부팅의 단조 시각으로 바꿉니다 (부팅 전 시각이면 음수).
+        저장 당시 차이가 없으면 시각을 0(알 수 없음)으로 바꾸고 False를 반환합니다.
+        """
+        if saved_offset_ns is None:
+            for name in _KTIME_FIELDS:
+                fields[name] = 0
+            return False
+        for name in _KTIME_FIELDS:
+            if fields.get(name):
+                fields[name] = fields[name] + saved_offset_ns - offset_ns
+        return True
@@ -0,0 +1,77 @@
+"""이벤트 처리 워커 풀
+
+큐에서 이벤트를 꺼낼 때마다 태스크를 만들면 태스크 수에 제한이 없고, 만든 태스크를
+추적하지 않아 종료 시 처리 중인 이벤트를 기다릴 수 없습니다. 고정된 수의 워커가
+TaskGroup 안에서 큐를 소비하고, 처리를 마친 뒤에 task_done()을 호출하므로
+큐의 join()은 처리 중인 이벤트까지 끝나야 반환됩니다.
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, List, Optional
+
+from ..bpf.event import RawBpfEvent
+from ..metrics.prometheus import EVENT_INFLIGHT, EVENT_WORKER_BUSY_SECONDS
+from ..utils.logging import get_logger
+
+Handler = Callable[[RawBpfEvent], Awaitable[None]]
+
+
+class WorkerPool:
+    """큐를 소비하는 고정 크기 워커 풀"""
+
+    def __init__(self, queue: asyncio.Queue, handle: Handler, size: int):
+        if size < 1:
+            raise ValueError(f"워커 수는 1 이상이어야 함: {size}")
+        self.queue = queue
+        self.handle = handle
+        self.size = size
+        # 처리를 마친 이벤트 수와 처리 중에 취소된 이벤트 (종료 시 스풀에 저장)
+        self.handled = 0
+        self.interrupted: List[RawBpfEvent] = []
+        self._task: Optional[asyncio.Task] = None
+        self.logger = get_logger(__name__)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def run(self) -> None:
+        """워커를 시작하고 stop()으로 취소될 때까지 실행"""
+        self._task = asyncio.current_task()
+        self.logger.info(f"[워커] {self.size}개 워커 시작")
+        try:
+            async with asyncio.TaskGroup() as group:
+                for worker_id, queue in enumerate(self._assignments()):
+                    group.create_task(self._worker(worker_id, queue), name=f"event-worker-{worker_id}")
+        finally:
+            self._task = None
+
+    def _assignments(self) -> List[asyncio.Queue]:
+        """워커별로 소비할 큐 (모든 워커가 하나의 큐를 공유)"""
+        return [self.queue] * self.size
+
+    def stop(self) -> None:
+        """워커 취소 (처리 중인 이벤트까지 기다리려면 먼저 queue.join())"""
+        if self.running:
+            self._task.cancel()
+
+    async def _worker(self, worker_id: int, queue: asyncio.Queue) -> None:
+        busy = EVENT_WORKER_BUSY_SECONDS.labels(worker=str(worker_id))
+        while True:
+            event = await queue.get()
+            EVENT_INFLIGHT.inc()
+            start = time.perf_counter()
+            try:
+                await self.handle(event)
+            except asyncio.CancelledError:
+                self.interrupted.append(event)
+                raise
+            except Exception as e:
+                # 한 이벤트의 실패가 TaskGroup의 다른 워커를 취소하지 않도록 여기서 처리
+                self.logger.error(f"[워커] 이벤트 처리 실패: {e!r}")
+            finally:
+                busy.inc(time.perf_counter() - start)
+                EVENT_INFLIGHT.dec()
+                queue.task_done()
+            self.handled += 1
@@ -3,7 +3,9 @@ from typing import Optional
 from .base import EventHandler
 from ..api.client import APIClient
 from ..events.models import EventBuilder, Event
+from ..metrics.prometheus import EVENT_E2E_LATENCY
 from ..process.types import ProcessType
+from ..utils.clock import kernel_clock
 
 class APIHandler(EventHandler[EventBuilder, EventBuilder]):
     """API 이벤트 핸들러
@@ -43,6 +45,11 @@ class APIHandler(EventHandler[EventBuilder, EventBuilder]):
             else:
                 success = await self.client.send_binary_execution(event)
             
+            if success and event.base.exit_ns and not event.base.replayed:
+                # 커널 종료 시각부터 API 응답까지의 파이프라인 지연
+                # (스풀에서 복구한 이벤트는 재시작 시간이 포함되고 재부팅 후 시각은 추정값이므로 제외)
+                EVENT_E2E_LATENCY.observe(kernel_clock.elapsed_sec(event.base.exit_ns))
+
             # API 전송 성공 시 빌더 반환
             return builder if success else None
             
@@ -1,6 +1,7 @@
 """메타데이터 보강 핸들러
 
 이벤트에 메타데이터(타임스탬프, 분반, 학번 등)를 추가합니다.
+타임스탬프는 커널이 기록한 프로세스 종료 시각이며, 없으면 현재 시각을 사용합니다.
 """
 
 from datetime import datetime, timezone
@@ -8,6 +9,7 @@ from typing import Optional
 
 from .base import EventHandler
 from ..events.models import EventBuilder, EventMetadata
+from ..utils.clock import kernel_clock
 from ..utils.logging import get_logger
 
 class EnrichmentHandler(EventHandler[EventBuilder, EventBuilder]):
@@ -57,7 +59,7 @@ class EnrichmentHandler(EventHandler[EventBuilder, EventBuilder]):
             builder.metadata = EventMetadata(
                 class_div=class_div,
                 student_id=student_id,
-                timestamp=datetime.now(timezone.utc)
+                timestamp=self._exit_time(builder)
             )
             
             # 처리 성공 (DEBUG)
@@ -71,4 +73,11 @@ class EnrichmentHandler(EventHandler[EventBuilder, EventBuilder]):
             
         except Exception as e:
             self.logger.error(f"메타데이터 보강 실패: {str(e)}")
-            return None
\ No newline at end of file
+            return None
+
+    @staticmethod
+    def _exit_time(builder: EventBuilder) -> datetime:
+        """프로세스 종료 시각 (큐 대기 시간과 무관한 커널 기록 시각)"""
+        if builder.base.exit_ns:
+            return kernel_clock.to_datetime(builder.base.exit_ns)
+        return datetime.now(timezone.utc)
\ No newline at end of file
@@ -1,18 +1,168 @@
 """프로메테우스 메트릭 서버
 
 프로메테우스 메트릭 페이지를 노출하는 서버를 구현합니다.
+커널 맵처럼 직접 읽어와야 하는 값은 등록된 스크레이퍼를 주기적으로 실행해 갱신합니다.
 """
 
 import threading
-from prometheus_client import start_http_server
+import time
+from typing import Callable, List
+from prometheus_client import Counter, Gauge, Histogram, start_http_server
 from src.utils.logging import get_logger
 from src.config.settings import settings
 
+# BPF 이벤트 수집 메트릭
+BPF_RECEIVED_EVENTS = Counter(
+    "watcher_bpf_received_events_total",
+    "커널에서 수신한 이벤트 수",
+)
+BPF_LOST_EVENTS = Counter(
+    "watcher_bpf_lost_events_total",
+    "perf 버퍼 오버플로로 유실된 이벤트 수",
+    ["cpu"],
+)
+BPF_SUBMIT_FAILED_EVENTS = Counter(
+    "watcher_bpf_submit_failed_events_total",
+    "이벤트 버퍼가 가득 차 커널에서 전송하지 못한 레코드 수 (링 버퍼 포함)",
+)
+BPF_BUFFER_BYTES = Gauge(
+    "watcher_bpf_buffer_bytes",
+    "이벤트 전송 버퍼에 할당된 메모리 (바이트)",
+    ["transport"],
+)
+BPF_BUFFER_PAGES = Gauge(
+    "watcher_bpf_buffer_pages",
+    "이벤트 전송 버퍼 크기 (perf는 CPU당 페이지 수)",
+    ["transport"],
+)
+BPF_HANDOFF_BATCH_SIZE = Histogram(
+    "watcher_bpf_handoff_batch_size",
+    "폴링 쓰레드에서 이벤트 루프로 한 번에 넘긴 이벤트 수",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024),
+)
+BPF_KERNEL_STATS = Counter(
+    "watcher_bpf_kernel_events_total",
+    "BPF 프로그램 내부 통계 카운터",
+    ["stat"],
+)
+BPF_LOAD_SECONDS = Gauge(
+    "watcher_bpf_load_seconds",
+    "BPF 프로그램 시작 단계별 소요 시간 (초, headers: 커널 헤더 준비, compile: clang 컴파일 및 로드)",
+    ["path", "stage"],
+)
+BPF_LOAD_RSS_BYTES = Gauge(
+    "watcher_bpf_load_rss_bytes",
+    "BPF 프로그램 로드 전후 프로세스 RSS (바이트)",
+    ["path", "stage"],
+)
+BPF_PROCESS_MAP_ENTRIES = Gauge(
+    "watcher_bpf_process_map_entries",
+    "process_data 맵에 들어 있는 항목 수",
+)
+BPF_PROCESS_MAP_CAPACITY = Gauge(
+    "watcher_bpf_process_map_capacity",
+    "process_data 맵 최대 항목 수",
+)
+BPF_PROCESS_MAP_EVICTIONS = Counter(
+    "watcher_bpf_process_map_evictions_total",
+    "process_data 맵이 가득 차서 LRU로 밀려난 항목 수 (추정)",
+)
+BPF_PINNED_ENTRIES_REUSED = Gauge(
+    "watcher_bpf_pinned_entries_reused",
+    "시작 시 고정된 process_data에서 이어받은 실행 중 프로세스 수",
+)
+BPF_PINNED_ORPHANS = Counter(
+    "watcher_bpf_pinned_orphans_total",
+    "수집 중단 동안 종료하여 고정된 process_data에서 종료 미관찰 이벤트로 전송한 항목 수",
+)
+
+EXEC_SUPPRESSED = Counter(
+    "watcher_exec_suppressed_total",
+    "호스트별 실행 빈도 제한으로 커널에서 억제된 exec 수",
+)
+EXEC_THROTTLED_HOSTS = Gauge(
+    "watcher_exec_throttled_hosts",
+    "최근 보고 주기에 실행 빈도 제한에 걸린 호스트 수",
+)
+
+# 이벤트 큐 메트릭
+EVENT_QUEUE_DEPTH = Gauge(
+    "watcher_event_queue_depth",
+    "핸들러 체인 처리를 기다리는 이벤트 수",
+)
+EVENT_QUEUE_DROPPED = Counter(
+    "watcher_event_queue_dropped_total",
+    "큐가 가득 차서 과부하 정책에 따라 버린 이벤트 수",
+    ["reason", "kind"],
+)
+EVENT_LANE_DEPTH = Gauge(
+    "watcher_event_lane_depth",
+    "레인(호스트네임 해시로 나눈 직렬 처리 큐)별 대기 이벤트 수",
+    ["lane"],
+)
+EVENT_INFLIGHT = Gauge(
+    "watcher_event_inflight",
+    "워커가 핸들러 체인에서 처리 중인 이벤트 수",
+)
+EVENT_WORKER_BUSY_SECONDS = Counter(
+    "watcher_event_worker_busy_seconds_total",
+    "워커별 이벤트 처리에 사용한 시간 (rate로 워커 사용률 확인)",
+    ["worker"],
+)
+
+# 파이프라인 지연 메트릭
+EVENT_E2E_LATENCY = Histogram(
+    "watcher_event_e2e_latency_seconds",
+    "커널에서 프로세스 종료를 기록한 시각부터 API 응답까지 걸린 시간",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+
+# 실행 중인 프로세스 추적 메트릭
+PROCESS_INFLIGHT = Gauge(
+    "watcher_process_inflight",
+    "exec 후 아직 종료 이벤트를 받지 않은 프로세스 수",
+)
+PROCESS_LONG_RUNNING = Gauge(
+    "watcher_process_long_running",
+    "임계 시간을 넘겨 실행 중인 프로세스 수",
+)
+PROCESS_INFLIGHT_EXPIRED = Counter(
+    "watcher_process_inflight_expired_total",
+    "종료 이벤트 없이 추적 목록에서 제거된 프로세스 수",
+    ["reason"],
+)
+
+# 컴파일 하위 단계 묶음 메트릭
+TOOLCHAIN_STAGES_FOLDED = Counter(
+    "watcher_toolchain_stages_folded_total",
+    "컴파일러 드라이버 이벤트에 합쳐져 개별 이벤트로 처리하지 않은 하위 단계 수",
+    ["stage"],
+)
+TOOLCHAIN_PENDING = Gauge(
+    "watcher_toolchain_pending",
+    "드라이버 종료를 기다리는 하위 단계 묶음 수",
+)
+
 class PrometheusMetrics:
     """프로메테우스 메트릭 서버 클래스"""
     
     def __init__(self):
         self.logger = get_logger(__name__)
+        self._scrapers: List[Callable[[], None]] = []
+
+    def add_scraper(self, scraper: Callable[[], None]) -> None:
+        """주기적으로 실행할 메트릭 스크레이퍼 등록"""
+        self._scrapers.append(scraper)
+
+    def _run_scrapers(self):
+        """등록된 스크레이퍼를 주기적으로 실행"""
+        while True:
+            for scraper in list(self._scrapers):
+                try:
+                    scraper()
+                except Exception as e:
+                    self.logger.error(f"[프로메테우스] 메트릭 스크레이프 실패: {e}")
+            time.sleep(settings.metrics_scrape_interval)
         
     def _run_metrics_server(self):
         """메트릭 서버 실행"""
@@ -30,4 +180,11 @@ class PrometheusMetrics:
             daemon=True,
             name="prometheus-metrics-server"
         )
-        metrics_thread.start() 
\ No newline at end of file
+        metrics_thread.start()
+
+        scraper_thread = threading.Thread(
+            target=self._run_scrapers,
+            daemon=True,
+            name="prometheus-metrics-scraper"
+        )
+        scraper_thread.start() 
\ No newline at end of file
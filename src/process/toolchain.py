@@ -0,0 +1,183 @@
+"""컴파일 하위 단계 묶음
+
+gcc main.c 한 번은 cc1, as, collect2, ld를 차례로 실행하고, clang은 자기 자신을
+-cc1 옵션으로 다시 실행합니다. 하위 단계는 모두 핸들러 체인까지 올라와 UNKNOWN으로
+버려지거나(cc1, as, ld) 컴파일 이벤트로 중복 전송되므로(clang -cc1), 종료 이벤트의
+부모 PID로 묶어 드라이버 이벤트의 단계별 실행 시간으로 합칩니다.
+
+하위 단계는 드라이버보다 먼저 종료하므로, 부모 PID별로 단계 시간을 모아 두었다가
+같은 PID의 종료 이벤트가 오면 붙입니다. collect2 -> ld처럼 단계가 단계를 실행하면
+CPU별 perf 버퍼에서 ld와 collect2의 도착 순서가 바뀔 수 있으므로, 묶음마다 하위 단계 PID를
+기록해 두고 드라이버 이벤트에 붙일 때 하위 단계의 묶음까지 따라가며 합칩니다.
+
+드라이버 종료 이벤트를 받지 못한 묶음은 PID 재사용 시 무관한 프로세스에 붙을 수 있으므로,
+프로세스의 exec 이전에 종료한 단계는 붙이지 않고 일정 시간이 지난 묶음은 만료합니다.
+"""
+
+import dataclasses
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from ..bpf.event import RawBpfEvent
+from ..metrics.prometheus import TOOLCHAIN_PENDING, TOOLCHAIN_STAGES_FOLDED
+from ..utils.logging import get_logger
+
+# 드라이버가 실행하는 하위 단계 실행 파일 이름
+TOOLCHAIN_STAGES = frozenset({
+    "cc1", "cc1plus", "cc1obj", "lto1", "lto-wrapper", "as", "collect2", "ld",
+})
+
+# 링커 구현별 접미사 (ld.bfd, ld.gold, ld.lld는 ld 단계로 집계)
+LINKER_SUFFIXES = (".bfd", ".gold", ".lld")
+
+# 커널 exec 필터 허용 목록에 추가할 하위 단계 실행 파일 경로 (glob 패턴, 심볼릭 링크는 따라감)
+# clang -cc1은 clang 자신을 다시 실행하므로 PROCESS_PATTERNS만으로 통과함
+TOOLCHAIN_STAGE_PATHS = [
+    f"{base}/gcc/*/*/{name}"
+    for base in ("/usr/lib", "/usr/libexec")
+    for name in ("cc1", "cc1plus", "cc1obj", "lto1", "lto-wrapper", "collect2")
+] + ["/usr/bin/as", "/usr/bin/ld", "/usr/bin/ld.bfd", "/usr/bin/ld.gold", "/usr/bin/ld.lld"]
+
+# 자기 자신을 하위 단계로 다시 실행하는 드라이버의 옵션 (clang -cc1, clang -cc1as)
+CLANG_STAGE_OPTIONS = {"-cc1": "cc1", "-cc1as": "as"}
+
+# 하위 단계 실행 파일이 설치되는 시스템 경로 (과제 디렉토리의 같은 이름 실행 파일은 제외)
+SYSTEM_PREFIXES = ("/usr/", "/bin/", "/lib/", "/lib64/", "/opt/")
+
+
+def _base_stage(name: str) -> Optional[str]:
+    """대상 triplet 접두어와 링커 접미사를 뗀 단계 이름
+
+    Debian/Ubuntu의 /usr/bin/as, /usr/bin/ld는 x86_64-linux-gnu-as,
+    x86_64-linux-gnu-ld.bfd 등을 가리키는 심볼릭 링크이고, 커널은 링크가 아닌
+    실제 파일 경로를 기록하므로 접두어가 붙은 이름도 인식해야 합니다.
+    """
+    for suffix in LINKER_SUFFIXES:
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+            break
+    if name in TOOLCHAIN_STAGES:
+        return name
+    # <arch>-<vendor/os>-<abi>- 형태의 triplet 접두어 (하이픈 2개 이상)
+    for i, ch in enumerate(name):
+        if ch == "-" and name.count("-", 0, i) >= 2 and name[i + 1:] in TOOLCHAIN_STAGES:
+            return name[i + 1:]
+    return None
+
+
+def stage_name(event: RawBpfEvent) -> Optional[str]:
+    """하위 단계 이름, 하위 단계가 아니면 None"""
+    if not event.binary_path.startswith(SYSTEM_PREFIXES):
+        return None
+    name = os.path.basename(event.binary_path)
+    stage = _base_stage(name)
+    if stage:
+        return stage
+    if name.startswith("clang"):
+        # 첫 번째 인자가 실행 파일 이름이므로 두 번째 인자 확인
+        parts = event.args.split(" ", 2)
+        if len(parts) > 1:
+            return CLANG_STAGE_OPTIONS.get(parts[1])
+    return None
+
+
+@dataclass
+class _Pending:
+    """한 부모 PID가 실행한 하위 단계 묶음"""
+    phases: Dict[str, float] = field(default_factory=dict)
+    children: List[int] = field(default_factory=list)  # 하위 단계 PID (단계가 다시 단계를 실행했을 수 있음)
+    first_exit_ns: int = 0  # 가장 먼저 종료한 하위 단계의 커널 종료 시각 (0이면 알 수 없음)
+    touched_ns: int = 0     # 마지막으로 단계를 추가한 시각 (만료 판단용)
+
+
+class ToolchainGrouper:
+    """하위 단계 종료 이벤트를 부모 PID별로 모아 드라이버 이벤트에 합침"""
+
+    def __init__(self, max_pending: int = 1024, ttl_sec: float = 86400.0,
+                 monotonic_ns: Callable[[], int] = time.monotonic_ns):
+        """
+        Args:
+            max_pending: 최대 묶음 수 (초과 시 가장 오래 갱신되지 않은 묶음부터 버림)
+            ttl_sec: 이 시간 동안 드라이버가 종료하지 않은 묶음은 만료 (InflightTracker와 같은 기준)
+            monotonic_ns: 현재 단조 시각 (테스트용)
+        """
+        # 드라이버 종료 이벤트를 받지 못한 묶음(유실, 수집 제외 등)이 쌓이지 않도록 제한
+        self.max_pending = max_pending
+        self.ttl_ns = int(ttl_sec * 1e9)
+        self._monotonic_ns = monotonic_ns
+        self._pending: "OrderedDict[int, _Pending]" = OrderedDict()
+        self.logger = get_logger(__name__)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def group(self, batch: List[RawBpfEvent]) -> List[RawBpfEvent]:
+        """폴링 한 번의 배치에서 하위 단계를 합치고 나머지 이벤트 반환
+
+        CPU별 perf 버퍼는 같은 폴링 패스 안에서 부모 이벤트를 자식보다 먼저 읽을 수 있으므로
+        하위 단계를 모두 모은 뒤 나머지 이벤트에 붙입니다.
+        """
+        now = self._monotonic_ns()
+        rest = []
+        for event in batch:
+            name = stage_name(event)
+            if name is None:
+                rest.append(event)
+            else:
+                self._fold(event, name, now)
+
+        result = [self._attach(event) for event in rest]
+        self._expire(now)
+        TOOLCHAIN_PENDING.set(len(self._pending))
+        return result
+
+    def _fold(self, event: RawBpfEvent, name: str, now: int) -> None:
+        pending = self._pending.get(event.ppid)
+        if pending is None:
+            pending = self._pending[event.ppid] = _Pending()
+        pending.phases[name] = pending.phases.get(name, 0.0) + (event.runtime_ms or 0.0)
+        pending.children.append(event.pid)
+        if event.exit_ns and (not pending.first_exit_ns or event.exit_ns < pending.first_exit_ns):
+            pending.first_exit_ns = event.exit_ns
+        pending.touched_ns = now
+        self._pending.move_to_end(event.ppid)
+        while len(self._pending) > self.max_pending:
+            self._pending.popitem(last=False)
+        TOOLCHAIN_STAGES_FOLDED.labels(stage=name).inc()
+
+    def _collect(self, event: RawBpfEvent) -> Dict[str, float]:
+        """event의 묶음과 하위 단계의 묶음(collect2 -> ld 등)을 따라가며 단계 시간 합산"""
+        phases: Dict[str, float] = {}
+        stack = [event.pid]
+        while stack:
+            pending = self._pending.pop(stack.pop(), None)
+            if pending is None:
+                continue
+            if event.exec_ns and pending.first_exit_ns and pending.first_exit_ns < event.exec_ns:
+                # exec 이전에 종료한 단계는 같은 PID를 쓰던 이전 프로세스의 것
+                self.logger.debug(f"[컴파일 단계] PID {event.pid} 재사용 전 묶음 버림: {pending.phases}")
+                continue
+            for name, ms in pending.phases.items():
+                phases[name] = phases.get(name, 0.0) + ms
+            stack.extend(pending.children)
+        return phases
+
+    def _attach(self, event: RawBpfEvent) -> RawBpfEvent:
+        if event.pid not in self._pending:
+            return event
+        phases = self._collect(event)
+        if not phases:
+            return event
+        self.logger.debug(f"[컴파일 단계] PID {event.pid} {event.binary_path}: {phases}")
+        return dataclasses.replace(event, phases_ms=phases)
+
+    def _expire(self, now: int) -> None:
+        """드라이버 종료 이벤트 없이 ttl이 지난 묶음 제거 (갱신 순서로 정렬되어 있음)"""
+        while self._pending:
+            pid, pending = next(iter(self._pending.items()))
+            if now - pending.touched_ns < self.ttl_ns:
+                break
+            del self._pending[pid]
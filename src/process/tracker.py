@@ -0,0 +1,139 @@
+"""실행 중인 프로세스 추적
+
+exec 시작 알림(EXEC_EVENTS)으로 실행 중인 프로세스를 PID별로 기록하고,
+종료 이벤트를 받으면 지웁니다. 무한 루프나 입력 대기처럼 종료하지 않는 학생
+프로그램은 종료 이벤트가 오지 않으므로, 임계 시간을 넘긴 프로세스를 장기 실행으로 보고합니다.
+
+시작 시각은 커널이 기록한 exec 시각을 사용하므로 큐나 폴링 지연이 실행 시간에 섞이지 않습니다.
+항목은 도착 순서대로 정렬된 OrderedDict에 보관하므로, 점검할 때는 오래된 항목부터
+임계 시간에 못 미치는 첫 항목까지만 확인합니다 (CPU별 버퍼로 도착 순서가 조금 어긋나면
+다음 점검에서 보고됨). 최대 항목 수와 만료 시간으로 메모리를 제한합니다.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional
+
+from ..metrics.prometheus import (
+    PROCESS_INFLIGHT, PROCESS_INFLIGHT_EXPIRED, PROCESS_LONG_RUNNING
+)
+from ..utils.clock import MonotonicClock, kernel_clock
+from ..utils.logging import get_logger
+
+
+@dataclass
+class InflightProcess:
+    """실행 중인 프로세스"""
+    pid: int
+    hostname: str
+    binary_path: str
+    started: float          # 커널 단조 시각 기준 exec 시각 (초)
+    reported: bool = False  # 장기 실행으로 보고했는지 여부
+
+    def runtime(self, now: float) -> float:
+        return now - self.started
+
+
+class InflightTracker:
+    """PID별 실행 중 프로세스 색인"""
+
+    def __init__(self, threshold_sec: float, max_entries: int, ttl_sec: float,
+                 clock: MonotonicClock = kernel_clock):
+        """
+        Args:
+            threshold_sec: 장기 실행으로 보고할 실행 시간
+            max_entries: 최대 추적 프로세스 수 (초과 시 가장 오래된 항목부터 버림)
+            ttl_sec: 종료 이벤트 없이 이 시간이 지난 항목은 만료 (종료 이벤트 유실 대비)
+            clock: 커널 exec 시각과 같은 기준의 현재 시각
+        """
+        self.clock = clock
+        self.threshold_sec = threshold_sec
+        self.max_entries = max_entries
+        self.ttl_sec = ttl_sec
+        self._procs: "OrderedDict[int, InflightProcess]" = OrderedDict()
+        # 이벤트 콜백과 주기 점검이 서로 다른 쓰레드에서 실행될 수 있음
+        self._lock = threading.Lock()
+        self.logger = get_logger(__name__)
+
+    def __len__(self) -> int:
+        return len(self._procs)
+
+    def __contains__(self, pid: int) -> bool:
+        return pid in self._procs
+
+    def start(self, pid: int, hostname: str, binary_path: str, exec_ns: int = 0,
+              now: Optional[float] = None) -> None:
+        """exec 시작 기록 (같은 PID의 재exec는 새 프로그램으로 대체)
+
+        Args:
+            exec_ns: 커널 exec 시각 (0이면 알 수 없으므로 현재 시각 사용)
+            now: 현재 시각 (초, 테스트용)
+        """
+        now = self.clock.now_sec() if now is None else now
+        started = exec_ns / 1e9 if exec_ns else now
+        with self._lock:
+            self._drop(self._procs.pop(pid, None))
+            self._procs[pid] = InflightProcess(pid, hostname, binary_path, started)
+            while len(self._procs) > self.max_entries:
+                self._drop(self._procs.popitem(last=False)[1])
+                PROCESS_INFLIGHT_EXPIRED.labels(reason="capacity").inc()
+            PROCESS_INFLIGHT.set(len(self._procs))
+
+    @staticmethod
+    def _drop(proc: Optional[InflightProcess]) -> None:
+        """종료 이벤트 없이 제거된 항목의 장기 실행 집계 정리"""
+        if proc and proc.reported:
+            PROCESS_LONG_RUNNING.dec()
+
+    def finish(self, pid: int, now: Optional[float] = None) -> Optional[InflightProcess]:
+        """종료 이벤트와 대조하여 항목 제거
+
+        Returns:
+            추적 중이던 프로세스, 없으면 None
+        """
+        now = self.clock.now_sec() if now is None else now
+        with self._lock:
+            proc = self._procs.pop(pid, None)
+            PROCESS_INFLIGHT.set(len(self._procs))
+        if proc and proc.reported:
+            PROCESS_LONG_RUNNING.dec()
+            self.logger.info(
+                f"[장기 실행 종료] PID {pid} {proc.binary_path} "
+                f"(호스트: {proc.hostname}, 실행 시간: {proc.runtime(now):.0f}초)"
+            )
+        return proc
+
+    def check(self, now: Optional[float] = None) -> List[InflightProcess]:
+        """임계 시간을 넘긴 프로세스를 보고하고 만료된 항목 정리
+
+        Returns:
+            이번 점검에서 새로 장기 실행으로 판정된 프로세스
+        """
+        now = self.clock.now_sec() if now is None else now
+        found = []
+        expired = []
+        with self._lock:
+            for proc in self._procs.values():
+                runtime = proc.runtime(now)
+                if runtime < self.threshold_sec:
+                    # 시작 순서로 정렬되어 있으므로 이후 항목은 모두 임계 시간 미만
+                    break
+                if runtime >= self.ttl_sec:
+                    expired.append(proc)
+                elif not proc.reported:
+                    proc.reported = True
+                    PROCESS_LONG_RUNNING.inc()
+                    found.append(proc)
+            for proc in expired:
+                del self._procs[proc.pid]
+                self._drop(proc)
+                PROCESS_INFLIGHT_EXPIRED.labels(reason="ttl").inc()
+            PROCESS_INFLIGHT.set(len(self._procs))
+
+        for proc in found:
+            self.logger.warning(
+                f"[장기 실행] PID {proc.pid} {proc.binary_path} "
+                f"(호스트: {proc.hostname}, 실행 시간: {proc.runtime(now):.0f}초)"
+            )
+        return found
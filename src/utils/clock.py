@@ -0,0 +1,63 @@
+"""커널 단조 시각 -> 실제 시각 변환
+
+BPF 프로그램의 bpf_ktime_get_ns()는 CLOCK_MONOTONIC 기준이므로 부팅 이후 경과 시간입니다.
+실제 시각(CLOCK_REALTIME)과의 차이를 측정해 두고 더해서 변환합니다.
+NTP 보정으로 차이가 조금씩 변하므로 일정 시간이 지나면 다시 측정합니다.
+"""
+
+import time
+from datetime import datetime, timezone
+from typing import Callable
+
+# 한 번 보정할 때 측정하는 횟수 (가장 짧은 구간의 측정값 사용)
+CALIBRATION_SAMPLES = 5
+
+
+class MonotonicClock:
+    """CLOCK_MONOTONIC 나노초를 UTC datetime으로 변환"""
+
+    def __init__(self, recalibrate_sec: float = 60.0,
+                 monotonic_ns: Callable[[], int] = time.monotonic_ns,
+                 time_ns: Callable[[], int] = time.time_ns):
+        self.recalibrate_sec = recalibrate_sec
+        self._monotonic_ns = monotonic_ns
+        self._time_ns = time_ns
+        self.offset_ns = 0
+        self._calibrated_at = None
+        self.calibrate()
+
+    def calibrate(self) -> int:
+        """실제 시각 - 단조 시각 차이 측정
+
+        실제 시각 읽기를 단조 시각 두 번 사이에 끼워 측정하고,
+        두 단조 시각 간격이 가장 짧은(선점 영향이 적은) 측정값을 사용합니다.
+        """
+        best_span = None
+        for _ in range(CALIBRATION_SAMPLES):
+            before = self._monotonic_ns()
+            real = self._time_ns()
+            after = self._monotonic_ns()
+            span = after - before
+            if best_span is None or span < best_span:
+                best_span = span
+                self.offset_ns = real - (before + after) // 2
+        self._calibrated_at = self._monotonic_ns()
+        return self.offset_ns
+
+    def to_datetime(self, ktime_ns: int) -> datetime:
+        """커널 단조 시각을 UTC datetime으로 변환"""
+        if self._monotonic_ns() - self._calibrated_at >= self.recalibrate_sec * 1e9:
+            self.calibrate()
+        return datetime.fromtimestamp((ktime_ns + self.offset_ns) / 1e9, timezone.utc)
+
+    def now_sec(self) -> float:
+        """현재 단조 시각 (초, 커널 시각 / 1e9와 같은 기준)"""
+        return self._monotonic_ns() / 1e9
+
+    def elapsed_sec(self, ktime_ns: int) -> float:
+        """커널 단조 시각 이후 경과 시간 (초)"""
+        return (self._monotonic_ns() - ktime_ns) / 1e9
+
+
+# 공용 인스턴스
+kernel_clock = MonotonicClock()
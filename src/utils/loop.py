@@ -0,0 +1,40 @@
+"""이벤트 루프 선택
+
+이벤트 처리는 루프 깨우기, 태스크 생성, aiohttp 입출력이 대부분이므로 libuv 기반의
+uvloop를 선택적으로 사용할 수 있습니다. uvloop가 설치되어 있지 않으면 경고를 남기고
+기본 asyncio 루프로 실행합니다.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from .logging import get_logger
+
+LOOP_ASYNCIO = "asyncio"
+LOOP_UVLOOP = "uvloop"
+LOOPS = (LOOP_ASYNCIO, LOOP_UVLOOP)
+
+T = TypeVar("T")
+LoopFactory = Callable[[], asyncio.AbstractEventLoop]
+
+
+def loop_factory(name: str) -> Optional[LoopFactory]:
+    """루프 이름에 맞는 루프 생성 함수 (기본 asyncio 루프이면 None)"""
+    logger = get_logger(__name__)
+    if name not in LOOPS:
+        raise ValueError(f"알 수 없는 이벤트 루프: {name} (가능: {', '.join(LOOPS)})")
+    if name == LOOP_UVLOOP:
+        try:
+            import uvloop
+        except ImportError:
+            logger.warning("[루프] uvloop가 설치되어 있지 않음, 기본 asyncio 루프 사용")
+            return None
+        logger.info(f"[루프] uvloop {uvloop.__version__} 사용")
+        return uvloop.new_event_loop
+    return None
+
+
+def run(main: Awaitable[T], name: str = LOOP_ASYNCIO) -> T:
+    """선택한 이벤트 루프에서 코루틴 실행 (asyncio.run과 같은 정리 과정)"""
+    with asyncio.Runner(loop_factory=loop_factory(name)) as runner:
+        return runner.run(main)
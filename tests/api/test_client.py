@@ -21,7 +21,12 @@ def sample_event():
             args="./main arg1 arg2",
             error_flags="0b0",
             exit_code=0,
-            hostname="jcode-os-1-202012345-abc"
+            hostname="jcode-os-1-202012345-abc",
+            utime_ns=12_500_000,
+            stime_ns=2_000_000,
+            maxrss_kb=3456,
+            nvcsw=7,
+            nivcsw=2
         ),
         process=ProcessTypeInfo(
             type=ProcessType.USER_BINARY
@@ -88,6 +93,12 @@ async def test_send_binary_execution_success(aiohttp_client, sample_event):
         assert data['cwd'] == sample_event.base.cwd
         assert data['target_path'] == sample_event.base.binary_path
         assert data['process_type'] == 'binary'
+        assert data['runtime_ms'] == sample_event.base.runtime_ms
+        assert data['user_time_ms'] == 12.5
+        assert data['system_time_ms'] == 2.0
+        assert data['max_rss_kb'] == 3456
+        assert data['voluntary_ctxt_switches'] == 7
+        assert data['involuntary_ctxt_switches'] == 2
         
         return web.json_response({"status": "success"})
 
@@ -121,6 +132,7 @@ async def test_send_compilation_success(aiohttp_client, sample_event):
         assert data['cmdline'] == sample_event.base.args
         assert data['cwd'] == sample_event.base.cwd
         assert data['binary_path'] == sample_event.base.binary_path
+        assert data['phases_ms'] == {}
         
         return web.json_response({"status": "success"})
 
@@ -208,6 +220,7 @@ async def test_send_python_execution_success(aiohttp_client, python_event):
         assert data['cwd'] == python_event.base.cwd
         assert data['target_path'] == python_event.homework.source_file
         assert data['process_type'] == 'python'
+        assert data['max_rss_kb'] == python_event.base.maxrss_kb
         
         return web.json_response({"status": "success"})
 
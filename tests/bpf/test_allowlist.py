@@ -0,0 +1,116 @@
+import os
+import pytest
+
+from src.bpf.allowlist import ExecAllowlist, kernel_dev, resolve_in_root
+
+
+class FakeTable(dict):
+    """BCC 해시 테이블 대역"""
+    class Key(tuple):
+        def __new__(cls, dev, ino):
+            return super().__new__(cls, (dev, ino))
+
+    @staticmethod
+    def Leaf(value):
+        return value
+
+
+@pytest.fixture
+def container_root(tmp_path):
+    """컴파일러와 심볼릭 링크가 있는 가짜 컨테이너 루트"""
+    root = tmp_path / "root"
+    (root / "usr" / "bin").mkdir(parents=True)
+    (root / "etc" / "alternatives").mkdir(parents=True)
+    (root / "usr" / "bin" / "gcc-13").write_text("gcc")
+    (root / "usr" / "bin" / "python3.12").write_text("python")
+    # 상대 경로 링크와 절대 경로 링크
+    os.symlink("gcc-13", root / "usr" / "bin" / "gcc")
+    os.symlink("/usr/bin/python3.12", root / "etc" / "alternatives" / "python3")
+    os.symlink("/etc/alternatives/python3", root / "usr" / "bin" / "python3")
+    return root
+
+
+@pytest.fixture
+def proc_root(tmp_path, container_root):
+    """두 프로세스가 같은 마운트 네임스페이스를 공유하는 가짜 /proc"""
+    proc = tmp_path / "proc"
+    ns_file = tmp_path / "mnt_ns"
+    ns_file.write_text("")
+    for pid in ("100", "200"):
+        (proc / pid / "ns").mkdir(parents=True)
+        os.symlink(ns_file, proc / pid / "ns" / "mnt")
+        os.symlink(container_root, proc / pid / "root")
+    (proc / "self").mkdir()
+    return proc
+
+
+def test_kernel_dev_encoding():
+    """사용자 공간 dev_t를 커널 인코딩으로 변환"""
+    st_dev = os.makedev(259, 3)
+    assert kernel_dev(st_dev) == (259 << 20) | 3
+
+
+def test_resolve_relative_symlink(container_root):
+    """상대 경로 링크 해석"""
+    resolved = resolve_in_root(str(container_root), "/usr/bin/gcc")
+    assert resolved == str(container_root / "usr" / "bin" / "gcc-13")
+
+
+def test_resolve_absolute_symlink_stays_in_root(container_root):
+    """절대 경로 링크는 컨테이너 루트 기준으로 해석"""
+    resolved = resolve_in_root(str(container_root), "/usr/bin/python3")
+    assert resolved == str(container_root / "usr" / "bin" / "python3.12")
+
+
+def test_resolve_missing_path(container_root):
+    """존재하지 않는 경로는 None"""
+    assert resolve_in_root(str(container_root), "/usr/bin/clang") is None
+
+
+def test_refresh_installs_keys_once_per_namespace(proc_root, container_root):
+    """네임스페이스별로 한 번만 stat하여 키 등록"""
+    table = FakeTable()
+    allowlist = ExecAllowlist(table, ["/usr/bin/gcc", "/usr/bin/python3", "/usr/bin/clang"],
+                              proc_root=str(proc_root))
+    allowlist.refresh()
+
+    gcc = os.stat(container_root / "usr" / "bin" / "gcc-13")
+    python = os.stat(container_root / "usr" / "bin" / "python3.12")
+    assert set(table) == {
+        (kernel_dev(gcc.st_dev), gcc.st_ino),
+        (kernel_dev(python.st_dev), python.st_ino),
+    }
+
+
+def test_refresh_removes_keys_of_gone_namespaces(proc_root):
+    """사라진 컨테이너의 키 제거"""
+    table = FakeTable()
+    allowlist = ExecAllowlist(table, ["/usr/bin/gcc"], proc_root=str(proc_root))
+    allowlist.refresh()
+    assert len(table) == 1
+
+    for pid in ("100", "200"):
+        os.unlink(proc_root / pid / "ns" / "mnt")
+    allowlist.refresh()
+    assert len(table) == 0
+
+
+def test_refresh_expands_glob_patterns(proc_root, container_root):
+    """버전 디렉토리가 들어간 하위 단계 경로는 컨테이너마다 glob으로 펼쳐서 등록"""
+    libexec = container_root / "usr" / "libexec" / "gcc" / "x86_64-linux-gnu" / "13"
+    libexec.mkdir(parents=True)
+    (libexec / "cc1").write_text("cc1")
+    (container_root / "usr" / "bin" / "x86_64-linux-gnu-as").write_text("as")
+    os.symlink("x86_64-linux-gnu-as", container_root / "usr" / "bin" / "as")
+
+    table = FakeTable()
+    allowlist = ExecAllowlist(table, ["/usr/libexec/gcc/*/*/cc1", "/usr/lib/gcc/*/*/cc1", "/usr/bin/as"],
+                              proc_root=str(proc_root))
+    allowlist.refresh()
+
+    cc1 = os.stat(libexec / "cc1")
+    as_ = os.stat(container_root / "usr" / "bin" / "x86_64-linux-gnu-as")
+    assert set(table) == {
+        (kernel_dev(cc1.st_dev), cc1.st_ino),
+        (kernel_dev(as_.st_dev), as_.st_ino),
+    }
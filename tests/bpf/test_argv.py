@@ -0,0 +1,100 @@
+import pytest
+
+from src.bpf.argv import ArgvAssembler
+from src.bpf.event import EVENT_ARGS_CHUNK, EVENT_EXIT, RawBpfStruct
+
+
+def exit_record(pid, args, chunks=0, error_flags=0, exit_ns=0):
+    """첫 ARGSIZE 바이트와 청크 수를 담은 EXIT 레코드"""
+    header = RawBpfStruct(
+        type=EVENT_EXIT, hostname_len=1, args_len=len(args), chunk=chunks,
+        pid=pid, error_flags=error_flags, exit_ns=exit_ns,
+    )
+    return bytes(header) + b"h" + args
+
+
+def chunk_record(pid, seq, data):
+    header = RawBpfStruct(type=EVENT_ARGS_CHUNK, args_len=len(data), chunk=seq, pid=pid)
+    return bytes(header) + data
+
+
+@pytest.fixture
+def assembler():
+    return ArgvAssembler(max_pending=4)
+
+
+def test_exit_without_chunks_is_immediate(assembler):
+    """청크가 없는 EXIT 레코드는 바로 이벤트로 변환"""
+    event = assembler.feed(exit_record(1, b"gcc\0main.c\0"))
+    assert event.args == "gcc main.c"
+    assert assembler.flush() == []
+
+
+def test_chunks_are_joined_across_argument_boundary(assembler):
+    """인수 중간에서 나뉜 청크도 이어 붙여 복원"""
+    assert assembler.feed(chunk_record(7, 0, b"DEBUG\0-Ii")) is None
+    assert assembler.feed(chunk_record(7, 1, b"nc\0main.c\0")) is None
+    assert assembler.feed(exit_record(7, b"gcc\0-D", chunks=2)) is None
+
+    [event] = assembler.flush()
+    assert event.args == "gcc -DDEBUG -Iinc main.c"
+    assert event.error_flags == "0b0"
+    assert assembler.pending == 0
+
+
+def test_exit_before_chunks_in_same_pass(assembler):
+    """다른 CPU 버퍼의 청크가 EXIT보다 늦게 읽혀도 패스 끝에서 완성"""
+    assembler.feed(exit_record(7, b"gcc\0", chunks=1))
+    assembler.feed(chunk_record(7, 0, b"main.c\0"))
+    [event] = assembler.flush()
+    assert event.args == "gcc main.c"
+
+
+def test_missing_chunk_marks_truncated(assembler):
+    """중간 청크가 유실되면 그 앞까지만 사용하고 ERR_ARGS_TOO_LONG 표시"""
+    assembler.feed(chunk_record(7, 0, b"a.c\0"))
+    assembler.feed(chunk_record(7, 2, b"c.c\0"))
+    assembler.feed(exit_record(7, b"gcc\0", chunks=3))
+    [event] = assembler.flush()
+    assert event.args == "gcc a.c"
+    assert event.error_flags == "0b100"
+
+
+def test_new_exec_replaces_old_chunks(assembler):
+    """같은 PID의 새 exec 청크는 이전 청크를 대체"""
+    assembler.feed(chunk_record(7, 0, b"old.c\0"))
+    assembler.feed(chunk_record(7, 0, b"new.c\0"))
+    assembler.feed(exit_record(7, b"gcc\0", chunks=1))
+    [event] = assembler.flush()
+    assert event.args == "gcc new.c"
+
+
+def test_pending_is_bounded(assembler):
+    """EXIT를 받지 못한 프로세스의 청크는 오래된 것부터 버림"""
+    for pid in range(10):
+        assembler.feed(chunk_record(pid, 0, b"x\0"))
+    assert assembler.pending == 4
+
+    assembler.feed(exit_record(0, b"gcc\0", chunks=1))
+    [event] = assembler.flush()
+    assert event.args == "gcc"
+    assert event.error_flags == "0b100"
+
+
+def test_complete_keeps_kernel_order(assembler):
+    """청크를 기다린 긴 컴파일 명령이 같은 패스의 뒤이은 실행 이벤트보다 앞에 옴"""
+    ready = []
+    records = [
+        chunk_record(7, 0, b"-DNDEBUG\0main.c\0"),
+        exit_record(7, b"gcc\0-Iinc\0", chunks=1, exit_ns=100),
+        exit_record(8, b"./main\0", exit_ns=200),
+    ]
+    for record in records:
+        event = assembler.feed(record)
+        if event:
+            ready.append(event)
+
+    events = assembler.complete(ready)
+    assert [event.pid for event in events] == [7, 8]
+    assert events[0].args == "gcc -Iinc -DNDEBUG main.c"
+    assert assembler.complete([]) == []
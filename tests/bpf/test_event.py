@@ -0,0 +1,123 @@
+import ctypes
+import pytest
+
+from src.bpf.event import (
+    EVENT_EXEC, EVENT_EXIT, HEADER_SIZE, PAGE_KB, RawBpfEvent, RawBpfStruct, decode_event, decode_exec,
+    decode_record, encode_event, record_type,
+)
+
+
+@pytest.fixture
+def raw_event():
+    """gcc 컴파일 이벤트"""
+    return RawBpfEvent(
+        pid=4321,
+        binary_path="/usr/bin/x86_64-linux-gnu-gcc-13",
+        cwd="/home/coder/project/hw1",
+        args="gcc -o main main.c",
+        error_flags="0b100",
+        exit_code=1,
+        hostname="jcode-os-1-202012180-hash",
+        exec_ns=1_000_000_000,
+        exit_ns=1_250_000_000,
+        utime_ns=180_000_000,
+        stime_ns=40_000_000,
+        maxrss_kb=PAGE_KB * 5000,
+        nvcsw=12,
+        nivcsw=3,
+        ppid=4300,
+    )
+
+
+def to_buffer(record: bytes):
+    """콜백과 같은 (주소, 크기) 형태로 변환"""
+    buf = ctypes.create_string_buffer(record, len(record))
+    return buf, ctypes.addressof(buf), len(record)
+
+
+def test_header_layout():
+    """헤더 크기가 커널 struct event_hdr_t와 일치"""
+    assert HEADER_SIZE == 88
+
+
+def test_roundtrip(raw_event):
+    """직렬화한 레코드를 같은 이벤트로 복원"""
+    buf, data, size = to_buffer(encode_event(raw_event))
+    assert decode_event(data, size) == raw_event
+
+
+def test_record_is_compact(raw_event):
+    """레코드 크기는 헤더 + 실제 사용 바이트"""
+    record = encode_event(raw_event)
+    used = (len(raw_event.hostname) + len(raw_event.binary_path)
+            + len(raw_event.cwd) + len(raw_event.args) + 1)
+    assert len(record) == HEADER_SIZE + used
+
+
+def test_resource_usage(raw_event):
+    """최대 RSS는 페이지에서 KiB로 변환"""
+    header = RawBpfStruct(type=EVENT_EXIT, maxrss_pages=100, utime_ns=1_500_000, stime_ns=500_000)
+    buf, data, size = to_buffer(bytes(header))
+    event = decode_event(data, size)
+    assert event.maxrss_kb == 100 * PAGE_KB
+    assert event.cpu_ms == 2.0
+
+
+def test_args_skip_empty_arguments():
+    """연속된 NUL(빈 인자)은 무시"""
+    header = RawBpfStruct(type=EVENT_EXIT, hostname_len=1, args_len=9, pid=1)
+    buf, data, size = to_buffer(bytes(header) + b"h" + b"ls\0\0-al\0\0")
+    event = decode_event(data, size)
+    assert event.args == "ls -al"
+    assert event.binary_path == ""
+
+
+def test_truncated_record(raw_event):
+    """헤더의 길이보다 짧은 레코드는 거부"""
+    record = encode_event(raw_event)
+    buf, data, _ = to_buffer(record)
+    with pytest.raises(ValueError):
+        decode_event(data, len(record) - 1)
+    with pytest.raises(ValueError):
+        decode_event(data, HEADER_SIZE - 1)
+
+
+def test_unknown_record_type(raw_event):
+    """알 수 없는 레코드 타입은 거부"""
+    record = bytearray(encode_event(raw_event))
+    record[0] = 0xff
+    buf, data, size = to_buffer(bytes(record))
+    with pytest.raises(ValueError):
+        decode_event(data, size)
+
+
+def test_decode_record_from_bytes(raw_event):
+    """bytes 버퍼에서도 같은 결과"""
+    assert decode_record(encode_event(raw_event)) == raw_event
+
+
+def test_memoryview_matches_ctypes_path(raw_event):
+    """memoryview 디코더와 ctypes 디코더의 결과 일치"""
+    record = encode_event(raw_event)
+    buf, data, size = to_buffer(record)
+    via_ctypes = ctypes.cast(data, ctypes.POINTER(RawBpfStruct)).contents.to_event()
+    assert decode_event(data, size) == via_ctypes
+
+
+def test_invalid_utf8_args_replaced():
+    """인자의 잘못된 UTF-8은 대체 문자로 변환"""
+    header = RawBpfStruct(type=EVENT_EXIT, args_len=6, pid=1)
+    event = decode_record(bytes(header) + b"a\xff\0b\0\0")
+    assert event.args == "a� b"
+
+
+def test_decode_exec():
+    """EXEC 레코드는 hostname과 binary_path만 포함"""
+    header = RawBpfStruct(type=EVENT_EXEC, hostname_len=4, binary_path_len=6, pid=9)
+    record = bytes(header) + b"host/a.out"
+    assert record_type(record) == EVENT_EXEC
+    start = decode_exec(record)
+    assert (start.pid, start.hostname, start.binary_path) == (9, "host", "/a.out")
+
+    with pytest.raises(ValueError):
+        decode_exec(record[:-1])
@@ -0,0 +1,71 @@
+import io
+import os
+import tarfile
+from unittest.mock import patch
+
+import pytest
+
+from src.bpf.loader import KernelHeaderCache, measure_load, rss_bytes
+
+
+@pytest.fixture
+def archive(tmp_path):
+    """kheaders.tar.xz 형식의 테스트용 압축 파일"""
+    path = tmp_path / "kheaders.tar.xz"
+    with tarfile.open(path, "w:xz") as tar:
+        data = b"#define LINUX_VERSION_CODE 0\n"
+        info = tarfile.TarInfo("include/generated/uapi/linux/version.h")
+        info.size = len(data)
+        tar.addfile(info, io.BytesIO(data))
+    return str(path)
+
+
+def test_prepare_extracts_once(tmp_path, archive):
+    """처음 한 번만 압축을 풀고 이후에는 캐시 재사용"""
+    cache = KernelHeaderCache(str(tmp_path / "cache"), release="6.1.0-test", archive=archive)
+
+    path = cache.prepare()
+    assert path == str(tmp_path / "cache" / "6.1.0-test")
+    assert os.path.exists(os.path.join(path, "include/generated/uapi/linux/version.h"))
+
+    with patch.object(cache, "_extract") as extract:
+        assert cache.prepare() == path
+        extract.assert_not_called()
+
+
+def test_prepare_without_archive(tmp_path):
+    """kheaders가 없으면 None"""
+    cache = KernelHeaderCache(str(tmp_path), release="6.1.0-test",
+                              archive=str(tmp_path / "missing.tar.xz"))
+    assert cache.prepare() is None
+
+
+def test_prepare_replaces_incomplete_dir(tmp_path, archive):
+    """완료 표시가 없는 디렉토리는 다시 압축 해제"""
+    cache = KernelHeaderCache(str(tmp_path), release="6.1.0-test", archive=archive)
+    os.makedirs(os.path.join(cache.path, "include"))
+
+    assert cache.prepare() == cache.path
+    assert cache.is_ready()
+    # 임시 디렉토리가 남지 않음
+    assert sorted(os.listdir(tmp_path)) == ["6.1.0-test", "kheaders.tar.xz"]
+
+
+def test_measure_load_reports():
+    """로드 결과와 비용 보고"""
+    with patch("src.bpf.loader.BPF_LOAD_SECONDS") as seconds, \
+            patch("src.bpf.loader.BPF_LOAD_RSS_BYTES") as rss:
+        result, report = measure_load("host_headers", lambda: "bpf", headers_seconds=0.5)
+
+    assert result == "bpf"
+    assert report.path == "host_headers"
+    assert report.seconds >= 0
+    assert report.headers_seconds == 0.5
+    assert report.rss_before > 0
+    seconds.labels.assert_any_call(path="host_headers", stage="headers")
+    seconds.labels.assert_any_call(path="host_headers", stage="compile")
+    assert rss.labels.call_count == 3
+
+
+def test_rss_bytes():
+    assert rss_bytes() > 0
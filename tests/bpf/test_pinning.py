@@ -0,0 +1,124 @@
+import ctypes
+import os
+import pytest
+
+from src.bpf.event import ARGSIZE, ERR_EXIT_UNOBSERVED, EXIT_CODE_UNKNOWN, MAX_PATH_LEN, UTS_LEN
+from src.bpf.pinning import MapPins, drain_orphans, is_bpffs, layout_version
+
+PROGRAM = """
+struct data_t {
+    u32 pid;
+    u64 exec_ns;    // exec 시각
+};
+
+struct event_hdr_t {
+    u16 type;
+};
+"""
+
+
+class Key:
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+def test_is_bpffs(tmp_path):
+    """가장 긴 마운트 지점의 파일시스템 타입으로 판정"""
+    mounts = tmp_path / "mounts"
+    mounts.write_text(
+        "sysfs /sys sysfs rw 0 0\n"
+        "bpf /sys/fs/bpf bpf rw 0 0\n"
+    )
+    assert is_bpffs("/sys/fs/bpf/watcher-proc", str(mounts))
+    assert is_bpffs("/sys/fs/bpf", str(mounts))
+    assert not is_bpffs("/sys/fs/bpfx", str(mounts))
+    assert not is_bpffs("/sys/kernel", str(mounts))
+
+
+def test_layout_version():
+    """주석/공백만 바뀌면 같은 버전, 필드나 크기가 바뀌면 다른 버전"""
+    base = layout_version(PROGRAM, (10240, 256))
+    assert layout_version(PROGRAM.replace("// exec 시각", ""), (10240, 256)) == base
+    assert layout_version(PROGRAM.replace("u64 exec_ns", "u32 exec_ns"), (10240, 256)) != base
+    assert layout_version(PROGRAM, (20480, 256)) != base
+    with pytest.raises(ValueError):
+        layout_version("struct data_t { u32 pid; };", ())
+
+
+def test_pin_paths_and_stale_cleanup(tmp_path):
+    """버전별 디렉토리 경로와 다른 버전 정리"""
+    pins = MapPins(str(tmp_path), "abc")
+    (tmp_path / "abc").mkdir()
+    (tmp_path / "old").mkdir()
+    (tmp_path / "old" / "process_data").write_text("")
+
+    assert pins.cflags(["process_data"]) == [
+        f'-DPROCESS_DATA_PIN="{tmp_path}/abc/process_data"'
+    ]
+    assert pins.remove_stale() == ["old"]
+    assert os.listdir(tmp_path) == ["abc"]
+
+
+class Data(ctypes.Structure):
+    """program.c의 struct data_t"""
+    _fields_ = [
+        ("pid", ctypes.c_uint32),
+        ("error_flags", ctypes.c_uint32),
+        ("hostname", ctypes.c_char * UTS_LEN),
+        ("binary_path", ctypes.c_char * MAX_PATH_LEN),
+        ("cwd", ctypes.c_char * MAX_PATH_LEN),
+        ("args", ctypes.c_char * ARGSIZE),
+        ("binary_path_offset", ctypes.c_int),
+        ("cwd_offset", ctypes.c_int),
+        ("args_len", ctypes.c_uint32),
+        ("hostname_len", ctypes.c_uint32),
+        ("exit_code", ctypes.c_int),
+        ("exec_ns", ctypes.c_uint64),
+        ("ppid", ctypes.c_uint32),
+        ("args_chunks", ctypes.c_uint32),
+        ("args_next", ctypes.c_uint64),
+        ("args_end", ctypes.c_uint64),
+    ]
+
+
+def make_data(pid, binary_path, cwd, args, args_chunks=0):
+    """커널과 같이 경로는 오른쪽 정렬, 인수는 NUL 구분으로 채운 항목"""
+    data = Data(pid=pid, exec_ns=123, ppid=1, args_chunks=args_chunks)
+    hostname = b"jcode-os-1-202012180-hash"
+    ctypes.memmove(ctypes.addressof(data) + Data.hostname.offset, hostname, len(hostname))
+    data.hostname_len = len(hostname)
+    for name, path in (("binary_path", binary_path), ("cwd", cwd)):
+        offset = MAX_PATH_LEN - 1 - len(path)
+        ctypes.memmove(ctypes.addressof(data) + getattr(Data, name).offset + offset, path, len(path))
+        setattr(data, f"{name}_offset", offset)
+    ctypes.memmove(ctypes.addressof(data) + Data.args.offset, args, len(args))
+    data.args_len = len(args)
+    return data
+
+
+def test_drain_orphans(tmp_path):
+    """존재하지 않는 PID의 항목을 종료 미관찰 이벤트로 바꾸고 삭제"""
+    (tmp_path / "100").mkdir()
+    table = {
+        Key(100): make_data(100, b"/usr/bin/sleep", b"/home/coder", b"sleep\x0010\x00"),
+        Key(200): make_data(200, b"/home/coder/project/hw1/main", b"/home/coder/project/hw1",
+                            b"./main\x00a\x00", args_chunks=1),
+    }
+    events = drain_orphans(table, proc_root=str(tmp_path))
+
+    assert list(k.value for k in table) == [100]
+    assert len(events) == 1
+    event = events[0]
+    assert (event.pid, event.ppid, event.exec_ns, event.exit_ns) == (200, 1, 123, 0)
+    assert event.hostname == "jcode-os-1-202012180-hash"
+    assert event.binary_path == "/home/coder/project/hw1/main"
+    assert event.cwd == "/home/coder/project/hw1"
+    assert event.args == "./main a"
+    assert event.exit_code == EXIT_CODE_UNKNOWN
+    assert int(event.error_flags, 2) == ERR_EXIT_UNOBSERVED | 0x4
@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.bpf.ratelimit import ExecRateReporter
+
+
+def entry(hostname, suppressed):
+    """exec_rate 맵 항목 (키는 NUL로 채운 UTS_LEN 바이트)"""
+    key = SimpleNamespace(name=hostname.encode().ljust(65, b'\0'))
+    return key, SimpleNamespace(suppressed=suppressed)
+
+
+class FakeTable:
+    def __init__(self):
+        self.entries = {}
+
+    def set(self, hostname, suppressed):
+        self.entries[hostname] = entry(hostname, suppressed)
+
+    def items(self):
+        return list(self.entries.values())
+
+
+@pytest.fixture
+def metrics():
+    with patch("src.bpf.ratelimit.EXEC_SUPPRESSED") as suppressed, \
+            patch("src.bpf.ratelimit.EXEC_THROTTLED_HOSTS") as hosts:
+        yield suppressed, hosts
+
+
+def test_reports_increments_per_host(metrics):
+    """이전 보고 이후 증가한 억제 횟수만 호스트별로 보고"""
+    suppressed, hosts = metrics
+    table = FakeTable()
+    reporter = ExecRateReporter(table)
+
+    table.set("jcode-os-1-202012180-hash", 120)
+    table.set("jcode-os-1-202012181-hash", 0)
+    assert reporter() == {"jcode-os-1-202012180-hash": 120}
+    hosts.set.assert_called_with(1)
+    suppressed.inc.assert_called_once_with(120)
+
+    table.set("jcode-os-1-202012180-hash", 150)
+    assert reporter() == {"jcode-os-1-202012180-hash": 30}
+
+    assert reporter() == {}
+    hosts.set.assert_called_with(0)
+
+
+def test_evicted_host_restarts_from_zero(metrics):
+    """LRU로 밀려났다가 다시 생긴 호스트는 새 누적값 전체를 보고"""
+    table = FakeTable()
+    reporter = ExecRateReporter(table)
+    table.set("host", 100)
+    reporter()
+
+    del table.entries["host"]
+    reporter()
+    table.set("host", 5)
+    assert reporter() == {"host": 5}
@@ -0,0 +1,125 @@
+import json
+import os
+import pytest
+
+from src.bpf.selection import (
+    RULE_ALLOW, RULE_DENY, ExecSelector, SelectionRules, cgroup_id, host_rule_key
+)
+
+
+class FakeTable(dict):
+    """BCC 해시/LPM 트라이 테이블 대역"""
+    @staticmethod
+    def Key(*fields):
+        return fields
+
+    @staticmethod
+    def Leaf(value):
+        return value
+
+
+@pytest.fixture
+def defaults():
+    return SelectionRules(host_allow=("jcode-",))
+
+
+@pytest.fixture
+def rules_path(tmp_path):
+    return tmp_path / "selection.json"
+
+
+def write_rules(path, mtime, **rules):
+    path.write_text(json.dumps(rules))
+    os.utime(path, (mtime, mtime))
+
+
+def test_host_rule_key():
+    """접두어는 비트 단위 길이와 바이트열로 변환"""
+    assert host_rule_key("jcode-") == (48, b"jcode-")
+    with pytest.raises(ValueError):
+        host_rule_key("")
+    with pytest.raises(ValueError):
+        host_rule_key("x" * 65)
+
+
+def test_deny_overrides_allow_for_same_prefix():
+    rules = SelectionRules(host_allow=("jcode-", "lab-"), host_deny=("lab-",))
+    assert rules.host_rules() == {"jcode-": RULE_ALLOW, "lab-": RULE_DENY}
+
+
+def test_defaults_without_rules_file(defaults, rules_path):
+    """규칙 파일이 없으면 설정의 규칙 사용"""
+    table = FakeTable()
+    ExecSelector(table, defaults, rules_path=str(rules_path)).refresh()
+    assert table == {(48, b"jcode-"): RULE_ALLOW}
+
+
+def test_rules_file_updates_map(defaults, rules_path):
+    """규칙 파일이 바뀌면 추가/삭제만 반영"""
+    table = FakeTable()
+    selector = ExecSelector(table, defaults, rules_path=str(rules_path))
+    write_rules(rules_path, 1, host_allow=["jcode-"], host_deny=["jcode-os-2-"])
+    selector.refresh()
+    assert table == {(48, b"jcode-"): RULE_ALLOW, (88, b"jcode-os-2-"): RULE_DENY}
+
+    write_rules(rules_path, 2, host_allow=["jcode-", "lab-"])
+    selector.refresh()
+    assert table == {(48, b"jcode-"): RULE_ALLOW, (32, b"lab-"): RULE_ALLOW}
+
+    # 파일을 지우면 설정의 규칙으로 돌아감
+    rules_path.unlink()
+    selector.refresh()
+    assert table == {(48, b"jcode-"): RULE_ALLOW}
+
+
+def test_invalid_rules_file_keeps_rules(defaults, rules_path):
+    """잘못된 규칙 파일은 무시하고 기존 규칙 유지"""
+    table = FakeTable()
+    selector = ExecSelector(table, defaults, rules_path=str(rules_path))
+    write_rules(rules_path, 1, host_allow=["lab-"])
+    selector.refresh()
+
+    rules_path.write_text("{not json")
+    selector.refresh()
+    assert table == {(32, b"lab-"): RULE_ALLOW}
+
+
+@pytest.mark.parametrize("rules", [
+    {"host_allow": "jcode-"},
+    {"host_allow": ["jcode-", ""]},
+    {"host_deny": [1]},
+    {"cgroup_allow": None},
+])
+def test_rules_file_rejects_non_string_lists(rules_path, rules):
+    """규칙은 빈 문자열이 아닌 문자열 목록만 허용 (문자열 하나는 글자 단위 접두어가 됨)"""
+    rules_path.write_text(json.dumps(rules))
+    with pytest.raises(ValueError):
+        SelectionRules.from_file(str(rules_path))
+
+
+def test_string_rule_keeps_rules(defaults, rules_path):
+    """목록 대신 문자열을 쓴 규칙 파일은 무시하고 기존 규칙 유지"""
+    table = FakeTable()
+    selector = ExecSelector(table, defaults, rules_path=str(rules_path))
+    write_rules(rules_path, 1, host_allow="jcode-")
+    selector.refresh()
+    assert table == {(48, b"jcode-"): RULE_ALLOW}
+
+
+def test_cgroup_rules(tmp_path, defaults, rules_path):
+    """cgroup 경로는 디렉토리 inode로 변환하고, 생기면 다음 갱신 때 반영"""
+    root = tmp_path / "cgroup"
+    (root / "kubepods.slice" / "pod-a").mkdir(parents=True)
+    cgroups = FakeTable()
+    selector = ExecSelector(FakeTable(), defaults, cgroup_table=cgroups,
+                            rules_path=str(rules_path), cgroup_root=str(root))
+    write_rules(rules_path, 1, host_allow=["jcode-"],
+                cgroup_deny=["/kubepods.slice/pod-a", "kubepods.slice/pod-b"])
+    selector.refresh()
+    pod_a = cgroup_id(str(root), "kubepods.slice/pod-a")
+    assert cgroups == {(pod_a,): RULE_DENY}
+
+    (root / "kubepods.slice" / "pod-b").mkdir()
+    selector.refresh()
+    pod_b = cgroup_id(str(root), "kubepods.slice/pod-b")
+    assert cgroups == {(pod_a,): RULE_DENY, (pod_b,): RULE_DENY}
@@ -0,0 +1,123 @@
+import os
+import re
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src.bpf import stats
+from src.bpf.stats import STAT_NAMES, BPFStatsScraper, ProcessMapScraper, read_stats
+
+
+class FakePerCpuArray:
+    """BCC CPU별 배열 대역 (CPU별 값 목록 보관)"""
+    def __init__(self, values):
+        self.values = values
+
+    def Key(self, idx):
+        return idx
+
+    def sum(self, key):
+        return SimpleNamespace(value=sum(self.values[key]))
+
+
+def test_read_stats_sums_cpus():
+    """CPU별 값을 합산"""
+    table = FakePerCpuArray([[idx, 1, 0] for idx in range(len(STAT_NAMES))])
+    assert read_stats(table) == {name: idx + 1 for idx, name in enumerate(STAT_NAMES)}
+
+
+def test_stat_names_match_program():
+    """STAT_NAMES 순서가 program.c의 STAT_* 인덱스와 일치"""
+    with open(os.path.join(os.path.dirname(stats.__file__), "program.c")) as f:
+        defines = dict(re.findall(r"#define (STAT_\w+)\s+(\d+)", f.read()))
+    assert int(defines.pop("STAT_MAX")) == len(STAT_NAMES)
+    assert sorted(int(v) for v in defines.values()) == list(range(len(STAT_NAMES)))
+    assert defines["STAT_EXEC_SEEN"] == str(STAT_NAMES.index("exec_seen"))
+    assert defines["STAT_ERR_ARGS_TOO_LONG"] == str(STAT_NAMES.index("err_args_too_long"))
+
+
+def test_scraper_reports_deltas():
+    """누적값의 증가분만 카운터에 반영"""
+    table = FakePerCpuArray([[0] * 2 for _ in STAT_NAMES])
+    scraper = BPFStatsScraper(table)
+
+    with patch("src.bpf.stats.BPF_KERNEL_STATS") as counter:
+        table.values[0] = [3, 4]
+        scraper()
+        counter.labels.assert_called_once_with(stat="exec_forwarded")
+        counter.labels.return_value.inc.assert_called_once_with(7)
+
+        counter.reset_mock()
+        table.values[0] = [3, 6]
+        scraper()
+        counter.labels.return_value.inc.assert_called_once_with(2)
+
+        counter.reset_mock()
+        scraper()
+        counter.labels.return_value.inc.assert_not_called()
+
+
+def test_scraper_exports_submit_failures():
+    """버퍼가 가득 차 전송하지 못한 레코드 수를 유실 카운터로도 내보냄"""
+    table = FakePerCpuArray([[0] for _ in STAT_NAMES])
+    scraper = BPFStatsScraper(table)
+
+    with patch("src.bpf.stats.BPF_KERNEL_STATS"), \
+            patch("src.bpf.stats.BPF_SUBMIT_FAILED_EVENTS") as failed:
+        table.values[STAT_NAMES.index("exit_submitted")] = [5]
+        scraper()
+        failed.inc.assert_not_called()
+
+        table.values[STAT_NAMES.index("submit_failed")] = [2]
+        scraper()
+        failed.inc.assert_called_once_with(2)
+
+
+def stats_with(inserted, deleted):
+    values = [[0] for _ in STAT_NAMES]
+    values[STAT_NAMES.index("process_inserted")] = [inserted]
+    values[STAT_NAMES.index("process_deleted")] = [deleted]
+    return FakePerCpuArray(values)
+
+
+def test_process_map_scraper_estimates_evictions():
+    """추가 - 삭제 - 현재 항목 수만큼 퇴출로 집계"""
+    entries = {}
+    stats = stats_with(inserted=10, deleted=4)
+    with patch("src.bpf.stats.BPF_PROCESS_MAP_CAPACITY") as capacity, \
+            patch("src.bpf.stats.BPF_PROCESS_MAP_ENTRIES") as gauge, \
+            patch("src.bpf.stats.BPF_PROCESS_MAP_EVICTIONS") as evictions:
+        scraper = ProcessMapScraper(entries, stats, capacity=8)
+        capacity.set.assert_called_once_with(8)
+
+        entries.update({pid: None for pid in range(4)})
+        scraper()
+        gauge.set.assert_called_once_with(4)
+        evictions.inc.assert_called_once_with(2)
+
+        # 퇴출 추정값이 늘어난 만큼만 반영
+        evictions.reset_mock()
+        stats.values[STAT_NAMES.index("process_inserted")] = [13]
+        scraper()
+        evictions.inc.assert_called_once_with(3)
+
+        # 삭제가 늦게 집계되어 추정값이 줄어도 카운터는 감소하지 않음
+        evictions.reset_mock()
+        entries.clear()
+        stats.values[STAT_NAMES.index("process_deleted")] = [13]
+        scraper()
+        evictions.inc.assert_not_called()
+
+
+def test_process_map_scraper_counts_inherited_entries():
+    """고정 맵에서 이어받은 항목은 이번 실행의 추가 수에 더해 퇴출로 잘못 세지 않음"""
+    entries = {pid: None for pid in range(5)}
+    # 이어받은 3개 중 2개가 종료하여 삭제되고 새로 4개 추가, 현재 5개 -> 퇴출 0
+    stats = stats_with(inserted=4, deleted=2)
+    with patch("src.bpf.stats.BPF_PROCESS_MAP_CAPACITY"), \
+            patch("src.bpf.stats.BPF_PROCESS_MAP_ENTRIES"), \
+            patch("src.bpf.stats.BPF_PROCESS_MAP_EVICTIONS") as evictions:
+        scraper = ProcessMapScraper(entries, stats, capacity=8, inherited=3)
+        assert scraper.evictions(len(entries)) == 0
+        stats.values[STAT_NAMES.index("process_inserted")] = [6]
+        scraper()
+        evictions.inc.assert_called_once_with(2)
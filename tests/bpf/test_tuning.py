@@ -0,0 +1,76 @@
+import json
+import pytest
+
+from src.bpf.tuning import BufferUsage, PerfBufferTuner, next_power_of_two
+
+
+@pytest.fixture
+def tuner(tmp_path):
+    """테스트용 튜너 (최대 256 페이지, 목표 유실률 0.1%)"""
+    return PerfBufferTuner(
+        state_path=str(tmp_path / "state" / "perf_buffer.json"),
+        base_page_cnt=8,
+        max_page_cnt=256,
+        target_loss_rate=0.001,
+    )
+
+
+@pytest.mark.parametrize("value, expected", [
+    (1, 1), (2, 2), (3, 4), (8, 8), (9, 16), (1000, 1024),
+])
+def test_next_power_of_two(value, expected):
+    """2의 거듭제곱 올림 테스트"""
+    assert next_power_of_two(value) == expected
+
+
+def test_loss_rate():
+    """유실률 계산 테스트"""
+    assert BufferUsage(page_cnt=8, received=0, lost=0).loss_rate == 0.0
+    assert BufferUsage(page_cnt=8, received=900, lost=100).loss_rate == pytest.approx(0.1)
+
+
+def test_recommend_keeps_size_below_target(tuner):
+    """목표 유실률 이하이면 크기 유지"""
+    usage = BufferUsage(page_cnt=16, received=100000, lost=50)
+    assert tuner.recommend(usage) == 16
+
+
+def test_recommend_at_least_doubles(tuner):
+    """유실이 적더라도 목표 초과 시 최소 두 배"""
+    usage = BufferUsage(page_cnt=8, received=1000, lost=10)
+    assert tuner.recommend(usage) == 16
+
+
+def test_recommend_scales_with_loss(tuner):
+    """유실분을 수용할 만큼 크기 확대"""
+    # 수신 1000, 유실 3000 -> 4배
+    usage = BufferUsage(page_cnt=8, received=1000, lost=3000)
+    assert tuner.recommend(usage) == 32
+
+
+def test_recommend_clamped_to_max(tuner):
+    """최대 페이지 수를 넘지 않음"""
+    usage = BufferUsage(page_cnt=128, received=10, lost=100000)
+    assert tuner.recommend(usage) == 256
+
+
+def test_page_cnt_without_state(tuner):
+    """상태 파일이 없으면 기본 크기 사용"""
+    assert tuner.page_cnt() == 8
+
+
+def test_save_and_resize_on_restart(tuner):
+    """저장된 유실률에 따라 다음 실행 크기 결정"""
+    tuner.save(BufferUsage(page_cnt=8, received=1000, lost=1000))
+
+    with open(tuner.state_path) as f:
+        assert json.load(f) == {"page_cnt": 8, "received": 1000, "lost": 1000}
+    assert tuner.page_cnt() == 16
+
+
+def test_page_cnt_with_corrupted_state(tuner, tmp_path):
+    """손상된 상태 파일은 무시"""
+    state = tmp_path / "state"
+    state.mkdir()
+    (state / "perf_buffer.json").write_text("not json")
+    assert tuner.page_cnt() == 8
@@ -0,0 +1,70 @@
+import asyncio
+import pytest
+
+from src.bpf.event import RawBpfEvent
+from src.events.lanes import LanePool, LaneQueue, lane_of
+from src.events.queue import POLICY_DROP_OLDEST
+
+
+def make_event(pid, hostname):
+    return RawBpfEvent(
+        pid=pid,
+        binary_path="/home/coder/project/hw1/main",
+        cwd="/home/coder/project/hw1",
+        args="",
+        error_flags="0b0",
+        exit_code=0,
+        hostname=hostname,
+    )
+
+
+def test_lane_of_is_stable():
+    """같은 호스트네임은 항상 같은 레인"""
+    host = "jcode-os-1-202012180-hash"
+    assert lane_of(host, 8) == lane_of(host, 8)
+    assert 0 <= lane_of(host, 8) < 8
+
+
+def test_invalid_lane_count():
+    with pytest.raises(ValueError):
+        LaneQueue(0, 100)
+
+
+def test_hot_lane_drops_only_its_own_events():
+    """한 학생의 이벤트가 몰려도 다른 레인의 이벤트는 버리지 않음"""
+    hot = "jcode-os-1-hot"
+    cold = next(host for host in (f"jcode-os-1-{i}" for i in range(100))
+                if lane_of(host, 2) != lane_of(hot, 2))
+    queue = LaneQueue(2, 4, POLICY_DROP_OLDEST)
+
+    assert queue.put_nowait(make_event(1, cold))
+    for pid in range(10, 20):
+        queue.put_nowait(make_event(pid, hot))
+
+    assert queue.lane(make_event(0, hot)).qsize() == 2
+    assert queue.lane(make_event(0, cold)).qsize() == 1
+    assert queue.qsize() == 3
+
+
+async def test_keeps_order_per_hostname():
+    """같은 호스트네임의 이벤트는 처리 지연과 무관하게 들어온 순서대로 처리"""
+    hosts = [f"jcode-os-1-{i}" for i in range(6)]
+    queue = LaneQueue(3, 0)
+    handled = {host: [] for host in hosts}
+
+    async def handle(event):
+        # 먼저 들어온 이벤트일수록 오래 걸리도록 하여 병렬이면 순서가 뒤바뀜
+        await asyncio.sleep(0.001 * (10 - event.pid % 10))
+        handled[event.hostname].append(event.pid)
+
+    for pid in range(10):
+        for host in hosts:
+            queue.put_nowait(make_event(pid, host))
+    pool = LanePool(queue, handle)
+    task = asyncio.create_task(pool.run())
+    await queue.join()
+    pool.stop()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert pool.size == 3
+    assert all(pids == list(range(10)) for pids in handled.values())
@@ -0,0 +1,87 @@
+import pytest
+
+from src.bpf.event import RawBpfEvent
+from src.events.queue import (
+    KIND_BUILD, KIND_RUN, POLICY_DROP_NEWEST, POLICY_DROP_OLDEST, POLICY_DROP_RUN_FIRST,
+    EventQueue, compiler_classifier
+)
+
+GCC = "/usr/bin/x86_64-linux-gnu-gcc-13"
+classify = compiler_classifier([GCC])
+
+
+def make_event(pid, binary_path="/home/coder/project/hw1/main"):
+    return RawBpfEvent(
+        pid=pid,
+        binary_path=binary_path,
+        cwd="/home/coder/project/hw1",
+        args="",
+        error_flags="0b0",
+        exit_code=0,
+        hostname="jcode-os-1-202012180-hash",
+    )
+
+
+def drain(queue):
+    pids = []
+    while not queue.empty():
+        pids.append(queue.get_nowait().pid)
+        queue.task_done()
+    return pids
+
+
+def test_classifier():
+    assert classify(make_event(1, GCC)) == KIND_BUILD
+    assert classify(make_event(1)) == KIND_RUN
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError):
+        EventQueue(10, "drop_random")
+
+
+def test_keeps_arrival_order_across_kinds():
+    """종류별로 따로 보관해도 도착 순서대로 꺼냄"""
+    queue = EventQueue(10, classify=classify)
+    for pid, path in ((1, GCC), (2, "/a.out"), (3, GCC), (4, "/a.out")):
+        queue.put_nowait(make_event(pid, path))
+    assert queue.qsize() == 4
+    assert drain(queue) == [1, 2, 3, 4]
+
+
+def test_drop_oldest():
+    queue = EventQueue(2, POLICY_DROP_OLDEST, classify)
+    for pid in (1, 2, 3):
+        assert queue.put_nowait(make_event(pid))
+    assert drain(queue) == [2, 3]
+
+
+def test_drop_newest():
+    queue = EventQueue(2, POLICY_DROP_NEWEST, classify)
+    results = [queue.put_nowait(make_event(pid)) for pid in (1, 2, 3)]
+    assert results == [True, True, False]
+    assert drain(queue) == [1, 2]
+
+
+def test_drop_run_first():
+    """실행 이벤트부터 버리고, 빌드 이벤트만 남으면 새 실행 이벤트를 버림"""
+    queue = EventQueue(2, POLICY_DROP_RUN_FIRST, classify)
+    queue.put_nowait(make_event(1, GCC))
+    queue.put_nowait(make_event(2))
+    # 큐의 실행 이벤트(2)를 버리고 새 빌드 이벤트를 넣음
+    assert queue.put_nowait(make_event(3, GCC))
+    # 빌드 이벤트만 남았으므로 새 실행 이벤트는 버림
+    assert not queue.put_nowait(make_event(4))
+    # 새 빌드 이벤트는 가장 오래된 빌드 이벤트를 밀어냄
+    assert queue.put_nowait(make_event(5, GCC))
+    assert drain(queue) == [3, 5]
+
+
+async def test_join_not_blocked_by_dropped_events():
+    """버린 이벤트 때문에 join()이 멈추지 않음"""
+    queue = EventQueue(1, POLICY_DROP_OLDEST, classify)
+    queue.put_nowait(make_event(1))
+    queue.put_nowait(make_event(2))
+    assert (await queue.get()).pid == 2
+    queue.task_done()
+    await queue.join()
@@ -0,0 +1,116 @@
+import asyncio
+
+from src.bpf.event import RawBpfEvent
+from src.events.queue import EventQueue
+from src.events.spool import EventSpool
+from src.events.workers import WorkerPool
+
+
+def make_event(pid, **kwargs):
+    return RawBpfEvent(
+        pid=pid,
+        binary_path="/usr/bin/x86_64-linux-gnu-gcc-13",
+        cwd="/home/coder/project/hw1",
+        args="gcc -o main main.c",
+        error_flags="0b0",
+        exit_code=0,
+        hostname="jcode-os-1-202012180-hash",
+        **kwargs,
+    )
+
+
+def test_write_and_replay(tmp_path):
+    """저장한 이벤트를 그대로 복구하고 스풀 파일은 삭제"""
+    spool = EventSpool(str(tmp_path / "state" / "spool.jsonl"))
+    events = [make_event(1, exec_ns=10, exit_ns=20), make_event(2, phases_ms={"cc1": 1.5})]
+
+    assert spool.write(events) == 2
+    assert spool.write([make_event(3)]) == 1
+
+    replayed = spool.replay()
+    assert replayed == events + [make_event(3)]
+    assert all(event.replayed for event in replayed)
+    assert not (tmp_path / "state" / "spool.jsonl").exists()
+    assert spool.replay() == []
+
+
+class FixedClock:
+    """보정할 때마다 정해진 실제 시각 - 단조 시각 차이를 돌려주는 시계"""
+    def __init__(self, offset_ns):
+        self.offset_ns = offset_ns
+
+    def calibrate(self):
+        return self.offset_ns
+
+
+def make_spool(tmp_path, boot_id, offset_ns):
+    boot_id_path = tmp_path / "boot_id"
+    boot_id_path.write_text(boot_id + "\n")
+    return EventSpool(str(tmp_path / "spool.jsonl"), FixedClock(offset_ns), str(boot_id_path))
+
+
+def test_replay_converts_stamps_from_previous_boot(tmp_path):
+    """재부팅 후에는 저장 당시 실제 시각이 유지되도록 현재 부팅의 단조 시각으로 변환"""
+    make_spool(tmp_path, "boot-a", 1_000_000).write([make_event(1, exec_ns=100, exit_ns=500)])
+
+    same_boot = make_spool(tmp_path, "boot-a", 1_000_050)
+    assert same_boot.replay()[0].exit_ns == 500
+
+    make_spool(tmp_path, "boot-a", 1_000_000).write([make_event(1, exec_ns=100, exit_ns=500)])
+    rebooted = make_spool(tmp_path, "boot-b", 400_000)
+    event = rebooted.replay()[0]
+    assert (event.exec_ns, event.exit_ns) == (600_100, 600_500)
+    assert event.runtime_ms == make_event(1, exec_ns=100, exit_ns=500).runtime_ms
+
+
+def test_replay_drops_unconvertible_stamps(tmp_path):
+    """시각 차이가 없는 다른 부팅의 레코드는 시각을 버림"""
+    path = tmp_path / "spool.jsonl"
+    path.write_text('{"boot_id": "boot-a", "event": {"pid": 1, "binary_path": "/bin/true", '
+                    '"cwd": "/", "args": "", "error_flags": "0b0", "exit_code": 0, '
+                    '"hostname": "jcode-os-1-202012180-hash", "exit_ns": 500}}\n')
+    event = make_spool(tmp_path, "boot-b", 0).replay()[0]
+    assert (event.pid, event.exec_ns, event.exit_ns) == (1, 0, 0)
+
+
+def test_replay_skips_broken_lines(tmp_path):
+    """읽을 수 없는 줄은 건너뛰고 모르는 필드는 무시"""
+    path = tmp_path / "spool.jsonl"
+    spool = EventSpool(str(path))
+    spool.write([make_event(1)])
+    with open(path, "a") as f:
+        f.write('{"event": {"pid": 2, "truncated\n')
+        f.write('{"event": {"pid": 3}}\n')
+        f.write('{"pid": 4}\n')
+
+    assert [event.pid for event in spool.replay()] == [1]
+
+
+def test_disabled_spool():
+    spool = EventSpool("")
+    assert spool.write([make_event(1)]) == 0
+    assert spool.replay() == []
+
+
+async def test_interrupted_events_are_unsent():
+    """취소된 처리 중 이벤트와 큐에 남은 이벤트를 모두 돌려받음"""
+    queue = EventQueue(0)
+    started = asyncio.Event()
+
+    async def handle(event):
+        if event.pid == 1:
+            return
+        started.set()
+        await asyncio.Event().wait()
+
+    pool = WorkerPool(queue, handle, size=1)
+    for pid in (1, 2, 3):
+        queue.put_nowait(make_event(pid))
+    task = asyncio.create_task(pool.run())
+    await started.wait()
+    pool.stop()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert pool.handled == 1
+    assert [event.pid for event in pool.interrupted + queue.drain()] == [2, 3]
+    assert queue.qsize() == 0
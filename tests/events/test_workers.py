@@ -0,0 +1,84 @@
+import asyncio
+import pytest
+
+from src.events.workers import WorkerPool
+
+
+async def test_concurrency_limited_to_pool_size():
+    """동시에 처리하는 이벤트 수는 워커 수를 넘지 않음"""
+    queue = asyncio.Queue()
+    active = 0
+    peak = 0
+    handled = []
+
+    async def handle(event):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        handled.append(event)
+
+    pool = WorkerPool(queue, handle, size=3)
+    for i in range(10):
+        queue.put_nowait(i)
+    task = asyncio.create_task(pool.run())
+    await queue.join()
+
+    assert sorted(handled) == list(range(10))
+    assert peak == 3
+    pool.stop()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert not pool.running
+
+
+async def test_join_waits_for_inflight_event():
+    """join()은 처리 중인 이벤트가 끝날 때까지 반환하지 않음"""
+    queue = asyncio.Queue()
+    release = asyncio.Event()
+    done = []
+
+    async def handle(event):
+        await release.wait()
+        done.append(event)
+
+    pool = WorkerPool(queue, handle, size=1)
+    task = asyncio.create_task(pool.run())
+    queue.put_nowait("event")
+    join = asyncio.create_task(queue.join())
+    await asyncio.sleep(0.01)
+    assert not join.done()
+
+    release.set()
+    await join
+    assert done == ["event"]
+    pool.stop()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+async def test_handler_error_does_not_stop_pool():
+    """한 이벤트의 예외가 다른 워커를 멈추지 않음"""
+    queue = asyncio.Queue()
+    handled = []
+
+    async def handle(event):
+        if event == "bad":
+            raise RuntimeError("boom")
+        handled.append(event)
+
+    pool = WorkerPool(queue, handle, size=2)
+    task = asyncio.create_task(pool.run())
+    for event in ("bad", "a", "b"):
+        queue.put_nowait(event)
+    await queue.join()
+    assert sorted(handled) == ["a", "b"]
+    pool.stop()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+def test_invalid_size():
+    with pytest.raises(ValueError):
+        WorkerPool(asyncio.Queue(), None, size=0)
@@ -0,0 +1,147 @@
+import pytest
+
+from src.bpf.event import RawBpfEvent
+from src.process.toolchain import ToolchainGrouper, stage_name
+
+GCC = "/usr/bin/x86_64-linux-gnu-gcc-13"
+CLANG = "/usr/lib/llvm-13/bin/clang"
+
+
+def make_event(pid, ppid, binary_path, args="", runtime_ms=10, exec_ns=1_000_000):
+    return RawBpfEvent(
+        pid=pid,
+        binary_path=binary_path,
+        cwd="/home/coder/project/hw1",
+        args=args,
+        error_flags="0b0",
+        exit_code=0,
+        hostname="jcode-os-1-202012180-hash",
+        exec_ns=exec_ns,
+        exit_ns=exec_ns + int(runtime_ms * 1_000_000),
+        ppid=ppid,
+    )
+
+
+@pytest.fixture
+def grouper():
+    return ToolchainGrouper(max_pending=2)
+
+
+def test_stage_name():
+    """시스템 경로의 하위 단계와 clang -cc1만 하위 단계로 판정"""
+    assert stage_name(make_event(2, 1, "/usr/lib/gcc/x86_64-linux-gnu/13/cc1")) == "cc1"
+    assert stage_name(make_event(2, 1, "/usr/bin/as")) == "as"
+    assert stage_name(make_event(2, 1, "/usr/lib/gcc/x86_64-linux-gnu/13/lto-wrapper")) == "lto-wrapper"
+    assert stage_name(make_event(2, 1, GCC)) is None
+    assert stage_name(make_event(2, 1, "/usr/bin/x86_64-linux-gnu-g++-13")) is None
+    assert stage_name(make_event(2, 1, CLANG, "clang -cc1 -triple x86_64")) == "cc1"
+    assert stage_name(make_event(2, 1, CLANG, "clang -o main main.c")) is None
+    assert stage_name(make_event(2, 1, "/home/coder/project/hw1/as")) is None
+
+
+def test_gcc_pipeline_folded_into_driver(grouper):
+    """cc1, as, collect2 -> ld를 gcc 이벤트의 단계별 시간으로 합침"""
+    batch = [
+        make_event(11, 10, "/usr/lib/gcc/x86_64-linux-gnu/13/cc1", runtime_ms=30),
+        make_event(12, 10, "/usr/bin/as", runtime_ms=5),
+        make_event(14, 13, "/usr/bin/ld", runtime_ms=8),
+        make_event(13, 10, "/usr/lib/gcc/x86_64-linux-gnu/13/collect2", runtime_ms=9),
+        make_event(10, 1, GCC, "gcc -o main main.c", runtime_ms=60),
+    ]
+    result = grouper.group(batch)
+
+    assert [e.pid for e in result] == [10]
+    assert result[0].phases_ms == {"cc1": 30.0, "as": 5.0, "ld": 8.0, "collect2": 9.0}
+    assert len(grouper) == 0
+
+
+def test_driver_read_before_stages(grouper):
+    """같은 배치 안에서 드라이버가 먼저 읽혀도 합침"""
+    batch = [
+        make_event(10, 1, GCC, "gcc -c main.c"),
+        make_event(11, 10, "/usr/lib/gcc/x86_64-linux-gnu/13/cc1", runtime_ms=20),
+        make_event(12, 10, "/usr/lib/gcc/x86_64-linux-gnu/13/cc1", runtime_ms=15),
+    ]
+    result = grouper.group(batch)
+    assert result[0].phases_ms == {"cc1": 35.0}
+
+
+def test_stages_across_batches(grouper):
+    """하위 단계와 드라이버가 다른 배치로 와도 합침"""
+    assert grouper.group([make_event(11, 10, "/usr/bin/as", runtime_ms=3)]) == []
+    result = grouper.group([make_event(10, 1, GCC)])
+    assert result[0].phases_ms == {"as": 3.0}
+
+
+def test_other_events_pass_through(grouper):
+    """하위 단계가 아닌 이벤트는 그대로 전달"""
+    event = make_event(20, 1, "/home/coder/project/hw1/main")
+    assert grouper.group([event]) == [event]
+    assert event.phases_ms == {}
+
+
+def test_pending_bounded(grouper):
+    """드라이버를 받지 못한 묶음은 오래된 것부터 버림"""
+    for ppid in (10, 20, 30):
+        grouper.group([make_event(ppid + 1, ppid, "/usr/bin/as")])
+    assert len(grouper) == 2
+    assert grouper.group([make_event(10, 1, GCC)])[0].phases_ms == {}
+
+
+def test_nested_stage_read_after_its_parent(grouper):
+    """ld가 collect2보다 늦게 읽혀도 드라이버에 합침"""
+    batch = [
+        make_event(13, 10, "/usr/lib/gcc/x86_64-linux-gnu/13/collect2", runtime_ms=9),
+        make_event(14, 13, "/usr/bin/ld", runtime_ms=8),
+        make_event(10, 1, GCC, "gcc -o main main.c", runtime_ms=60),
+    ]
+    result = grouper.group(batch)
+    assert result[0].phases_ms == {"collect2": 9.0, "ld": 8.0}
+    assert len(grouper) == 0
+
+
+def test_stale_bucket_not_attached_after_pid_reuse(grouper):
+    """exec 이전에 종료한 단계는 PID를 재사용한 프로세스에 붙이지 않음"""
+    grouper.group([make_event(11, 10, "/usr/bin/as", runtime_ms=3)])
+    later = make_event(10, 1, "/home/coder/project/hw1/main", exec_ns=5_000_000_000)
+    assert grouper.group([later]) == [later]
+    assert len(grouper) == 0
+
+
+def test_pending_expires_after_ttl():
+    """드라이버 종료 없이 ttl이 지난 묶음은 만료"""
+    now = [0]
+    grouper = ToolchainGrouper(max_pending=10, ttl_sec=60, monotonic_ns=lambda: now[0])
+    grouper.group([make_event(11, 10, "/usr/bin/as")])
+    now[0] = 30 * 10**9
+    grouper.group([make_event(21, 20, "/usr/bin/as")])
+    assert len(grouper) == 2
+    now[0] = 61 * 10**9
+    grouper.group([])
+    assert len(grouper) == 1
+
+
+def test_stage_name_resolves_ubuntu_binutils():
+    """Ubuntu에서 /usr/bin/as, /usr/bin/ld가 가리키는 실제 파일 이름을 인식"""
+    assert stage_name(make_event(2, 1, "/usr/bin/x86_64-linux-gnu-as")) == "as"
+    assert stage_name(make_event(2, 1, "/usr/bin/x86_64-linux-gnu-ld.bfd")) == "ld"
+    assert stage_name(make_event(2, 1, "/usr/bin/x86_64-linux-gnu-ld.gold")) == "ld"
+    assert stage_name(make_event(2, 1, "/usr/bin/aarch64-linux-gnu-ld")) == "ld"
+    assert stage_name(make_event(2, 1, "/usr/bin/ld.lld")) == "ld"
+    assert stage_name(make_event(2, 1, "/usr/bin/x86_64-pc-linux-gnu-lto-wrapper")) == "lto-wrapper"
+    # triplet이 아닌 접두어는 하위 단계가 아님
+    assert stage_name(make_event(2, 1, "/usr/bin/git-as")) is None
+
+
+def test_ubuntu_gcc_pipeline_folded(grouper):
+    """실제 Ubuntu 경로의 cc1, as, collect2 -> ld.bfd를 gcc 이벤트에 합침"""
+    batch = [
+        make_event(11, 10, "/usr/libexec/gcc/x86_64-linux-gnu/13/cc1", runtime_ms=30),
+        make_event(12, 10, "/usr/bin/x86_64-linux-gnu-as", runtime_ms=5),
+        make_event(14, 13, "/usr/bin/x86_64-linux-gnu-ld.bfd", runtime_ms=8),
+        make_event(13, 10, "/usr/libexec/gcc/x86_64-linux-gnu/13/collect2", runtime_ms=9),
+        make_event(10, 1, GCC, "gcc -o main main.c", runtime_ms=60),
+    ]
+    result = grouper.group(batch)
+    assert [e.pid for e in result] == [10]
+    assert result[0].phases_ms == {"cc1": 30.0, "as": 5.0, "ld": 8.0, "collect2": 9.0}
@@ -0,0 +1,67 @@
+import pytest
+
+from src.process.tracker import InflightTracker
+
+
+@pytest.fixture
+def tracker():
+    """임계 60초, 최대 3개, 만료 600초"""
+    return InflightTracker(threshold_sec=60, max_entries=3, ttl_sec=600)
+
+
+def test_finish_removes_process(tracker):
+    """종료 이벤트를 받으면 추적 목록에서 제거"""
+    tracker.start(1, "jcode-os-1-202012180-hash", "/home/coder/project/hw1/a.out", now=0)
+    assert 1 in tracker
+
+    proc = tracker.finish(1, now=5)
+    assert proc.binary_path == "/home/coder/project/hw1/a.out"
+    assert 1 not in tracker
+    assert tracker.finish(1) is None
+
+
+def test_long_running_reported_once(tracker):
+    """임계 시간을 넘긴 프로세스는 한 번만 보고"""
+    tracker.start(1, "host", "/a.out", now=0)
+    tracker.start(2, "host", "/b.out", now=50)
+
+    assert tracker.check(now=30) == []
+    assert [p.pid for p in tracker.check(now=70)] == [1]
+    assert tracker.check(now=80) == []
+    assert [p.pid for p in tracker.check(now=120)] == [2]
+
+    # 보고된 프로세스의 종료도 정상적으로 대조
+    assert tracker.finish(1, now=200).reported
+
+
+def test_reexec_restarts_clock(tracker):
+    """같은 PID의 재exec는 시작 시각을 새로 기록"""
+    tracker.start(1, "host", "/bin/sh", now=0)
+    tracker.start(1, "host", "/a.out", now=50)
+    assert tracker.check(now=70) == []
+    assert len(tracker) == 1
+
+
+def test_capacity_drops_oldest(tracker):
+    """최대 항목 수를 넘으면 가장 오래된 항목부터 버림"""
+    for pid in range(5):
+        tracker.start(pid, "host", "/a.out", now=pid)
+    assert len(tracker) == 3
+    assert 0 not in tracker and 1 not in tracker
+
+
+def test_ttl_expires_entries(tracker):
+    """종료 이벤트를 받지 못한 항목은 만료 시간 후 제거"""
+    tracker.start(1, "host", "/a.out", now=0)
+    tracker.start(2, "host", "/b.out", now=500)
+    tracker.check(now=100)
+    tracker.check(now=700)
+    assert 1 not in tracker
+    assert 2 in tracker
+
+
+def test_start_uses_kernel_exec_time(tracker):
+    """도착 시각이 아니라 커널 exec 시각으로 실행 시간 계산"""
+    # 100초 늦게 도착한 exec 알림
+    tracker.start(1, "host", "/a.out", exec_ns=10 * 10**9, now=110)
+    assert [p.pid for p in tracker.check(now=75)] == [1]
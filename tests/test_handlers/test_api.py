@@ -1,5 +1,6 @@
+import dataclasses
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 from src.process.types import ProcessType
 from src.handlers.api import APIHandler
 from src.events.models import EventBuilder, ProcessTypeInfo, EventMetadata, HomeworkInfo
@@ -55,4 +56,16 @@ async def test_handle_python_execution(handler, python_builder):
     handler.client.send_python_execution.assert_awaited_once()  # 파이썬 실행 메서드가 호출되었는지 확인
     args = handler.client.send_python_execution.call_args[0][0]
     assert args.process.type == ProcessType.PYTHON
-    assert args.homework.source_file.endswith('solution.py') 
\ No newline at end of file
+    assert args.homework.source_file.endswith('solution.py') 
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("replayed, observed", [(False, 1), (True, 0)])
+async def test_e2e_latency_skips_replayed_events(handler, python_builder, replayed, observed):
+    """스풀에서 복구한 이벤트는 종료 시각 기준 지연을 기록하지 않음"""
+    python_builder.base = dataclasses.replace(python_builder.base, exit_ns=1, replayed=replayed)
+    handler.client.send_python_execution = AsyncMock(return_value=True)
+
+    with patch("src.handlers.api.EVENT_E2E_LATENCY") as latency:
+        assert await handler.handle(python_builder) is python_builder
+    assert latency.observe.call_count == observed
@@ -1,3 +1,5 @@
+import dataclasses
+import time
 import pytest
 from datetime import datetime, timezone
 from unittest.mock import Mock, AsyncMock
@@ -127,6 +129,24 @@ async def test_handle_success(handler, event_builder):
     # 다음 핸들러 호출 확인
     next_handler.handle.assert_awaited_once_with(event_builder)
 
+@pytest.mark.asyncio
+async def test_handle_uses_kernel_exit_time(handler, raw_event):
+    """커널 종료 시각이 있으면 수신 시각 대신 사용합니다."""
+    # Given
+    exit_ns = time.monotonic_ns() - 30 * 10**9  # 30초 전에 종료
+    builder = EventBuilder(dataclasses.replace(raw_event, exit_ns=exit_ns))
+    builder.process = ProcessTypeInfo(type=ProcessType.GCC)
+    next_handler = Mock()
+    next_handler.handle = AsyncMock(return_value=builder)
+    handler.set_next(next_handler)
+
+    # When
+    result = await handler.handle(builder)
+
+    # Then
+    lag = (datetime.now(timezone.utc) - result.metadata.timestamp).total_seconds()
+    assert 29 < lag < 31
+
 @pytest.mark.asyncio
 async def test_handle_invalid_hostname(handler, invalid_event_builder):
     """잘못된 호스트네임으로 인한 처리 실패를 테스트합니다."""
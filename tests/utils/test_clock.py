@@ -0,0 +1,54 @@
+from datetime import datetime, timezone
+
+from src.utils.clock import MonotonicClock
+
+
+class FakeClock:
+    """단조 시각과 실제 시각을 직접 조정하는 시계"""
+    def __init__(self, monotonic_ns, offset_ns):
+        self.now = monotonic_ns
+        self.offset_ns = offset_ns
+
+    def monotonic_ns(self):
+        self.now += 10  # 읽을 때마다 조금씩 흐름
+        return self.now
+
+    def time_ns(self):
+        return self.now + self.offset_ns
+
+
+def make_clock(fake, recalibrate_sec=60.0):
+    return MonotonicClock(recalibrate_sec, fake.monotonic_ns, fake.time_ns)
+
+
+def test_to_datetime_applies_offset():
+    """단조 시각에 측정한 차이를 더해 실제 시각으로 변환"""
+    boot = 1_700_000_000 * 10**9
+    fake = FakeClock(monotonic_ns=5 * 10**9, offset_ns=boot)
+    clock = make_clock(fake)
+
+    assert abs(clock.offset_ns - boot) <= 10
+    result = clock.to_datetime(6 * 10**9)
+    assert result.tzinfo == timezone.utc
+    expected = datetime.fromtimestamp(1_700_000_006, timezone.utc)
+    assert abs((result - expected).total_seconds()) < 1e-6
+
+
+def test_recalibrates_after_interval():
+    """보정 주기가 지나면 차이를 다시 측정 (NTP 보정 반영)"""
+    fake = FakeClock(monotonic_ns=0, offset_ns=1000 * 10**9)
+    clock = make_clock(fake, recalibrate_sec=1.0)
+
+    fake.offset_ns += 5 * 10**9
+    clock.to_datetime(fake.now)
+    assert abs(clock.offset_ns - 1000 * 10**9) <= 10
+
+    fake.now += 2 * 10**9
+    clock.to_datetime(fake.now)
+    assert abs(clock.offset_ns - 1005 * 10**9) <= 10
+
+
+def test_elapsed_sec():
+    fake = FakeClock(monotonic_ns=10 * 10**9, offset_ns=0)
+    clock = make_clock(fake)
+    assert 4.9 < clock.elapsed_sec(5 * 10**9) < 5.1
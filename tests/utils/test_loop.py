@@ -0,0 +1,27 @@
+import asyncio
+import sys
+
+import pytest
+
+from src.utils.loop import LOOP_ASYNCIO, LOOP_UVLOOP, loop_factory, run
+
+
+async def loop_type():
+    return type(asyncio.get_running_loop())
+
+
+def test_default_loop():
+    assert loop_factory(LOOP_ASYNCIO) is None
+    assert issubclass(run(loop_type()), asyncio.BaseEventLoop)
+
+
+def test_unknown_loop():
+    with pytest.raises(ValueError):
+        loop_factory("trio")
+
+
+def test_uvloop_falls_back_when_missing(monkeypatch):
+    """uvloop를 불러올 수 없으면 기본 루프 사용"""
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+    assert loop_factory(LOOP_UVLOOP) is None
+    assert run(loop_type(), LOOP_UVLOOP).__module__.startswith("asyncio")